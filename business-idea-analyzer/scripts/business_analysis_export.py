@@ -5,6 +5,10 @@ Business Analysis Export -- Generate MD, PDF, and HTML from business idea analys
 Usage:
     python3 business_analysis_export.py --input /tmp/business_analysis_export.json
     python3 business_analysis_export.py --input data.json --output-dir /custom/path/
+    python3 business_analysis_export.py --input data.json --formats html   # skip the PDF backend
+    python3 business_analysis_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 business_analysis_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 business_analysis_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 
 Input: JSON payload from report-synthesizer agent
 Output: .html, .pdf, .md in {output_dir}/Business_Analysis/ folder
@@ -13,18 +17,26 @@ Output: .html, .pdf, .md in {output_dir}/Business_Analysis/ folder
 import argparse
 import json
 import os
-import re
 import sys
 from datetime import date
+from functools import lru_cache
 
-# Use venv packages
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.tables import Cell, draw_table
+from rok_export.text import escape_html, slugify
 
 # -- Constants ----------------------------------------------------------------
 
@@ -78,14 +90,6 @@ DIMENSION_NAMES = {
 
 # -- Helpers ------------------------------------------------------------------
 
-def slugify(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^\w\s-]", "", s)
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"-+", "-", s)
-    return s[:60].strip("-") or "untitled"
-
-
 def compute_paths(data: dict, output_dir: str):
     idea = slugify(data.get("idea_description", "business-idea"))
     d = data.get("date", date.today().isoformat())
@@ -102,26 +106,8 @@ def compute_paths(data: dict, output_dir: str):
     }
 
 
-def escape_html(s: str) -> str:
-    return (str(s).replace("&", "&amp;")
-                  .replace("<", "&lt;")
-                  .replace(">", "&gt;")
-                  .replace('"', "&quot;"))
-
-
-def latin_safe(s: str) -> str:
-    replacements = {
-        "\u2014": "--", "\u2013": "-", "\u2018": "'", "\u2019": "'",
-        "\u201c": '"', "\u201d": '"', "\u2026": "...", "\u2022": "*",
-        "\u00a0": " ", "\u200b": "", "\u2713": "[x]", "\u2717": "[ ]",
-    }
-    for char, repl in replacements.items():
-        s = s.replace(char, repl)
-    return s.encode("latin-1", errors="replace").decode("latin-1")
-
-
 def truncate(s: str, max_len: int = 60) -> str:
-    s = latin_safe(str(s)) if s else ""
+    s = str(s) if s else ""
     return s[:max_len - 3] + "..." if len(s) > max_len else s
 
 
@@ -479,33 +465,45 @@ def generate_html(data: dict, output_path: str):
 
 # -- PDF Generation -----------------------------------------------------------
 
-class BusinessAnalysisPDF(FPDF):
-    def __init__(self, data: dict):
-        super().__init__(orientation="P", unit="mm", format="Letter")
-        self.data = data
-        self.set_auto_page_break(auto=True, margin=20)
-
-    def header(self):
-        self.set_font("Helvetica", "B", 16)
-        self.set_text_color(*TEAL_RGB)
-        self.cell(0, 8, "BUSINESS IDEA ANALYSIS", new_x="LMARGIN", new_y="NEXT")
-        self.set_font("Helvetica", "", 11)
-        self.set_text_color(120, 120, 120)
-        idea = latin_safe(self.data.get("idea_description", ""))
-        self.cell(0, 6, truncate(idea, 80), new_x="LMARGIN", new_y="NEXT")
-        self.set_font("Helvetica", "", 9)
-        d = self.data.get("date", "")
-        depth = self.data.get("depth", "standard")
-        profile = self.data.get("operator_profile", "solopreneur")
-        self.cell(0, 5, f"{d}  |  Depth: {depth}  |  Profile: {profile}", new_x="LMARGIN", new_y="NEXT")
-        self.line(self.l_margin, self.get_y() + 1, self.w - self.r_margin, self.get_y() + 1)
-        self.ln(4)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Helvetica", "I", 7)
-        self.set_text_color(150, 150, 150)
-        self.cell(0, 10, f"Generated by Claude Code  |  Business Idea Analyzer  |  Page {self.page_no()}/{{nb}}", align="C")
+@lru_cache(maxsize=None)
+def _pdf_class():
+    """Define BusinessAnalysisPDF on first use so fpdf is only imported when a PDF is requested."""
+    from rok_export.pdf import ReportPDF
+
+    class BusinessAnalysisPDF(ReportPDF):
+        def __init__(self, data: dict):
+            super().__init__(orientation="P", unit="mm", format="Letter")
+            self.data = data
+            self.set_auto_page_break(auto=True, margin=20)
+
+        def header(self):
+            self.set_font("Helvetica", "B", 16)
+            self.set_text_color(*TEAL_RGB)
+            self.cell(0, 8, "BUSINESS IDEA ANALYSIS", new_x="LMARGIN", new_y="NEXT")
+            self.set_font("Helvetica", "", 11)
+            self.set_text_color(120, 120, 120)
+            idea = self.data.get("idea_description", "")
+            self.cell(0, 6, truncate(idea, 80), new_x="LMARGIN", new_y="NEXT")
+            self.set_font("Helvetica", "", 9)
+            d = self.data.get("date", "")
+            depth = self.data.get("depth", "standard")
+            profile = self.data.get("operator_profile", "solopreneur")
+            self.cell(0, 5, f"{d}  |  Depth: {depth}  |  Profile: {profile}", new_x="LMARGIN", new_y="NEXT")
+            self.line(self.l_margin, self.get_y() + 1, self.w - self.r_margin, self.get_y() + 1)
+            self.ln(4)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 7)
+            self.set_text_color(150, 150, 150)
+            self.cell(0, 10, f"Generated by Claude Code  |  Business Idea Analyzer  |  Page {self.page_no()}/{{nb}}", align="C")
+
+    return BusinessAnalysisPDF
+
+
+# Body rows for rok_export.tables, matching _pdf_table_header
+_PDF_TABLE_STYLE = {"header_height": 6, "min_height": 5.5, "text_color": (60, 60, 60),
+                    "fills": ((248, 250, 252), (255, 255, 255))}
 
 
 def _pdf_check_page_break(pdf, min_space_mm=35):
@@ -519,7 +517,7 @@ def _pdf_section_header(pdf, title):
     _pdf_check_page_break(pdf, 30)
     pdf.set_text_color(*TEAL_RGB)
     pdf.set_font("Helvetica", "B", 12)
-    pdf.cell(0, 8, latin_safe(title), new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 8, title, new_x="LMARGIN", new_y="NEXT")
     pdf.set_draw_color(226, 232, 240)
     pdf.line(pdf.l_margin, pdf.get_y(), pdf.w - pdf.r_margin, pdf.get_y())
     pdf.ln(3)
@@ -530,7 +528,7 @@ def _pdf_table_header(pdf, headers, widths):
     pdf.set_fill_color(*TEAL_RGB)
     pdf.set_text_color(255, 255, 255)
     for i, h in enumerate(headers):
-        pdf.cell(widths[i], 6, latin_safe(h), border=1, fill=True, align="C")
+        pdf.cell(widths[i], 6, h, border=1, fill=True, align="C")
     pdf.ln()
 
 
@@ -619,7 +617,7 @@ def _pdf_tam_cards(pdf, tam):
         pdf.set_text_color(100, 116, 139)
         pdf.cell(card_w, 3, TAM_DEFINITIONS.get(label, ""), align="C")
         # Value - auto-size font for long values
-        val = latin_safe(tam.get(key, "N/A"))
+        val = tam.get(key, "N/A")
         font_size = 10
         pdf.set_font("Helvetica", "B", font_size)
         while pdf.get_string_width(val) > card_w - 4 and font_size > 6:
@@ -633,6 +631,7 @@ def _pdf_tam_cards(pdf, tam):
 
 
 def generate_pdf(data: dict, output_path: str):
+    BusinessAnalysisPDF = _pdf_class()
     pdf = BusinessAnalysisPDF(data)
     pdf.alias_nb_pages()
     pdf.add_page()
@@ -666,7 +665,7 @@ def generate_pdf(data: dict, output_path: str):
         # Subtitle
         pdf.set_font("Helvetica", "", 9)
         pdf.set_text_color(100, 116, 139)
-        pdf.cell(0, 5, latin_safe(f"Top Opportunity: {top.get('name', '')}  |  MVP: {top.get('mvp_timeline', 'TBD')}  |  Pricing: {top.get('recommended_pricing', 'TBD')}"), align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 5, f"Top Opportunity: {top.get('name', '')}  |  MVP: {top.get('mvp_timeline', 'TBD')}  |  Pricing: {top.get('recommended_pricing', 'TBD')}", align="C", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(6)
 
     # -- Opportunity Rankings Table --
@@ -738,7 +737,7 @@ def generate_pdf(data: dict, output_path: str):
 
         for idx, dim in enumerate(top.get("dimensions", [])):
             ds = dim.get("score", 0)
-            dn = latin_safe(dim.get("name", ""))
+            dn = dim.get("name", "")
             wt = dim.get("weight", 0)
 
             if idx % 2 == 0:
@@ -799,12 +798,12 @@ def generate_pdf(data: dict, output_path: str):
             if findings:
                 pdf.set_text_color(*TEAL_RGB)
                 pdf.set_font("Helvetica", "B", 9)
-                pdf.cell(0, 5, latin_safe(dim.get("name", "")), new_x="LMARGIN", new_y="NEXT")
+                pdf.cell(0, 5, dim.get("name", ""), new_x="LMARGIN", new_y="NEXT")
                 pdf.set_font("Helvetica", "", 8)
                 pdf.set_text_color(60, 60, 60)
                 for f in findings:
                     pdf.set_x(pdf.l_margin + 4)
-                    pdf.multi_cell(0, 4, latin_safe(f"- {f}"))
+                    pdf.multi_cell(0, 4, f"- {f}")
                 pdf.ln(1)
         pdf.ln(2)
 
@@ -831,12 +830,12 @@ def generate_pdf(data: dict, output_path: str):
                 pdf.set_font("Helvetica", "", 8)
                 pdf.set_text_color(60, 60, 60)
                 pdf.cell(3, 5, "")
-                pdf.multi_cell(0, 5, latin_safe(r.get("risk", "")))
+                pdf.multi_cell(0, 5, r.get("risk", ""))
                 if r.get("mitigation"):
                     pdf.set_font("Helvetica", "I", 7)
                     pdf.set_text_color(100, 116, 139)
                     pdf.set_x(pdf.l_margin + tag_w + 3)
-                    pdf.multi_cell(0, 4, latin_safe(f"Mitigation: {r.get('mitigation', '')}"))
+                    pdf.multi_cell(0, 4, f"Mitigation: {r.get('mitigation', '')}")
                 pdf.set_text_color(60, 60, 60)
                 pdf.ln(2)
             pdf.ln(2)
@@ -853,7 +852,7 @@ def generate_pdf(data: dict, output_path: str):
             for kc in kcs:
                 status = kc.get("status", "unverified")
                 icon = "[x]" if status != "unverified" else "[ ]"
-                pdf.multi_cell(0, 4.5, latin_safe(f"  {icon} {kc.get('assumption', '')} -- Kill if: {kc.get('kill_condition', '')}"))
+                pdf.multi_cell(0, 4.5, f"  {icon} {kc.get('assumption', '')} -- Kill if: {kc.get('kill_condition', '')}")
                 pdf.ln(1)
             pdf.ln(2)
 
@@ -864,7 +863,7 @@ def generate_pdf(data: dict, output_path: str):
             pdf.set_font("Helvetica", "", 9)
             pdf.set_text_color(40, 40, 40)
             for i, step in enumerate(steps, 1):
-                pdf.multi_cell(0, 5, latin_safe(f"  {i}. {step}"))
+                pdf.multi_cell(0, 5, f"  {i}. {step}")
                 pdf.ln(1)
             pdf.ln(2)
 
@@ -872,7 +871,7 @@ def generate_pdf(data: dict, output_path: str):
     _pdf_section_header(pdf, "Executive Summary")
     pdf.set_font("Helvetica", "", 9)
     pdf.set_text_color(40, 40, 40)
-    pdf.multi_cell(0, 5, latin_safe(data.get("executive_summary", "")))
+    pdf.multi_cell(0, 5, data.get("executive_summary", ""))
     pdf.ln(4)
 
     # -- Competitors --
@@ -882,53 +881,10 @@ def generate_pdf(data: dict, output_path: str):
         usable = pdf.w - pdf.l_margin - pdf.r_margin
         c_widths = [int(usable * 0.18), int(usable * 0.14), int(usable * 0.34), int(usable * 0.34)]
         c_headers = ["Competitor", "Pricing", "Strengths", "Weaknesses"]
-        _pdf_table_header(pdf, c_headers, c_widths)
-
-        pdf.set_font("Helvetica", "", 7)
-        line_h = 4
-        for idx, comp in enumerate(competitors):
-            bg = (248, 250, 252) if idx % 2 == 0 else (255, 255, 255)
-            name = latin_safe(comp.get("name", ""))
-            pricing = latin_safe(comp.get("pricing", ""))
-            strengths = latin_safe(", ".join(comp.get("strengths", [])))
-            weaknesses = latin_safe(", ".join(comp.get("weaknesses", [])))
-            # Calculate row height based on longest text
-            texts = [name, pricing, strengths, weaknesses]
-            max_lines = 1
-            for i, txt in enumerate(texts):
-                n_lines = max(1, len(txt) // max(1, int(c_widths[i] / 1.8)) + 1)
-                max_lines = max(max_lines, n_lines)
-            row_h = max(5.5, max_lines * line_h)
-            # Check if row fits on current page, add page break + re-draw header if not
-            remaining = pdf.h - pdf.get_y() - pdf.b_margin
-            if remaining < row_h + 2:
-                pdf.add_page()
-                _pdf_table_header(pdf, c_headers, c_widths)
-                pdf.set_font("Helvetica", "", 7)
-            # Disable auto page break to prevent mid-row splits
-            pdf.set_auto_page_break(auto=False)
-            row_y = pdf.get_y()
-            # Draw background rects
-            x = pdf.l_margin
-            for w in c_widths:
-                pdf.set_fill_color(*bg)
-                pdf.rect(x, row_y, w, row_h, style="DF")
-                x += w
-            # Write text into each cell
-            pdf.set_text_color(60, 60, 60)
-            pdf.set_xy(pdf.l_margin + 1, row_y + 0.5)
-            pdf.set_font("Helvetica", "B", 7)
-            pdf.multi_cell(c_widths[0] - 2, line_h, name)
-            pdf.set_xy(pdf.l_margin + c_widths[0] + 1, row_y + 0.5)
-            pdf.set_font("Helvetica", "", 7)
-            pdf.multi_cell(c_widths[1] - 2, line_h, pricing)
-            pdf.set_xy(pdf.l_margin + c_widths[0] + c_widths[1] + 1, row_y + 0.5)
-            pdf.multi_cell(c_widths[2] - 2, line_h, strengths)
-            pdf.set_xy(pdf.l_margin + c_widths[0] + c_widths[1] + c_widths[2] + 1, row_y + 0.5)
-            pdf.multi_cell(c_widths[3] - 2, line_h, weaknesses)
-            pdf.set_y(row_y + row_h)
-            # Re-enable auto page break
-            pdf.set_auto_page_break(auto=True, margin=20)
+        rows = [[Cell(comp.get("name", ""), style="B"), comp.get("pricing", ""),
+                 ", ".join(comp.get("strengths", [])), ", ".join(comp.get("weaknesses", []))]
+                for comp in competitors]
+        draw_table(pdf, c_headers, rows, c_widths, TEAL_RGB, **_PDF_TABLE_STYLE, size=7)
         pdf.ln(4)
 
     # -- Pain Points --
@@ -937,34 +893,19 @@ def generate_pdf(data: dict, output_path: str):
         _pdf_section_header(pdf, "Pain Points")
         p_headers = ["Pain Point", "Severity", "Frequency", "Segment"]
         p_widths = [65, 20, 25, 60]
-        _pdf_table_header(pdf, p_headers, p_widths)
-
-        pdf.set_font("Helvetica", "", 7.5)
-        for idx, pp in enumerate(pain_points):
-            if idx % 2 == 0:
-                pdf.set_fill_color(248, 250, 252)
-            else:
-                pdf.set_fill_color(255, 255, 255)
-
-            pdf.set_text_color(60, 60, 60)
-            pdf.cell(p_widths[0], 5.5, truncate(pp.get("description", ""), 44), border=1, fill=True)
-
-            # Severity with color
+        rows = []
+        for pp in pain_points:
             sev_val = pp.get("severity", 0)
             if sev_val >= 80:
-                pdf.set_text_color(153, 27, 27)
+                sev_rgb = (153, 27, 27)
             elif sev_val >= 60:
-                pdf.set_text_color(154, 52, 18)
+                sev_rgb = (154, 52, 18)
             else:
-                pdf.set_text_color(133, 77, 14)
-            pdf.set_font("Helvetica", "B", 8)
-            pdf.cell(p_widths[1], 5.5, str(sev_val), border=1, fill=True, align="C")
-
-            pdf.set_text_color(60, 60, 60)
-            pdf.set_font("Helvetica", "", 7.5)
-            pdf.cell(p_widths[2], 5.5, truncate(pp.get("frequency", ""), 16), border=1, fill=True, align="C")
-            pdf.cell(p_widths[3], 5.5, truncate(pp.get("affected_segment", ""), 40), border=1, fill=True)
-            pdf.ln()
+                sev_rgb = (133, 77, 14)
+            rows.append([pp.get("description", ""), Cell(str(sev_val), style="B", color=sev_rgb),
+                         pp.get("frequency", ""), pp.get("affected_segment", "")])
+        draw_table(pdf, p_headers, rows, p_widths, TEAL_RGB, **_PDF_TABLE_STYLE, size=7.5,
+                   aligns=["L", "C", "C", "L"])
         pdf.ln(4)
 
     # -- Risk Register --
@@ -973,59 +914,17 @@ def generate_pdf(data: dict, output_path: str):
         usable = pdf.w - pdf.l_margin - pdf.r_margin
         r_widths = [18, 22, 18, usable - 18 - 22 - 18]
         r_headers = ["ID", "Category", "Severity", "Description"]
-        _pdf_table_header(pdf, r_headers, r_widths)
-
-        line_h = 4
-        for idx, risk in enumerate(risk_register):
-            bg = (248, 250, 252) if idx % 2 == 0 else (255, 255, 255)
-            desc = latin_safe(risk.get("description", ""))
-            # Calculate row height from description length
-            desc_chars_per_line = max(1, int(r_widths[3] / 1.8))
-            n_lines = max(1, len(desc) // desc_chars_per_line + 1)
-            row_h = max(5.5, n_lines * line_h)
-            # Check if row fits on current page, add page break + re-draw header if not
-            remaining = pdf.h - pdf.get_y() - pdf.b_margin
-            if remaining < row_h + 2:
-                pdf.add_page()
-                _pdf_table_header(pdf, r_headers, r_widths)
-                pdf.set_font("Helvetica", "", 7)
-            # Disable auto page break to prevent mid-row splits
-            pdf.set_auto_page_break(auto=False)
-            row_y = pdf.get_y()
-            # Draw background rects for all cells
-            x = pdf.l_margin
-            for w in r_widths:
-                pdf.set_fill_color(*bg)
-                pdf.rect(x, row_y, w, row_h, style="DF")
-                x += w
-            # ID
-            pdf.set_xy(pdf.l_margin + 1, row_y + 0.5)
-            pdf.set_font("Helvetica", "B", 7)
-            pdf.set_text_color(60, 60, 60)
-            pdf.cell(r_widths[0] - 2, line_h, latin_safe(risk.get("id", "")))
-            # Category
-            pdf.set_xy(pdf.l_margin + r_widths[0] + 1, row_y + 0.5)
-            pdf.set_font("Helvetica", "", 7)
-            pdf.cell(r_widths[1] - 2, line_h, latin_safe(risk.get("category", "")))
-            # Severity with color
+        sev_colors = {
+            "critical": (153, 27, 27), "high": (154, 52, 18),
+            "medium": (133, 77, 14), "low": (22, 101, 52),
+        }
+        rows = []
+        for risk in risk_register:
             sev = risk.get("severity", "medium").lower()
-            sev_colors = {
-                "critical": (153, 27, 27), "high": (154, 52, 18),
-                "medium": (133, 77, 14), "low": (22, 101, 52),
-            }
-            sr, sg, sb = sev_colors.get(sev, (133, 77, 14))
-            pdf.set_xy(pdf.l_margin + r_widths[0] + r_widths[1] + 1, row_y + 0.5)
-            pdf.set_font("Helvetica", "B", 7)
-            pdf.set_text_color(sr, sg, sb)
-            pdf.cell(r_widths[2] - 2, line_h, sev.upper(), align="C")
-            # Description - full text with multi_cell
-            pdf.set_xy(pdf.l_margin + r_widths[0] + r_widths[1] + r_widths[2] + 1, row_y + 0.5)
-            pdf.set_font("Helvetica", "", 7)
-            pdf.set_text_color(60, 60, 60)
-            pdf.multi_cell(r_widths[3] - 2, line_h, desc)
-            pdf.set_y(row_y + row_h)
-            # Re-enable auto page break
-            pdf.set_auto_page_break(auto=True, margin=20)
+            rows.append([Cell(risk.get("id", ""), style="B"), risk.get("category", ""),
+                         Cell(sev.upper(), style="B", color=sev_colors.get(sev, (133, 77, 14)), align="C"),
+                         risk.get("description", "")])
+        draw_table(pdf, r_headers, rows, r_widths, TEAL_RGB, **_PDF_TABLE_STYLE, size=7)
         pdf.ln(4)
 
     # -- Methodology footer --
@@ -1036,7 +935,7 @@ def generate_pdf(data: dict, output_path: str):
     searches = methodology.get("web_searches_performed", 0)
     agents = methodology.get("agents_dispatched", 0)
     confidence = methodology.get("confidence_threshold", 70)
-    pdf.cell(0, 5, latin_safe(f"Web Searches: {searches}  |  Agents: {agents}  |  Confidence Threshold: {confidence}"), new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 5, f"Web Searches: {searches}  |  Agents: {agents}  |  Confidence Threshold: {confidence}", new_x="LMARGIN", new_y="NEXT")
 
     pdf.output(output_path)
 
@@ -1222,30 +1121,53 @@ def generate_md(data: dict, output_path: str):
 
 # -- Main --------------------------------------------------------------------
 
-def main():
-    parser = argparse.ArgumentParser(description="Export business idea analysis to MD, PDF, and HTML")
-    parser.add_argument("--input", required=True, help="Path to JSON input file")
-    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
-    args = parser.parse_args()
-
-    with open(args.input, "r") as f:
-        data = json.load(f)
-
-    paths = compute_paths(data, args.output_dir)
+def export_report(data: dict, output_dir: str, workers=None, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Render every requested format for one business analysis and return the result dict."""
+    paths = compute_paths(data, output_dir)
 
-    generate_html(data, paths["html"])
-    generate_pdf(data, paths["pdf"])
-    generate_md(data, paths["md"])
+    timings = run_exports(data, [
+        ("html", generate_html, paths["html"]),
+        ("pdf", generate_pdf, paths["pdf"]),
+        ("md", generate_md, paths["md"]),
+    ], max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
 
     result = {
-        "html": paths["html"],
-        "pdf": paths["pdf"],
-        "md": paths["md"],
+        **summarize(timings),
         "output_folder": paths["folder"],
         "top_opportunity": opportunities[0].get("name", "") if (opportunities := data.get("opportunities", [])) else "",
         "top_score": opportunities[0].get("composite_score", 0) if opportunities else 0,
         "top_verdict": opportunities[0].get("verdict", "") if opportunities else "",
     }
+    return result
+
+
+def export_file(input_path: str, output_dir: str, workers=1, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Load one JSON input and export it (batch mode entry point)."""
+    with open(input_path, "r") as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export business idea analysis to MD, PDF, and HTML")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to JSON input file")
+    source.add_argument("--inputs", help="Glob or manifest of JSON files to export in one batch (prints JSON lines)")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel render processes (1 = serial)")
+    parser.add_argument("--formats", default="all", type=formats_arg(["html", "pdf", "md"]), help="Export formats: all, html, pdf, md (comma-separated)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if outputs are current for this input")
+    parser.add_argument("--profile", action="store_true", help="Profile each render (cProfile + tracemalloc) and write {stem}.profile.json")
+    parser.add_argument("--optimize-pdf", action="store_true", help="Recompress and deduplicate PDF output; report bytes before/after in the result")
+    args = parser.parse_args()
+
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
+    with open(args.input, "r") as f:
+        data = json.load(f)
+
+    result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
     print(json.dumps(result, indent=2))
 
 
@@ -5,6 +5,10 @@ Generates HTML, PDF, and Markdown files from idea finder shortlist JSON.
 
 Usage:
     python3 idea_finder_export.py --input shortlist.json
+    python3 idea_finder_export.py --input data.json --formats html   # skip the PDF backend
+    python3 idea_finder_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 idea_finder_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 idea_finder_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 """
 
 import sys
@@ -12,16 +16,23 @@ import os
 import json
 import argparse
 from datetime import datetime
-import re
 
-# Add virtual environment to Python path
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.html import HtmlStream
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.text import latin_safe_drop as latin_safe, snake_slug
 
 # Load plugin version from plugin.json (single source of truth)
 _PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".claude-plugin", "plugin.json")
@@ -46,22 +57,6 @@ TIER_COLORS = {
 DEFAULT_OUTPUT_DIR = "/mnt/c/Users/RonKlatt_3qsjg34/Desktop/Claude Code Plugin Output/Idea_Finder/"
 
 
-def latin_safe(text):
-    """Convert text to Latin-1 safe string for PDF output."""
-    if text is None:
-        return ""
-    return str(text).encode('latin-1', 'ignore').decode('latin-1')
-
-
-def slugify(text):
-    """Convert text to URL-safe slug."""
-    if not text:
-        return "broad_scan"
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '_', text)
-    return text.strip('_')
-
-
 def score_color(score):
     """Return color based on score value."""
     if score >= 80:
@@ -76,6 +71,12 @@ def score_color(score):
 
 def generate_html(data, output_path):
     """Generate HTML report from shortlist data."""
+    with HtmlStream(output_path) as out:
+        _write_html(data, out)
+
+
+def _write_html(data, out):
+    """Stream the HTML report to ``out`` section by section."""
     topic = data.get('topic') or "Broad Market Scan"
     depth = data.get('depth', 'explore').upper()
     generated_date = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
@@ -85,7 +86,7 @@ def generate_html(data, output_path):
     consolidation_groups = data.get('consolidation_groups', [])
     coverage = data.get('coverage', {})
 
-    html = f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -474,7 +475,7 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
     # Add shortlist table rows
     for idea in shortlist:
@@ -491,7 +492,7 @@ def generate_html(data, output_path):
 
         tier_style = f"background: {TIER_COLORS.get(tier, TIER_COLORS['WATCH'])['bg']}; color: {TIER_COLORS.get(tier, TIER_COLORS['WATCH'])['text']};"
 
-        html += f"""
+        out.write(f"""
                         <tr>
                             <td class="rank">#{rank}</td>
                             <td><strong>{name}</strong></td>
@@ -529,16 +530,16 @@ def generate_html(data, output_path):
                             <td>{opp_type}</td>
                             <td>{moat_type.replace('_', ' ').title()}</td>
                         </tr>
-"""
+""")
 
-    html += """
+    out.write("""
                     </tbody>
                 </table>
             </div>
 
             <div class="section">
                 <h2 class="section-title">Detailed Analysis</h2>
-"""
+""")
 
     # Add detailed idea cards
     for idea in shortlist:
@@ -570,7 +571,7 @@ def generate_html(data, output_path):
 
         tier_style = f"background: {TIER_COLORS.get(tier, TIER_COLORS['WATCH'])['bg']}; color: {TIER_COLORS.get(tier, TIER_COLORS['WATCH'])['text']};"
 
-        html += f"""
+        out.write(f"""
                 <div class="idea-card">
                     <div class="idea-card-header">
                         <div class="idea-title">#{rank}. {name}</div>
@@ -637,128 +638,128 @@ def generate_html(data, output_path):
                             <div class="detail-label">Arbitrage Window</div>
                             <div class="detail-value">{window}</div>
                         </div>
-"""
+""")
 
         if intersection > 1.0:
-            html += f"""
+            out.write(f"""
                         <div class="detail-item">
                             <div class="detail-label">Intersection Multiplier</div>
                             <div class="detail-value" style="color: {TEAL};">{intersection}x</div>
                         </div>
-"""
+""")
 
-        html += """
+        out.write("""
                     </div>
-"""
+""")
 
         if evidence:
-            html += f"""
+            out.write(f"""
                     <div class="evidence">
                         <div class="evidence-title">Key Evidence</div>
                         <div>{evidence}</div>
                     </div>
-"""
+""")
 
         if ai_advantage:
-            html += f"""
+            out.write(f"""
                     <div class="ai-advantage">
                         <div class="ai-advantage-title">AI Advantage</div>
                         <div>{ai_advantage}</div>
                     </div>
-"""
+""")
 
         if competitors:
-            html += """
+            out.write("""
                     <div style="margin-bottom: 1rem;">
                         <div class="detail-label">Competitors</div>
                         <table style="width:100%; font-size:0.9rem; border-collapse:collapse; margin-top:0.5rem;">
                             <tr style="background:#f0fdfa;"><th style="padding:0.5rem; text-align:left;">Competitor</th><th style="padding:0.5rem; text-align:left;">Relevance</th><th style="padding:0.5rem; text-align:left;">Strength</th><th style="padding:0.5rem; text-align:left;">Key Weakness</th></tr>
-"""
+""")
             for comp in competitors:
                 c_name = comp.get('name', 'Unknown')
                 c_rel = comp.get('relevance', 'N/A')
                 c_str = comp.get('strength', 'N/A')
                 c_weak = comp.get('key_weakness', 'N/A')
-                html += f'                            <tr><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_name}</td><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_rel}</td><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_str}</td><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_weak}</td></tr>\n'
+                out.write(f'                            <tr><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_name}</td><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_rel}</td><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_str}</td><td style="padding:0.5rem; border-bottom:1px solid #e5e7eb;">{c_weak}</td></tr>\n')
 
-            html += """
+            out.write("""
                         </table>
                     </div>
-"""
+""")
 
         if modes:
-            html += f"""
+            out.write(f"""
                     <div style="margin-bottom: 1rem;">
                         <div class="detail-label" style="margin-bottom: 0.5rem;">Discovery Modes</div>
                         <div class="modes-list">
-"""
+""")
             for mode in modes:
-                html += f'                            <span class="mode-tag">{mode}</span>\n'
+                out.write(f'                            <span class="mode-tag">{mode}</span>\n')
 
-            html += """
+            out.write("""
                         </div>
                     </div>
-"""
+""")
 
         if analyze_prompt:
-            html += f"""
+            out.write(f"""
                     <div class="analyze-prompt">
                         <div class="analyze-prompt-title">Ready-to-Paste Analyzer Prompt</div>
                         <code>{analyze_prompt}</code>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
-"""
+""")
 
-    html += """
+    out.write("""
             </div>
-"""
+""")
 
     # Add themes section
     if themes:
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Emerging Themes</h2>
                 <div class="themes-section">
-"""
+""")
 
         if themes.get('dominant_theme'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Dominant Theme</div>
                         <div class="theme-value">{themes['dominant_theme']}</div>
                     </div>
-"""
+""")
 
         if themes.get('emerging_niche'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Emerging Niche</div>
                         <div class="theme-value">{themes['emerging_niche']}</div>
                     </div>
-"""
+""")
 
         if themes.get('strongest_arbitrage'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Strongest Arbitrage Opportunity</div>
                         <div class="theme-value">{themes['strongest_arbitrage']}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
     # Add consolidation groups section
     if consolidation_groups:
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Consolidation Opportunities</h2>
-"""
+""")
 
         for group in consolidation_groups:
             g_name = group.get('group_name', 'Unnamed Group')
@@ -767,7 +768,7 @@ def generate_html(data, output_path):
             g_eco_note = group.get('ecosystem_note', '')
             idea_ranks = ', '.join([f'#{r}' for r in g_ideas])
 
-            html += f"""
+            out.write(f"""
                 <div class="idea-card" style="border-left: 4px solid {TEAL};">
                     <div class="idea-title" style="font-size:1.2rem; margin-bottom:0.8rem;">{g_name}</div>
                     <div class="detail-grid">
@@ -779,70 +780,70 @@ def generate_html(data, output_path):
                             <div class="detail-label">Overlapping Capabilities</div>
                             <div class="detail-value">{g_overlap}</div>
                         </div>
-"""
+""")
 
             if g_eco_note:
-                html += f"""
+                out.write(f"""
                         <div class="detail-item" style="grid-column: 1 / -1;">
                             <div class="detail-label">Ecosystem Note</div>
                             <div class="detail-value">{g_eco_note}</div>
                         </div>
-"""
+""")
 
-            html += """
+            out.write("""
                     </div>
                 </div>
-"""
+""")
 
-        html += """
+        out.write("""
             </div>
-"""
+""")
 
     # Add methodology section
     if methodology:
-        html += """
+        out.write("""
             <div class="methodology">
                 <h3 style="margin-bottom: 1rem; color: #1f2937;">Methodology</h3>
                 <div class="methodology-grid">
-"""
+""")
 
         if methodology.get('agents_dispatched'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Agents Dispatched</div>
                         <div class="detail-value">{methodology['agents_dispatched']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('total_searches'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Total Searches</div>
                         <div class="detail-value">{methodology['total_searches']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('dedup_merges'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Duplicates Merged</div>
                         <div class="detail-value">{methodology['dedup_merges']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('sources_covered'):
             sources = ', '.join(methodology['sources_covered'])
-            html += f"""
+            out.write(f"""
                     <div class="detail-item" style="grid-column: 1 / -1;">
                         <div class="detail-label">Sources Covered</div>
                         <div class="detail-value">{sources}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
     # Add coverage section
     if coverage:
@@ -857,7 +858,7 @@ def generate_html(data, output_path):
         unmatched = coverage.get('unmatched_comparable_categories', [])
         unmatched_str = ', '.join(unmatched) if unmatched else 'None'
 
-        html += f"""
+        out.write(f"""
             <div class="methodology" style="margin-top:1rem;">
                 <h3 style="margin-bottom: 1rem; color: #1f2937;">Coverage Notes</h3>
                 <p><strong>Categories Scanned:</strong> {categories_scanned}</p>
@@ -867,9 +868,9 @@ def generate_html(data, output_path):
                 <p><strong>Comparable ecosystems checked:</strong> {comparable_str}</p>
                 <p><strong>Unmatched comparable categories:</strong> {unmatched_str}</p>
             </div>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
             <div class="footer">
                 Generated by Business Idea Finder on {generated_date}<br>
                 ROK Plugin Marketplace - Business Idea Finder v{PLUGIN_VERSION}
@@ -878,14 +879,12 @@ def generate_html(data, output_path):
     </div>
 </body>
 </html>
-"""
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+""")
 
 
 def generate_pdf(data, output_path):
     """Generate PDF report from shortlist data."""
+    from fpdf import FPDF
 
     class IdeaFinderPDF(FPDF):
         def header(self):
@@ -1402,13 +1401,57 @@ def generate_markdown(data, output_path):
         f.write(md)
 
 
+def export_report(data, output_dir, workers=None, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Render every requested format for one shortlist and return the result dict."""
+    # Validate data type
+    if data.get('type') != 'idea_finder_shortlist':
+        print(f"Warning: Expected type 'idea_finder_shortlist', got '{data.get('type')}'", file=sys.stderr)
+
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Generate filename base
+    topic = data.get('topic')
+    topic_slug = snake_slug(topic, "broad_scan")
+    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
+    base_filename = f"idea_finder_{topic_slug}_{date_str}"
+
+    jobs = [
+        ("html", generate_html, os.path.join(output_dir, f"{base_filename}.html")),
+        ("pdf", generate_pdf, os.path.join(output_dir, f"{base_filename}.pdf")),
+        ("md", generate_markdown, os.path.join(output_dir, f"{base_filename}.md")),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    result = summarize(timings)
+    result["output_folder"] = output_dir
+    return result
+
+
+def export_file(input_path, output_dir, workers=1, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Load one shortlist JSON file and export it (batch mode entry point)."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Export Business Idea Finder shortlist to HTML, PDF, and Markdown')
-    parser.add_argument('--input', required=True, help='Path to shortlist JSON file')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='Path to shortlist JSON file')
+    source.add_argument('--inputs', help='Glob or manifest of JSON files to export in one batch (prints JSON lines)')
     parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel render processes (1 = serial)')
+    parser.add_argument('--formats', default='all', type=formats_arg(['html', 'pdf', 'md']), help='Export formats: all, html, pdf, md (comma-separated)')
+    parser.add_argument('--force', action='store_true', help='Re-render even if outputs are current for this input')
+    parser.add_argument('--profile', action='store_true', help='Profile each render (cProfile + tracemalloc) and write {stem}.profile.json')
+    parser.add_argument('--optimize-pdf', action='store_true', help='Recompress and deduplicate PDF output; report bytes before/after in the result')
 
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     # Read input JSON
     try:
         with open(args.input, 'r', encoding='utf-8') as f:
@@ -1420,41 +1463,10 @@ def main():
         print(f"Error: Invalid JSON in input file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Validate data type
-    if data.get('type') != 'idea_finder_shortlist':
-        print(f"Warning: Expected type 'idea_finder_shortlist', got '{data.get('type')}'", file=sys.stderr)
-
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    # Generate filename base
-    topic = data.get('topic')
-    topic_slug = slugify(topic) if topic else "broad_scan"
-    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
-    base_filename = f"idea_finder_{topic_slug}_{date_str}"
-
-    # Generate outputs
+    # Generate outputs (formats render in parallel worker processes) and print the JSON result
     try:
-        html_path = os.path.join(args.output_dir, f"{base_filename}.html")
-        print(f"Generating HTML: {html_path}")
-        generate_html(data, html_path)
-        print(f"  HTML generated successfully")
-
-        pdf_path = os.path.join(args.output_dir, f"{base_filename}.pdf")
-        print(f"Generating PDF: {pdf_path}")
-        generate_pdf(data, pdf_path)
-        print(f"  PDF generated successfully")
-
-        md_path = os.path.join(args.output_dir, f"{base_filename}.md")
-        print(f"Generating Markdown: {md_path}")
-        generate_markdown(data, md_path)
-        print(f"  Markdown generated successfully")
-
-        print("\nExport complete!")
-        print(f"\nOutput files:")
-        print(f"  - {html_path}")
-        print(f"  - {pdf_path}")
-        print(f"  - {md_path}")
+        result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
+        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error during export: {e}", file=sys.stderr)
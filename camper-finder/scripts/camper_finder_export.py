@@ -5,6 +5,12 @@ Generates HTML, PDF, and Markdown files from camper/RV inventory search results.
 
 Usage:
     python3 camper_finder_export.py --input inventory.json
+    python3 camper_finder_export.py --input data.json --formats html   # skip the PDF backend
+    python3 camper_finder_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 camper_finder_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 camper_finder_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
+    python3 camper_finder_export.py --input data.json --rank-weights score=2,fmv=1,distance=0.5   # re-rank without editing the JSON
+    python3 camper_finder_export.py --input data.json --history-db ~/.cache/rok_export/camper_history.db   # price trend across runs
 """
 
 import sys
@@ -12,16 +18,29 @@ import os
 import json
 import argparse
 from datetime import datetime
-import re
-
-# Add virtual environment to Python path
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
-
-from fpdf import FPDF
+from functools import partial
+
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
+
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.geo import fill_distances
+from rok_export.history import annotate, record as record_history
+from rok_export.html import HtmlStream
+from rok_export.listings import ListingRecord, listing_records
+from rok_export.ranking import parse_weights, rank_records, top_records
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.stats import market_stats, stat_mean, stat_rows
+from rok_export.text import latin_safe_drop as latin_safe, snake_slug
 
 # Color scheme (amber-based)
 AMBER = "#D97706"
@@ -38,22 +57,6 @@ DEAL_COLORS = {
 DEFAULT_OUTPUT_DIR = "/mnt/c/Users/RonKlatt_3qsjg34/Desktop/Claude Code Plugin Output/Camper_Inventory/"
 
 
-def latin_safe(text):
-    """Convert text to Latin-1 safe string for PDF output."""
-    if text is None:
-        return ""
-    return str(text).encode('latin-1', 'ignore').decode('latin-1')
-
-
-def slugify(text):
-    """Convert text to URL-safe slug."""
-    if not text:
-        return "general"
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '_', text)
-    return text.strip('_')
-
-
 def score_color(score):
     """Return color based on score value."""
     if score >= 85:
@@ -66,23 +69,69 @@ def score_color(score):
         return "#DC2626"  # Red
 
 
-def format_price_diff(diff):
-    """Format price difference with +/- prefix."""
-    if diff is None:
-        return "N/A"
-    if diff < 0:
-        return f"-${abs(diff):,.0f}"
-    elif diff > 0:
-        return f"+${diff:,.0f}"
-    else:
-        return "$0"
+class CamperListing(ListingRecord):
+    """One camper listing, normalized once and shared by the HTML, PDF and Markdown renderers."""
+
+    FIELDS = ListingRecord.FIELDS + (
+        ('floorplan', ''), ('rv_type', ''), ('stock_number', 'N/A'),
+        ('length_ft', 'N/A'), ('dry_weight_lbs', 'N/A'), ('gvwr_lbs', 'N/A'), ('slides', 'N/A'),
+        ('sleeping_capacity', 'N/A'),
+        ('fresh_water_gal', 'N/A'), ('gray_water_gal', 'N/A'), ('black_water_gal', 'N/A'),
+    )
+    __slots__ = (
+        'floorplan', 'rv_type', 'stock_number', 'length_ft', 'dry_weight_lbs', 'gvwr_lbs', 'slides',
+        'sleeping_capacity', 'fresh_water_gal', 'gray_water_gal', 'black_water_gal',
+        'name', 'full_name', 'specs_display', 'specs_compact', 'dry_weight_display', 'gvwr_display',
+    )
+
+    def derive(self, listing):
+        super().derive(listing)
+        self.name = f"{self.year} {self.model} {self.floorplan}".strip()
+        self.full_name = f"{self.year} {self.make} {self.model} {self.floorplan}".strip()
+
+        # Overview table specs: missing values are left out rather than shown as 'N/A'
+        length_ft = listing.get('length_ft', '')
+        dry_weight = listing.get('dry_weight_lbs', '')
+        slides = listing.get('slides', '')
+        long_parts = []
+        short_parts = []
+        if length_ft:
+            long_parts.append(f"{length_ft}ft")
+            short_parts.append(f"{length_ft}ft")
+        if dry_weight:
+            wt = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else str(dry_weight)
+            long_parts.append(f"{wt}lbs")
+            short_parts.append(f"{wt}lb")
+        if slides is not None and slides != '':
+            long_parts.append(f"{slides}sl")
+            short_parts.append(f"{slides}sl")
+        self.specs_display = " / ".join(long_parts) if long_parts else "N/A"
+        self.specs_compact = "/".join(short_parts) if short_parts else "N/A"
+
+        dry_weight = self.dry_weight_lbs
+        gvwr = self.gvwr_lbs
+        self.dry_weight_display = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else str(dry_weight)
+        self.gvwr_display = f"{gvwr:,}" if isinstance(gvwr, (int, float)) else str(gvwr)
+
+
+def _ranked_records(data):
+    """Normalized listings in ranking order (re-ranked only if the payload carries ``rank_weights``)."""
+    return rank_records(listing_records(data, CamperListing), data.get('rank_weights'))
 
 
-def generate_html(data, output_path):
+def generate_html(data, output_path, records=None):
     """Generate HTML report from camper/RV inventory search data."""
+    with HtmlStream(output_path) as out:
+        _write_html(data, out, records)
+
+
+def _write_html(data, out, records=None):
+    """Stream the HTML report to ``out`` section by section."""
     search_params = data.get('search_params', {})
     market_context = data.get('market_context', {})
-    listings = data.get('listings', [])
+    if records is None:
+        records = _ranked_records(data)
+    stats = market_stats(records, 'length_ft')
     methodology = data.get('methodology', {})
     generated_date = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
 
@@ -97,7 +146,7 @@ def generate_html(data, output_path):
     zip_code = search_params.get('zip_code', 'N/A')
     features = ', '.join(search_params.get('features', []))
 
-    fmv_average = market_context.get('fmv_average', 0)
+    fmv_average = market_context.get('fmv_average') or stat_mean(stats, 'fmv')
     total_listings = market_context.get('total_listings_found', 0)
     unique_listings = market_context.get('unique_listings', 0)
 
@@ -106,7 +155,7 @@ def generate_html(data, output_path):
         subtitle_parts.append(floorplan)
     subtitle = f"{' '.join(p for p in subtitle_parts if p)} &mdash; {rv_type or condition}"
 
-    html = f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -646,40 +695,27 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
     # Add table rows
-    for listing in listings:
-        rank = listing.get('rank', 0)
-        deal_rating = listing.get('deal_rating', 'FAIR_PRICE')
-        deal_display = deal_rating.replace('_', ' ')
-        composite = listing.get('composite_score', 0)
-        l_year = listing.get('year', '')
-        l_model = listing.get('model', '')
-        l_floorplan = listing.get('floorplan', '')
-        camper_name = f"{l_year} {l_model} {l_floorplan}".strip()
-        price = listing.get('price', 0)
-        price_vs_fmv = listing.get('price_vs_fmv', None)
-        distance = listing.get('dealer_distance_miles', 'N/A')
-        dealer = listing.get('dealer_name', 'Unknown')
-        dealer_rating = listing.get('dealer_rating', 'N/A')
-        length_ft = listing.get('length_ft', '')
-        dry_weight = listing.get('dry_weight_lbs', '')
-        slides = listing.get('slides', '')
-
-        specs_parts = []
-        if length_ft:
-            specs_parts.append(f"{length_ft}ft")
-        if dry_weight:
-            specs_parts.append(f"{dry_weight:,}lbs" if isinstance(dry_weight, (int, float)) else f"{dry_weight}lbs")
-        if slides is not None and slides != '':
-            specs_parts.append(f"{slides}sl")
-        specs_display = " / ".join(specs_parts) if specs_parts else "N/A"
+    for rec in records:
+        rank = rec.rank
+        deal_rating = rec.deal_rating
+        deal_display = rec.deal_display
+        composite = rec.composite_score
+        l_floorplan = rec.floorplan
+        camper_name = rec.name
+        price = rec.price
+        price_vs_fmv = rec.price_vs_fmv
+        distance = rec.dealer_distance_miles
+        dealer = rec.dealer_name
+        dealer_rating = rec.dealer_rating
+        specs_display = rec.specs_display
 
         deal_style = f"background: {DEAL_COLORS.get(deal_rating, DEAL_COLORS['FAIR_PRICE'])['bg']}; color: {DEAL_COLORS.get(deal_rating, DEAL_COLORS['FAIR_PRICE'])['text']};"
-        fmv_display = format_price_diff(price_vs_fmv)
+        fmv_display = rec.fmv_display
 
-        html += f"""
+        out.write(f"""
                         <tr>
                             <td class="rank">#{rank}</td>
                             <td><span class="deal-badge" style="{deal_style}">{deal_display}</span></td>
@@ -696,73 +732,72 @@ def generate_html(data, output_path):
                             <td>{dealer}</td>
                             <td>{dealer_rating}</td>
                         </tr>
-"""
+""")
 
-    html += """
+    out.write("""
                     </tbody>
                 </table>
             </div>
 
             <div class="section">
                 <h2 class="section-title">Detailed Listings</h2>
-"""
+""")
 
     # Add detailed camper cards (top 3)
-    top_listings = listings[:3]
-    for listing in top_listings:
-        rank = listing.get('rank', 0)
-        deal_rating = listing.get('deal_rating', 'FAIR_PRICE')
-        deal_display = deal_rating.replace('_', ' ')
-        composite = listing.get('composite_score', 0)
-        l_year = listing.get('year', '')
-        l_make = listing.get('make', '')
-        l_model = listing.get('model', '')
-        l_floorplan = listing.get('floorplan', '')
-        l_rv_type = listing.get('rv_type', '')
-        camper_name = f"{l_year} {l_make} {l_model} {l_floorplan}".strip()
-        price = listing.get('price', 0)
-        msrp = listing.get('msrp', 0)
-        fmv = listing.get('fmv', 0)
-        price_vs_fmv = listing.get('price_vs_fmv', None)
-        price_vs_fmv_pct = listing.get('price_vs_fmv_pct', None)
-        exterior_color = listing.get('exterior_color', 'N/A')
-        mileage = listing.get('mileage', 'N/A')
-        stock_number = listing.get('stock_number', 'N/A')
+    for rec in top_records(records, 3):
+        rank = rec.rank
+        deal_rating = rec.deal_rating
+        deal_display = rec.deal_display
+        composite = rec.composite_score
+        l_floorplan = rec.floorplan
+        l_rv_type = rec.rv_type
+        camper_name = rec.full_name
+        price = rec.price
+        msrp = rec.msrp
+        fmv = rec.fmv
+        price_vs_fmv = rec.price_vs_fmv
+        exterior_color = rec.exterior_color
+        mileage = rec.mileage
+        stock_number = rec.stock_number
 
         # RV-specific specs
-        length_ft = listing.get('length_ft', 'N/A')
-        dry_weight = listing.get('dry_weight_lbs', 'N/A')
-        gvwr = listing.get('gvwr_lbs', 'N/A')
-        slides = listing.get('slides', 'N/A')
-        sleeping_capacity = listing.get('sleeping_capacity', 'N/A')
+        length_ft = rec.length_ft
+        slides = rec.slides
+        sleeping_capacity = rec.sleeping_capacity
 
         # Tank capacities
-        fresh_water = listing.get('fresh_water_gal', 'N/A')
-        gray_water = listing.get('gray_water_gal', 'N/A')
-        black_water = listing.get('black_water_gal', 'N/A')
-
-        dealer_name = listing.get('dealer_name', 'Unknown')
-        dealer_distance = listing.get('dealer_distance_miles', 'N/A')
-        dealer_rating = listing.get('dealer_rating', 'N/A')
-        dealer_reviews = listing.get('dealer_review_count', 'N/A')
-        key_features = listing.get('key_features', [])
-        incentives = listing.get('incentives', [])
-        negotiation_notes = listing.get('negotiation_notes', '')
-        listing_url = listing.get('listing_url', '')
-        phone = listing.get('phone', '')
-        source = listing.get('source', 'N/A')
-        days_on_market = listing.get('days_on_market', 'N/A')
-        confidence = listing.get('confidence', 'N/A')
+        fresh_water = rec.fresh_water_gal
+        gray_water = rec.gray_water_gal
+        black_water = rec.black_water_gal
+
+        dealer_name = rec.dealer_name
+        dealer_distance = rec.dealer_distance_miles
+        dealer_rating = rec.dealer_rating
+        dealer_reviews = rec.dealer_review_count
+        key_features = rec.key_features
+        incentives = rec.incentives
+        negotiation_notes = rec.negotiation_notes
+        listing_url = rec.listing_url
+        phone = rec.phone
+        source = rec.source
+        days_on_market = rec.days_on_market
+        price_trend = rec.price_trend
+        confidence = rec.confidence
 
         deal_style = f"background: {DEAL_COLORS.get(deal_rating, DEAL_COLORS['FAIR_PRICE'])['bg']}; color: {DEAL_COLORS.get(deal_rating, DEAL_COLORS['FAIR_PRICE'])['text']};"
-        fmv_display = format_price_diff(price_vs_fmv)
-        pct_display = f"{price_vs_fmv_pct:+.1f}%" if price_vs_fmv_pct is not None else "N/A"
+        fmv_display = rec.fmv_display
+        pct_display = rec.pct_display
+        trend_item = f"""                        <div class="detail-item">
+                            <div class="detail-label">Price Trend</div>
+                            <div class="detail-value">{price_trend}</div>
+                        </div>
+""" if price_trend else ""
 
         # Format weight values with commas if numeric
-        dry_weight_display = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else dry_weight
-        gvwr_display = f"{gvwr:,}" if isinstance(gvwr, (int, float)) else gvwr
+        dry_weight_display = rec.dry_weight_display
+        gvwr_display = rec.gvwr_display
 
-        html += f"""
+        out.write(f"""
                 <div class="camper-card">
                     <div class="camper-card-header">
                         <div class="camper-title">#{rank}. {camper_name}</div>
@@ -801,7 +836,7 @@ def generate_html(data, output_path):
                             <div class="detail-label">Days on Market</div>
                             <div class="detail-value">{days_on_market}</div>
                         </div>
-                        <div class="detail-item">
+{trend_item}                        <div class="detail-item">
                             <div class="detail-label">Composite Score</div>
                             <div class="detail-value" style="color: {score_color(composite)};">{composite}</div>
                             <div class="score-bar">
@@ -865,43 +900,43 @@ def generate_html(data, output_path):
                             <div class="tank-value">{black_water} gal</div>
                         </div>
                     </div>
-"""
+""")
 
         if key_features:
-            html += """
+            out.write("""
                     <div class="features-list">
                         <h4>Key Features</h4>
                         <ul>
-"""
+""")
             for feat in key_features:
-                html += f"                            <li>{feat}</li>\n"
-            html += """
+                out.write(f"                            <li>{feat}</li>\n")
+            out.write("""
                         </ul>
                     </div>
-"""
+""")
 
         if incentives:
-            html += """
+            out.write("""
                     <div class="incentives-list">
                         <h4>Incentives</h4>
                         <ul>
-"""
+""")
             for inc in incentives:
-                html += f"                            <li>{inc}</li>\n"
-            html += """
+                out.write(f"                            <li>{inc}</li>\n")
+            out.write("""
                         </ul>
                     </div>
-"""
+""")
 
         if negotiation_notes:
-            html += f"""
+            out.write(f"""
                     <div class="negotiation-notes">
                         <div class="negotiation-notes-title">Negotiation Notes</div>
                         <p>{negotiation_notes}</p>
                     </div>
-"""
+""")
 
-        html += f"""
+        out.write(f"""
                     <div class="dealer-info">
                         <div>
                             <div class="detail-label">Dealer</div>
@@ -920,35 +955,35 @@ def generate_html(data, output_path):
                             <div style="font-weight: 600;">{confidence}</div>
                         </div>
                     </div>
-"""
+""")
 
         if listing_url:
-            html += f"""
+            out.write(f"""
                     <div style="margin-bottom: 0.5rem;">
                         <div class="detail-label" style="margin-bottom: 0.3rem;">Listing URL</div>
                         <div><a href="{listing_url}" target="_blank" style="color: {AMBER}; text-decoration: none;">{listing_url}</a></div>
                     </div>
-"""
+""")
 
         if phone:
-            html += f"""
+            out.write(f"""
                     <div style="margin-bottom: 1rem;">
                         <div class="detail-label" style="margin-bottom: 0.3rem;">Phone</div>
                         <div style="font-weight: 600;">{phone}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
-"""
+""")
 
-    html += """
+    out.write("""
             </div>
-"""
+""")
 
     # Market Context section
     if market_context:
-        avg_asking = market_context.get('average_asking', 0)
+        avg_asking = market_context.get('average_asking') or stat_mean(stats, 'price')
         market_trend = market_context.get('market_trend', 'N/A')
         best_time = market_context.get('best_time_insight', 'N/A')
         incentives_summary = market_context.get('incentives_summary', [])
@@ -957,13 +992,13 @@ def generate_html(data, output_path):
         fmv_jd_power = market_context.get('fmv_jd_power', 0)
         prep_fee_notes = market_context.get('prep_fee_notes', '')
 
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Market Context</h2>
                 <div class="market-context-section">
-"""
+""")
 
-        html += f"""
+        out.write(f"""
                     <div class="market-item">
                         <div class="market-label">FMV Average</div>
                         <div class="market-value">${fmv_average:,.0f}</div>
@@ -972,33 +1007,33 @@ def generate_html(data, output_path):
                         <div class="market-label">Average Asking Price</div>
                         <div class="market-value">${avg_asking:,.0f}</div>
                     </div>
-"""
+""")
 
         if fmv_nada:
-            html += f"""
+            out.write(f"""
                     <div class="market-item">
                         <div class="market-label">NADA Value</div>
                         <div class="market-value">${fmv_nada:,.0f}</div>
                     </div>
-"""
+""")
 
         if fmv_rvtrader_avg:
-            html += f"""
+            out.write(f"""
                     <div class="market-item">
                         <div class="market-label">RVTrader Average</div>
                         <div class="market-value">${fmv_rvtrader_avg:,.0f}</div>
                     </div>
-"""
+""")
 
         if fmv_jd_power:
-            html += f"""
+            out.write(f"""
                     <div class="market-item">
                         <div class="market-label">JD Power Value</div>
                         <div class="market-value">${fmv_jd_power:,.0f}</div>
                     </div>
-"""
+""")
 
-        html += f"""
+        out.write(f"""
                     <div class="market-item">
                         <div class="market-label">Total Listings Found</div>
                         <div class="market-value">{total_listings} ({unique_listings} unique after deduplication)</div>
@@ -1011,86 +1046,106 @@ def generate_html(data, output_path):
                         <div class="market-label">Best Time to Buy</div>
                         <div class="market-value">{best_time}</div>
                     </div>
-"""
+""")
 
         if prep_fee_notes:
-            html += f"""
+            out.write(f"""
                     <div class="market-item">
                         <div class="market-label">Dealer Prep Fee Notes</div>
                         <div class="market-value">{prep_fee_notes}</div>
                     </div>
-"""
+""")
 
         if incentives_summary:
             incentives_str = ', '.join(incentives_summary)
-            html += f"""
+            out.write(f"""
                     <div class="market-item">
                         <div class="market-label">Available Incentives</div>
                         <div class="market-value">{incentives_str}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
+
+    # Market Statistics section (computed from the listings)
+    stat_items = stat_rows(stats, ('foot', 'ft'))
+    if stat_items:
+        out.write("""
+            <div class="section">
+                <h2 class="section-title">Market Statistics</h2>
+                <div class="market-context-section">
+""")
+        for label, value in stat_items:
+            out.write(f"""
+                    <div class="market-item">
+                        <div class="market-label">{label}</div>
+                        <div class="market-value">{value}</div>
+                    </div>
+""")
+        out.write("""
+                </div>
+            </div>
+""")
 
     # Methodology section
     if methodology:
-        html += """
+        out.write("""
             <div class="methodology">
                 <h3 style="margin-bottom: 1rem; color: #1f2937;">Methodology</h3>
                 <div class="methodology-grid">
-"""
+""")
 
         if methodology.get('agents_dispatched'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Agents Dispatched</div>
                         <div class="detail-value">{methodology['agents_dispatched']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('total_searches'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Total Searches</div>
                         <div class="detail-value">{methodology['total_searches']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('deduplication_removals') is not None:
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Deduplication Removals</div>
                         <div class="detail-value">{methodology['deduplication_removals']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('sources_covered'):
             sources = ', '.join(methodology['sources_covered'])
-            html += f"""
+            out.write(f"""
                     <div class="detail-item" style="grid-column: 1 / -1;">
                         <div class="detail-label">Sources Covered</div>
                         <div class="detail-value">{sources}</div>
                     </div>
-"""
+""")
 
         if methodology.get('fmv_sources'):
             fmv_sources = ', '.join(methodology['fmv_sources'])
-            html += f"""
+            out.write(f"""
                     <div class="detail-item" style="grid-column: 1 / -1;">
                         <div class="detail-label">FMV Sources</div>
                         <div class="detail-value">{fmv_sources}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
             <div class="footer">
                 Generated by Camper Finder on {generated_date}<br>
                 ROK Plugin Marketplace - Camper Finder v1.0
@@ -1099,16 +1154,14 @@ def generate_html(data, output_path):
     </div>
 </body>
 </html>
-"""
+""")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
 
+def _new_inventory_pdf(search_params):
+    """Empty inventory PDF for a search (module-level so detail chunks can build one in a worker)."""
+    from rok_export.pdf import StatePDF
 
-def generate_pdf(data, output_path):
-    """Generate PDF report from camper/RV inventory search data."""
-
-    class InventoryPDF(FPDF):
+    class InventoryPDF(StatePDF):
         def header(self):
             self.set_fill_color(217, 119, 6)  # AMBER
             self.rect(0, 0, 210, 40, 'F')
@@ -1117,7 +1170,6 @@ def generate_pdf(data, output_path):
             self.cell(0, 15, '', 0, 1)
             self.cell(0, 10, latin_safe('Camper/RV Inventory Results'), 0, 1, 'C')
             self.set_font('Arial', '', 12)
-            search_params = data.get('search_params', {})
             parts = [
                 search_params.get('year', ''),
                 search_params.get('make', ''),
@@ -1139,181 +1191,64 @@ def generate_pdf(data, output_path):
 
     pdf = InventoryPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
-    pdf.add_page()
-
-    search_params = data.get('search_params', {})
-    market_context = data.get('market_context', {})
-    listings = data.get('listings', [])
-    methodology = data.get('methodology', {})
-    generated_date = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
-
-    # Search Parameters section
-    pdf.set_font('Arial', 'B', 14)
-    pdf.set_text_color(180, 83, 9)  # AMBER_DARK
-    pdf.cell(0, 10, latin_safe('Search Parameters'), 0, 1)
-    pdf.ln(2)
-
-    pdf.set_font('Arial', '', 10)
-    pdf.set_text_color(0, 0, 0)
-
-    pdf.cell(90, 7, latin_safe(f'Year: {search_params.get("year", "N/A")}'), 0, 0)
-    pdf.cell(90, 7, latin_safe(f'Make: {search_params.get("make", "N/A")}'), 0, 1)
-    pdf.cell(90, 7, latin_safe(f'Model: {search_params.get("model", "N/A")}'), 0, 0)
-    pdf.cell(90, 7, latin_safe(f'Floorplan: {search_params.get("floorplan", "All")}'), 0, 1)
-    pdf.cell(90, 7, latin_safe(f'RV Type: {search_params.get("rv_type", "N/A")}'), 0, 0)
-    pdf.cell(90, 7, latin_safe(f'Condition: {search_params.get("condition", "N/A")}'), 0, 1)
-    max_price = search_params.get('max_price', 0)
-    pdf.cell(90, 7, latin_safe(f'Budget: ${max_price:,.0f}'), 0, 0)
-    pdf.cell(90, 7, latin_safe(f'Radius: {search_params.get("radius_miles", "N/A")} miles'), 0, 1)
-    pdf.cell(90, 7, latin_safe(f'Zip Code: {search_params.get("zip_code", "N/A")}'), 0, 0)
-    features = ', '.join(search_params.get('features', []))
-    pdf.cell(90, 7, latin_safe(f'Features: {features or "Any"}'), 0, 1)
-    pdf.ln(5)
-
-    # Summary stats
-    pdf.set_font('Arial', 'B', 14)
-    pdf.set_text_color(180, 83, 9)
-    pdf.cell(0, 10, latin_safe('Summary'), 0, 1)
-    pdf.ln(2)
-
-    pdf.set_font('Arial', '', 11)
-    pdf.set_text_color(0, 0, 0)
-
-    fmv_average = market_context.get('fmv_average', 0)
-    unique_listings = market_context.get('unique_listings', 0)
-    radius = search_params.get('radius_miles', 'N/A')
-
-    pdf.cell(90, 8, latin_safe(f'Generated: {generated_date}'), 0, 0)
-    pdf.cell(90, 8, latin_safe(f'Listings Found: {unique_listings}'), 0, 1)
-    pdf.cell(90, 8, latin_safe(f'FMV Average: ${fmv_average:,.0f}'), 0, 0)
-    pdf.cell(90, 8, latin_safe(f'Search Radius: {radius} miles'), 0, 1)
-
-    if methodology:
-        pdf.cell(90, 8, latin_safe(f'Agents: {methodology.get("agents_dispatched", 0)}'), 0, 0)
-        pdf.cell(90, 8, latin_safe(f'Searches: {methodology.get("total_searches", 0)}'), 0, 1)
-
-    pdf.ln(10)
-
-    # Listings table
-    pdf.set_font('Arial', 'B', 14)
-    pdf.set_text_color(180, 83, 9)
-    pdf.cell(0, 10, latin_safe('Listings'), 0, 1)
-    pdf.ln(2)
-
-    # Table header
-    pdf.set_font('Arial', 'B', 8)
-    pdf.set_fill_color(217, 119, 6)  # AMBER
-    pdf.set_text_color(255, 255, 255)
-    pdf.cell(10, 8, '#', 1, 0, 'C', True)
-    pdf.cell(40, 8, 'Camper', 1, 0, 'C', True)
-    pdf.cell(22, 8, 'Deal', 1, 0, 'C', True)
-    pdf.cell(22, 8, 'Price', 1, 0, 'C', True)
-    pdf.cell(20, 8, 'vs FMV', 1, 0, 'C', True)
-    pdf.cell(30, 8, 'Specs', 1, 0, 'C', True)
-    pdf.cell(36, 8, 'Dealer', 1, 1, 'C', True)
-
-    # Table rows
-    pdf.set_font('Arial', '', 8)
-    pdf.set_text_color(0, 0, 0)
-
-    for listing in listings:
-        rank = listing.get('rank', 0)
-        l_year = listing.get('year', '')
-        l_model = listing.get('model', '')
-        l_floorplan = listing.get('floorplan', '')
-        camper_name = f"{l_year} {l_model} {l_floorplan}".strip()
-        deal_rating = listing.get('deal_rating', 'FAIR_PRICE')
-        deal_display = deal_rating.replace('_', ' ')
-        price = listing.get('price', 0)
-        price_vs_fmv = listing.get('price_vs_fmv', None)
-        dealer_name = listing.get('dealer_name', 'Unknown')
-        length_ft = listing.get('length_ft', '')
-        dry_weight = listing.get('dry_weight_lbs', '')
-        slides = listing.get('slides', '')
-
-        specs_parts = []
-        if length_ft:
-            specs_parts.append(f"{length_ft}ft")
-        if dry_weight:
-            wt = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else str(dry_weight)
-            specs_parts.append(f"{wt}lb")
-        if slides is not None and slides != '':
-            specs_parts.append(f"{slides}sl")
-        specs_display = "/".join(specs_parts) if specs_parts else "N/A"
-
-        fmv_display = format_price_diff(price_vs_fmv)
-
-        pdf.cell(10, 8, str(rank), 1, 0, 'C')
-        pdf.cell(40, 8, latin_safe(camper_name[:24]), 1, 0)
-        pdf.cell(22, 8, latin_safe(deal_display[:12]), 1, 0, 'C')
-        pdf.cell(22, 8, latin_safe(f'${price:,.0f}'), 1, 0, 'C')
-        pdf.cell(20, 8, latin_safe(fmv_display), 1, 0, 'C')
-        pdf.cell(30, 8, latin_safe(specs_display[:18]), 1, 0, 'C')
-        pdf.cell(36, 8, latin_safe(dealer_name[:22]), 1, 1)
+    return pdf
 
-    pdf.ln(10)
 
-    # Detailed sections
-    pdf.add_page()
-    pdf.set_font('Arial', 'B', 14)
-    pdf.set_text_color(180, 83, 9)
-    pdf.cell(0, 10, latin_safe('Detailed Listings'), 0, 1)
-    pdf.ln(5)
+def _pdf_listing_details(pdf, records, first):
+    """Draw the detailed block of each listing in ``records``, starting on the current page."""
+    if first:
+        pdf.set_font('Arial', 'B', 14)
+        pdf.set_text_color(180, 83, 9)
+        pdf.cell(0, 10, latin_safe('Detailed Listings'), 0, 1)
+        pdf.ln(5)
 
-    for idx, listing in enumerate(listings):
+    for idx, rec in enumerate(records):
         if idx > 0:
             pdf.ln(8)
 
-        rank = listing.get('rank', 0)
-        l_year = listing.get('year', '')
-        l_make = listing.get('make', '')
-        l_model = listing.get('model', '')
-        l_floorplan = listing.get('floorplan', '')
-        l_rv_type = listing.get('rv_type', '')
-        camper_name = f"{l_year} {l_make} {l_model} {l_floorplan}".strip()
-        deal_rating = listing.get('deal_rating', 'FAIR_PRICE')
-        deal_display = deal_rating.replace('_', ' ')
-        composite = listing.get('composite_score', 0)
-        price = listing.get('price', 0)
-        msrp = listing.get('msrp', 0)
-        fmv = listing.get('fmv', 0)
-        price_vs_fmv = listing.get('price_vs_fmv', None)
-        price_vs_fmv_pct = listing.get('price_vs_fmv_pct', None)
-        exterior_color = listing.get('exterior_color', 'N/A')
-        mileage = listing.get('mileage', 'N/A')
-        stock_number = listing.get('stock_number', 'N/A')
+        rank = rec.rank
+        l_floorplan = rec.floorplan
+        l_rv_type = rec.rv_type
+        camper_name = rec.full_name
+        deal_display = rec.deal_display
+        composite = rec.composite_score
+        price = rec.price
+        msrp = rec.msrp
+        fmv = rec.fmv
+        exterior_color = rec.exterior_color
+        mileage = rec.mileage
+        stock_number = rec.stock_number
 
         # RV specs
-        length_ft = listing.get('length_ft', 'N/A')
-        dry_weight = listing.get('dry_weight_lbs', 'N/A')
-        gvwr = listing.get('gvwr_lbs', 'N/A')
-        slides = listing.get('slides', 'N/A')
-        sleeping_capacity = listing.get('sleeping_capacity', 'N/A')
+        length_ft = rec.length_ft
+        slides = rec.slides
+        sleeping_capacity = rec.sleeping_capacity
 
         # Tank capacities
-        fresh_water = listing.get('fresh_water_gal', 'N/A')
-        gray_water = listing.get('gray_water_gal', 'N/A')
-        black_water = listing.get('black_water_gal', 'N/A')
-
-        dealer_name = listing.get('dealer_name', 'Unknown')
-        dealer_distance = listing.get('dealer_distance_miles', 'N/A')
-        dealer_rating = listing.get('dealer_rating', 'N/A')
-        dealer_reviews = listing.get('dealer_review_count', 'N/A')
-        key_features = listing.get('key_features', [])
-        incentives = listing.get('incentives', [])
-        negotiation_notes = listing.get('negotiation_notes', '')
-        listing_url = listing.get('listing_url', '')
-        phone = listing.get('phone', '')
-        source = listing.get('source', 'N/A')
-        days_on_market = listing.get('days_on_market', 'N/A')
-        confidence = listing.get('confidence', 'N/A')
-
-        fmv_display = format_price_diff(price_vs_fmv)
-        pct_display = f"{price_vs_fmv_pct:+.1f}%" if price_vs_fmv_pct is not None else "N/A"
+        fresh_water = rec.fresh_water_gal
+        gray_water = rec.gray_water_gal
+        black_water = rec.black_water_gal
+
+        dealer_name = rec.dealer_name
+        dealer_distance = rec.dealer_distance_miles
+        dealer_rating = rec.dealer_rating
+        dealer_reviews = rec.dealer_review_count
+        key_features = rec.key_features
+        incentives = rec.incentives
+        negotiation_notes = rec.negotiation_notes
+        listing_url = rec.listing_url
+        phone = rec.phone
+        source = rec.source
+        days_on_market = rec.days_on_market
+        price_trend = rec.price_trend
+        confidence = rec.confidence
+
+        fmv_display = rec.fmv_display
+        pct_display = rec.pct_display
 
         # Format weight values
-        dry_weight_display = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else str(dry_weight)
-        gvwr_display = f"{gvwr:,}" if isinstance(gvwr, (int, float)) else str(gvwr)
+        dry_weight_display = rec.dry_weight_display
+        gvwr_display = rec.gvwr_display
 
         # Camper header
         pdf.set_font('Arial', 'B', 12)
@@ -1334,6 +1269,8 @@ def generate_pdf(data, output_path):
         pdf.cell(60, 6, latin_safe(f'vs FMV: {fmv_display} ({pct_display})'), 0, 0)
         pdf.cell(60, 6, latin_safe(f'Days on Market: {days_on_market}'), 0, 0)
         pdf.cell(60, 6, latin_safe(f'Confidence: {confidence}'), 0, 1)
+        if price_trend:
+            pdf.cell(0, 6, latin_safe(f'Price Trend: {price_trend}'), 0, 1)
         pdf.ln(2)
 
         # RV Specifications
@@ -1410,9 +1347,117 @@ def generate_pdf(data, output_path):
             pdf.ln(2)
 
         # Page break check
-        if pdf.get_y() > 250 and idx < len(listings) - 1:
+        if pdf.get_y() > 250 and idx < len(records) - 1:
             pdf.add_page()
 
+
+def generate_pdf(data, output_path, records=None):
+    """Generate PDF report from camper/RV inventory search data."""
+    from rok_export.pages import render_section
+
+    pdf = _new_inventory_pdf(data.get('search_params', {}))
+    pdf.add_page()
+
+    search_params = data.get('search_params', {})
+    market_context = data.get('market_context', {})
+    if records is None:
+        records = _ranked_records(data)
+    stats = market_stats(records, 'length_ft')
+    methodology = data.get('methodology', {})
+    generated_date = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
+
+    # Search Parameters section
+    pdf.set_font('Arial', 'B', 14)
+    pdf.set_text_color(180, 83, 9)  # AMBER_DARK
+    pdf.cell(0, 10, latin_safe('Search Parameters'), 0, 1)
+    pdf.ln(2)
+
+    pdf.set_font('Arial', '', 10)
+    pdf.set_text_color(0, 0, 0)
+
+    pdf.cell(90, 7, latin_safe(f'Year: {search_params.get("year", "N/A")}'), 0, 0)
+    pdf.cell(90, 7, latin_safe(f'Make: {search_params.get("make", "N/A")}'), 0, 1)
+    pdf.cell(90, 7, latin_safe(f'Model: {search_params.get("model", "N/A")}'), 0, 0)
+    pdf.cell(90, 7, latin_safe(f'Floorplan: {search_params.get("floorplan", "All")}'), 0, 1)
+    pdf.cell(90, 7, latin_safe(f'RV Type: {search_params.get("rv_type", "N/A")}'), 0, 0)
+    pdf.cell(90, 7, latin_safe(f'Condition: {search_params.get("condition", "N/A")}'), 0, 1)
+    max_price = search_params.get('max_price', 0)
+    pdf.cell(90, 7, latin_safe(f'Budget: ${max_price:,.0f}'), 0, 0)
+    pdf.cell(90, 7, latin_safe(f'Radius: {search_params.get("radius_miles", "N/A")} miles'), 0, 1)
+    pdf.cell(90, 7, latin_safe(f'Zip Code: {search_params.get("zip_code", "N/A")}'), 0, 0)
+    features = ', '.join(search_params.get('features', []))
+    pdf.cell(90, 7, latin_safe(f'Features: {features or "Any"}'), 0, 1)
+    pdf.ln(5)
+
+    # Summary stats
+    pdf.set_font('Arial', 'B', 14)
+    pdf.set_text_color(180, 83, 9)
+    pdf.cell(0, 10, latin_safe('Summary'), 0, 1)
+    pdf.ln(2)
+
+    pdf.set_font('Arial', '', 11)
+    pdf.set_text_color(0, 0, 0)
+
+    fmv_average = market_context.get('fmv_average') or stat_mean(stats, 'fmv')
+    unique_listings = market_context.get('unique_listings', 0)
+    radius = search_params.get('radius_miles', 'N/A')
+
+    pdf.cell(90, 8, latin_safe(f'Generated: {generated_date}'), 0, 0)
+    pdf.cell(90, 8, latin_safe(f'Listings Found: {unique_listings}'), 0, 1)
+    pdf.cell(90, 8, latin_safe(f'FMV Average: ${fmv_average:,.0f}'), 0, 0)
+    pdf.cell(90, 8, latin_safe(f'Search Radius: {radius} miles'), 0, 1)
+
+    if methodology:
+        pdf.cell(90, 8, latin_safe(f'Agents: {methodology.get("agents_dispatched", 0)}'), 0, 0)
+        pdf.cell(90, 8, latin_safe(f'Searches: {methodology.get("total_searches", 0)}'), 0, 1)
+
+    pdf.ln(10)
+
+    # Listings table
+    pdf.set_font('Arial', 'B', 14)
+    pdf.set_text_color(180, 83, 9)
+    pdf.cell(0, 10, latin_safe('Listings'), 0, 1)
+    pdf.ln(2)
+
+    # Table header
+    pdf.set_font('Arial', 'B', 8)
+    pdf.set_fill_color(217, 119, 6)  # AMBER
+    pdf.set_text_color(255, 255, 255)
+    pdf.cell(10, 8, '#', 1, 0, 'C', True)
+    pdf.cell(40, 8, 'Camper', 1, 0, 'C', True)
+    pdf.cell(22, 8, 'Deal', 1, 0, 'C', True)
+    pdf.cell(22, 8, 'Price', 1, 0, 'C', True)
+    pdf.cell(20, 8, 'vs FMV', 1, 0, 'C', True)
+    pdf.cell(30, 8, 'Specs', 1, 0, 'C', True)
+    pdf.cell(36, 8, 'Dealer', 1, 1, 'C', True)
+
+    # Table rows
+    pdf.set_font('Arial', '', 8)
+    pdf.set_text_color(0, 0, 0)
+
+    for rec in records:
+        rank = rec.rank
+        camper_name = rec.name
+        deal_display = rec.deal_display
+        price = rec.price
+        dealer_name = rec.dealer_name
+        specs_display = rec.specs_compact
+
+        fmv_display = rec.fmv_display
+
+        pdf.cell(10, 8, str(rank), 1, 0, 'C')
+        pdf.cell(40, 8, latin_safe(camper_name[:24]), 1, 0)
+        pdf.cell(22, 8, latin_safe(deal_display[:12]), 1, 0, 'C')
+        pdf.cell(22, 8, latin_safe(f'${price:,.0f}'), 1, 0, 'C')
+        pdf.cell(20, 8, latin_safe(fmv_display), 1, 0, 'C')
+        pdf.cell(30, 8, latin_safe(specs_display[:18]), 1, 0, 'C')
+        pdf.cell(36, 8, latin_safe(dealer_name[:22]), 1, 1)
+
+    pdf.ln(10)
+
+    # Detailed sections, rendered in chunks across worker processes (see rok_export.pages)
+    render_section(pdf, partial(_new_inventory_pdf, search_params), _pdf_listing_details, records)
+
     # Market Context page
     if market_context:
         pdf.add_page()
@@ -1424,8 +1469,8 @@ def generate_pdf(data, output_path):
         pdf.set_font('Arial', '', 10)
         pdf.set_text_color(0, 0, 0)
 
-        fmv_average = market_context.get('fmv_average', 0)
-        avg_asking = market_context.get('average_asking', 0)
+        fmv_average = market_context.get('fmv_average') or stat_mean(stats, 'fmv')
+        avg_asking = market_context.get('average_asking') or stat_mean(stats, 'price')
         total_listings = market_context.get('total_listings_found', 0)
         unique_listings = market_context.get('unique_listings', 0)
         market_trend = market_context.get('market_trend', 'N/A')
@@ -1502,6 +1547,26 @@ def generate_pdf(data, output_path):
                 pdf.cell(5, 5, '', 0, 0)
                 pdf.cell(0, 5, latin_safe(f'- {inc}'), 0, 1)
 
+    # Market Statistics (computed from the listings)
+    stat_items = stat_rows(stats, ('foot', 'ft'))
+    if stat_items:
+        if market_context:
+            pdf.ln(5)
+        else:
+            pdf.add_page()
+        pdf.set_font('Arial', 'B', 14)
+        pdf.set_text_color(180, 83, 9)
+        pdf.cell(0, 10, latin_safe('Market Statistics'), 0, 1)
+        pdf.ln(5)
+
+        pdf.set_text_color(0, 0, 0)
+        for label, value in stat_items:
+            pdf.set_font('Arial', 'B', 10)
+            pdf.cell(0, 6, latin_safe(f'{label}:'), 0, 1)
+            pdf.set_font('Arial', '', 10)
+            pdf.multi_cell(0, 5, latin_safe(value))
+            pdf.ln(3)
+
     # Methodology section
     if methodology:
         pdf.ln(10)
@@ -1528,11 +1593,13 @@ def generate_pdf(data, output_path):
     pdf.output(output_path)
 
 
-def generate_markdown(data, output_path):
+def generate_markdown(data, output_path, records=None):
     """Generate Markdown report from camper/RV inventory search data."""
     search_params = data.get('search_params', {})
     market_context = data.get('market_context', {})
-    listings = data.get('listings', [])
+    if records is None:
+        records = _ranked_records(data)
+    stats = market_stats(records, 'length_ft')
     methodology = data.get('methodology', {})
     generated_date = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
 
@@ -1547,7 +1614,7 @@ def generate_markdown(data, output_path):
     zip_code = search_params.get('zip_code', 'N/A')
     features = ', '.join(search_params.get('features', []))
 
-    fmv_average = market_context.get('fmv_average', 0)
+    fmv_average = market_context.get('fmv_average') or stat_mean(stats, 'fmv')
     unique_listings = market_context.get('unique_listings', 0)
 
     title_parts = [str(year), make, model]
@@ -1589,7 +1656,7 @@ def generate_markdown(data, output_path):
 """
 
     if market_context:
-        avg_asking = market_context.get('average_asking', 0)
+        avg_asking = market_context.get('average_asking') or stat_mean(stats, 'price')
         market_trend = market_context.get('market_trend', 'N/A')
         best_time = market_context.get('best_time_insight', 'N/A')
         total_listings = market_context.get('total_listings_found', 0)
@@ -1623,6 +1690,12 @@ def generate_markdown(data, output_path):
             for inc in incentives_summary:
                 md += f"  - {inc}\n"
 
+    stat_items = stat_rows(stats, ('foot', 'ft'))
+    if stat_items:
+        md += "\n### Market Statistics\n\n"
+        for label, value in stat_items:
+            md += f"- **{label}:** {value}\n"
+
     md += """
 ---
 
@@ -1632,89 +1705,67 @@ def generate_markdown(data, output_path):
 |------|------|--------|-------|--------|-------|--------|--------|
 """
 
-    for listing in listings:
-        rank = listing.get('rank', 0)
-        deal_rating = listing.get('deal_rating', 'FAIR_PRICE')
-        deal_display = deal_rating.replace('_', ' ')
-        l_year = listing.get('year', '')
-        l_model = listing.get('model', '')
-        l_floorplan = listing.get('floorplan', '')
-        camper_name = f"{l_year} {l_model} {l_floorplan}".strip()
-        price = listing.get('price', 0)
-        price_vs_fmv = listing.get('price_vs_fmv', None)
-        dealer_name = listing.get('dealer_name', 'Unknown')
-        dealer_rating = listing.get('dealer_rating', 'N/A')
-        length_ft = listing.get('length_ft', '')
-        dry_weight = listing.get('dry_weight_lbs', '')
-        slides = listing.get('slides', '')
+    for rec in records:
+        rank = rec.rank
+        deal_display = rec.deal_display
+        l_floorplan = rec.floorplan
+        camper_name = rec.name
+        price = rec.price
+        dealer_name = rec.dealer_name
+        dealer_rating = rec.dealer_rating
+        specs_display = rec.specs_display
 
-        specs_parts = []
-        if length_ft:
-            specs_parts.append(f"{length_ft}ft")
-        if dry_weight:
-            wt = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else str(dry_weight)
-            specs_parts.append(f"{wt}lbs")
-        if slides is not None and slides != '':
-            specs_parts.append(f"{slides}sl")
-        specs_display = " / ".join(specs_parts) if specs_parts else "N/A"
-
-        fmv_display = format_price_diff(price_vs_fmv)
+        fmv_display = rec.fmv_display
 
         md += f"| {rank} | {deal_display} | {camper_name} | ${price:,.0f} | {fmv_display} | {specs_display} | {dealer_name} | {dealer_rating} |\n"
 
     md += "\n---\n\n## Detailed Analysis\n\n"
 
-    for listing in listings:
-        rank = listing.get('rank', 0)
-        l_year = listing.get('year', '')
-        l_make = listing.get('make', '')
-        l_model = listing.get('model', '')
-        l_floorplan = listing.get('floorplan', '')
-        l_rv_type = listing.get('rv_type', '')
-        camper_name = f"{l_year} {l_make} {l_model} {l_floorplan}".strip()
-        deal_rating = listing.get('deal_rating', 'FAIR_PRICE')
-        deal_display = deal_rating.replace('_', ' ')
-        composite = listing.get('composite_score', 0)
-        price = listing.get('price', 0)
-        msrp = listing.get('msrp', 0)
-        fmv = listing.get('fmv', 0)
-        price_vs_fmv = listing.get('price_vs_fmv', None)
-        price_vs_fmv_pct = listing.get('price_vs_fmv_pct', None)
-        exterior_color = listing.get('exterior_color', 'N/A')
-        mileage = listing.get('mileage', 'N/A')
-        stock_number = listing.get('stock_number', 'N/A')
+    for rec in records:
+        rank = rec.rank
+        l_floorplan = rec.floorplan
+        l_rv_type = rec.rv_type
+        camper_name = rec.full_name
+        deal_display = rec.deal_display
+        composite = rec.composite_score
+        price = rec.price
+        msrp = rec.msrp
+        fmv = rec.fmv
+        exterior_color = rec.exterior_color
+        mileage = rec.mileage
+        stock_number = rec.stock_number
 
         # RV specs
-        length_ft = listing.get('length_ft', 'N/A')
-        dry_weight = listing.get('dry_weight_lbs', 'N/A')
-        gvwr = listing.get('gvwr_lbs', 'N/A')
-        slides = listing.get('slides', 'N/A')
-        sleeping_capacity = listing.get('sleeping_capacity', 'N/A')
+        length_ft = rec.length_ft
+        slides = rec.slides
+        sleeping_capacity = rec.sleeping_capacity
 
         # Tank capacities
-        fresh_water = listing.get('fresh_water_gal', 'N/A')
-        gray_water = listing.get('gray_water_gal', 'N/A')
-        black_water = listing.get('black_water_gal', 'N/A')
-
-        dealer_name = listing.get('dealer_name', 'Unknown')
-        dealer_distance = listing.get('dealer_distance_miles', 'N/A')
-        dealer_rating = listing.get('dealer_rating', 'N/A')
-        dealer_reviews = listing.get('dealer_review_count', 'N/A')
-        key_features = listing.get('key_features', [])
-        incentives = listing.get('incentives', [])
-        negotiation_notes = listing.get('negotiation_notes', '')
-        listing_url = listing.get('listing_url', '')
-        phone = listing.get('phone', '')
-        source = listing.get('source', 'N/A')
-        days_on_market = listing.get('days_on_market', 'N/A')
-        confidence = listing.get('confidence', 'N/A')
-
-        fmv_display = format_price_diff(price_vs_fmv)
-        pct_display = f"{price_vs_fmv_pct:+.1f}%" if price_vs_fmv_pct is not None else "N/A"
+        fresh_water = rec.fresh_water_gal
+        gray_water = rec.gray_water_gal
+        black_water = rec.black_water_gal
+
+        dealer_name = rec.dealer_name
+        dealer_distance = rec.dealer_distance_miles
+        dealer_rating = rec.dealer_rating
+        dealer_reviews = rec.dealer_review_count
+        key_features = rec.key_features
+        incentives = rec.incentives
+        negotiation_notes = rec.negotiation_notes
+        listing_url = rec.listing_url
+        phone = rec.phone
+        source = rec.source
+        days_on_market = rec.days_on_market
+        price_trend = rec.price_trend
+        confidence = rec.confidence
+
+        fmv_display = rec.fmv_display
+        pct_display = rec.pct_display
+        trend_line = f"- Price Trend: {price_trend}\n" if price_trend else ""
 
         # Format weight values
-        dry_weight_display = f"{dry_weight:,}" if isinstance(dry_weight, (int, float)) else str(dry_weight)
-        gvwr_display = f"{gvwr:,}" if isinstance(gvwr, (int, float)) else str(gvwr)
+        dry_weight_display = rec.dry_weight_display
+        gvwr_display = rec.gvwr_display
 
         md += f"""### #{rank}. {camper_name}
 
@@ -1744,7 +1795,7 @@ def generate_markdown(data, output_path):
 - Exterior: {exterior_color}
 - Mileage: {mileage}
 - Days on Market: {days_on_market}
-- Stock #: {stock_number}
+{trend_line}- Stock #: {stock_number}
 
 **Dealer:**
 - {dealer_name} ({dealer_distance} miles)
@@ -1802,13 +1853,86 @@ def generate_markdown(data, output_path):
         f.write(md)
 
 
+def export_report(data, output_dir, workers=None, formats='all', force=False, profile=False, optimize_pdf=False, rank_weights=None, history_db=None):
+    """Render every requested format for one inventory and return the result dict."""
+    # Validate data type
+    if data.get('type') != 'camper_inventory':
+        print(f"Warning: Expected type 'camper_inventory', got '{data.get('type')}'", file=sys.stderr)
+
+    # Fill missing dealer distances from the local ZIP-centroid table (no-op without one)
+    data = fill_distances(data)
+
+    # Re-rank with caller-supplied weights; part of the payload, so cached outputs are keyed on them
+    if rank_weights:
+        data = dict(data, rank_weights=rank_weights)
+
+    # Annotate price trend / days on market from the cross-run listing history
+    if history_db:
+        history_db = os.path.expanduser(history_db)
+        data = annotate(history_db, 'camper', data)
+
+    # Normalize and rank the listings once; every format renders this list
+    records = _ranked_records(data)
+
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Generate filename base
+    search_params = data.get('search_params', {})
+    make_slug = snake_slug(search_params.get('make', 'unknown'), 'general')
+    model_slug = snake_slug(search_params.get('model', 'unknown'), 'general')
+    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
+    base_filename = f"camper_inventory_{make_slug}_{model_slug}_{date_str}"
+
+    jobs = [
+        ("html", partial(generate_html, records=records), os.path.join(output_dir, f"{base_filename}.html")),
+        ("pdf", partial(generate_pdf, records=records), os.path.join(output_dir, f"{base_filename}.pdf")),
+        ("md", partial(generate_markdown, records=records), os.path.join(output_dir, f"{base_filename}.md")),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+    # Record the listings, unless every format was a cache hit: the same snapshot is already in the history
+    if history_db and not all(info['metrics'].get('cached') for info in timings.values()):
+        record_history(history_db, 'camper', data)
+    result = summarize(timings)
+    result["output_folder"] = output_dir
+    return result
+
+
+def export_file(input_path, output_dir, workers=1, formats='all', force=False, profile=False, optimize_pdf=False, rank_weights=None, history_db=None):
+    """Load one inventory JSON file and export it (batch mode entry point)."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf, rank_weights=rank_weights, history_db=history_db)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Export Camper/RV Inventory Search to HTML, PDF, and Markdown')
-    parser.add_argument('--input', required=True, help='Path to inventory JSON file')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='Path to inventory JSON file')
+    source.add_argument('--inputs', help='Glob or manifest of JSON files to export in one batch (prints JSON lines)')
     parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel render processes (1 = serial)')
+    parser.add_argument('--formats', default='all', type=formats_arg(['html', 'pdf', 'md']), help='Export formats: all, html, pdf, md (comma-separated)')
+    parser.add_argument('--force', action='store_true', help='Re-render even if outputs are current for this input')
+    parser.add_argument('--profile', action='store_true', help='Profile each render (cProfile + tracemalloc) and write {stem}.profile.json')
+    parser.add_argument('--optimize-pdf', action='store_true', help='Recompress and deduplicate PDF output; report bytes before/after in the result')
+    parser.add_argument('--rank-weights', help='Re-rank listings by weighted criteria, e.g. score=2,fmv=1,distance=0.5,rating=0.5')
+    parser.add_argument('--history-db', help='SQLite listing history: record this run and annotate price trend / days on market')
 
     args = parser.parse_args()
 
+    rank_weights = None
+    if args.rank_weights:
+        try:
+            rank_weights = parse_weights(args.rank_weights)
+        except ValueError as e:
+            parser.error(f"--rank-weights: {e}")
+
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf, rank_weights=rank_weights, history_db=args.history_db))
+
     # Read input JSON
     try:
         with open(args.input, 'r', encoding='utf-8') as f:
@@ -1820,42 +1944,10 @@ def main():
         print(f"Error: Invalid JSON in input file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Validate data type
-    if data.get('type') != 'camper_inventory':
-        print(f"Warning: Expected type 'camper_inventory', got '{data.get('type')}'", file=sys.stderr)
-
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    # Generate filename base
-    search_params = data.get('search_params', {})
-    make_slug = slugify(search_params.get('make', 'unknown'))
-    model_slug = slugify(search_params.get('model', 'unknown'))
-    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
-    base_filename = f"camper_inventory_{make_slug}_{model_slug}_{date_str}"
-
-    # Generate outputs
+    # Generate outputs (formats render in parallel worker processes) and print the JSON result
     try:
-        html_path = os.path.join(args.output_dir, f"{base_filename}.html")
-        print(f"Generating HTML: {html_path}")
-        generate_html(data, html_path)
-        print(f"  HTML generated successfully")
-
-        pdf_path = os.path.join(args.output_dir, f"{base_filename}.pdf")
-        print(f"Generating PDF: {pdf_path}")
-        generate_pdf(data, pdf_path)
-        print(f"  PDF generated successfully")
-
-        md_path = os.path.join(args.output_dir, f"{base_filename}.md")
-        print(f"Generating Markdown: {md_path}")
-        generate_markdown(data, md_path)
-        print(f"  Markdown generated successfully")
-
-        print("\nExport complete!")
-        print(f"\nOutput files:")
-        print(f"  - {html_path}")
-        print(f"  - {pdf_path}")
-        print(f"  - {md_path}")
+        result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf, rank_weights=rank_weights, history_db=args.history_db)
+        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error during export: {e}", file=sys.stderr)
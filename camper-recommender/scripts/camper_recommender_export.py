@@ -5,6 +5,10 @@ Generates HTML, PDF, and Markdown files from camper/RV recommendations JSON.
 
 Usage:
     python3 camper_recommender_export.py --input recommendations.json
+    python3 camper_recommender_export.py --input data.json --formats html   # skip the PDF backend
+    python3 camper_recommender_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 camper_recommender_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 camper_recommender_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 """
 
 import sys
@@ -12,16 +16,23 @@ import os
 import json
 import argparse
 from datetime import datetime
-import re
 
-# Add virtual environment to Python path
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.html import HtmlStream
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.text import latin_safe_drop as latin_safe, snake_slug
 
 # Color scheme (purple-based)
 PURPLE = "#8B5CF6"
@@ -38,22 +49,6 @@ TIER_COLORS = {
 DEFAULT_OUTPUT_DIR = "/mnt/c/Users/RonKlatt_3qsjg34/Desktop/Claude Code Plugin Output/Camper_Recommendations/"
 
 
-def latin_safe(text):
-    """Convert text to Latin-1 safe string for PDF output."""
-    if text is None:
-        return ""
-    return str(text).encode('latin-1', 'ignore').decode('latin-1')
-
-
-def slugify(text):
-    """Convert text to URL-safe slug."""
-    if not text:
-        return "general"
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '_', text)
-    return text.strip('_')
-
-
 def score_color(score):
     """Return color based on score value."""
     if score >= 85:
@@ -68,6 +63,12 @@ def score_color(score):
 
 def generate_html(data, output_path):
     """Generate HTML report from camper/RV recommendations data."""
+    with HtmlStream(output_path) as out:
+        _write_html(data, out)
+
+
+def _write_html(data, out):
+    """Stream the HTML report to ``out`` section by section."""
     profile = data.get('requirements_profile', {})
     camper_type = profile.get('camper_type', 'Camper/RV')
     rv_type = profile.get('rv_type', '')
@@ -82,7 +83,7 @@ def generate_html(data, output_path):
     must_haves = ', '.join(profile.get('must_haves', []))
     priorities = ', '.join(profile.get('priorities', []))
 
-    html = f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -587,7 +588,7 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
     # Add table rows
     for rec in recommendations:
@@ -605,7 +606,7 @@ def generate_html(data, output_path):
 
         tier_style = f"background: {TIER_COLORS.get(tier, TIER_COLORS['CONSIDER'])['bg']}; color: {TIER_COLORS.get(tier, TIER_COLORS['CONSIDER'])['text']};"
 
-        html += f"""
+        out.write(f"""
                         <tr>
                             <td class="rank">#{rank}</td>
                             <td><strong>{name}</strong></td>
@@ -626,16 +627,16 @@ def generate_html(data, output_path):
                             <td>{year}</td>
                             <td>{msrp}</td>
                         </tr>
-"""
+""")
 
-    html += """
+    out.write("""
                     </tbody>
                 </table>
             </div>
 
             <div class="section">
                 <h2 class="section-title">Detailed Analysis</h2>
-"""
+""")
 
     # Add detailed camper cards
     for rec in recommendations:
@@ -667,7 +668,7 @@ def generate_html(data, output_path):
 
         tier_style = f"background: {TIER_COLORS.get(tier, TIER_COLORS['CONSIDER'])['bg']}; color: {TIER_COLORS.get(tier, TIER_COLORS['CONSIDER'])['text']};"
 
-        html += f"""
+        out.write(f"""
                 <div class="camper-card">
                     <div class="camper-card-header">
                         <div class="camper-title">#{rank}. {name}</div>
@@ -675,14 +676,14 @@ def generate_html(data, output_path):
                             <span class="tier-badge" style="{tier_style}">{tier}</span>
                         </div>
                     </div>
-"""
+""")
 
         if floorplan_rec:
-            html += f"""
+            out.write(f"""
                     <div class="floorplan-rec">{floorplan_rec}</div>
-"""
+""")
 
-        html += f"""
+        out.write(f"""
                     <div class="detail-grid">
                         <div class="detail-item">
                             <div class="detail-label">Composite Score</div>
@@ -726,11 +727,11 @@ def generate_html(data, output_path):
                             <div class="detail-value">{sleeping_capacity}</div>
                         </div>
                     </div>
-"""
+""")
 
         # Weight and towing compatibility section
         if dry_weight != 'N/A' or gvwr != 'N/A' or length_ft != 'N/A' or slides != 'N/A':
-            html += f"""
+            out.write(f"""
                     <div class="weight-towing-box">
                         <h4>Weight &amp; Dimensions</h4>
                         <div class="weight-grid">
@@ -752,7 +753,7 @@ def generate_html(data, output_path):
                             </div>
                         </div>
                     </div>
-"""
+""")
 
         # Tank capacities section (if available)
         if tank_capacities:
@@ -761,7 +762,7 @@ def generate_html(data, output_path):
             black = tank_capacities.get('black_water', 'N/A')
             propane = tank_capacities.get('propane', 'N/A')
 
-            html += f"""
+            out.write(f"""
                     <div class="tank-info">
                         <h4>Tank Capacities</h4>
                         <div class="tank-grid">
@@ -783,10 +784,10 @@ def generate_html(data, output_path):
                             </div>
                         </div>
                     </div>
-"""
+""")
 
         if tco != 'N/A' or resale != 'N/A':
-            html += f"""
+            out.write(f"""
                     <div class="detail-grid">
                         <div class="detail-item">
                             <div class="detail-label">TCO (5yr)</div>
@@ -797,157 +798,157 @@ def generate_html(data, output_path):
                             <div class="detail-value">{resale}</div>
                         </div>
                     </div>
-"""
+""")
 
         if pros or cons:
-            html += """
+            out.write("""
                     <div class="pros-cons">
-"""
+""")
             if pros:
-                html += """
+                out.write("""
                         <div class="pros">
                             <h4>Strengths</h4>
                             <ul>
-"""
+""")
                 for p in pros:
-                    html += f"                                <li>{p}</li>\n"
-                html += """
+                    out.write(f"                                <li>{p}</li>\n")
+                out.write("""
                             </ul>
                         </div>
-"""
+""")
             if cons:
-                html += """
+                out.write("""
                         <div class="cons">
                             <h4>Weaknesses</h4>
                             <ul>
-"""
+""")
                 for c in cons:
-                    html += f"                                <li>{c}</li>\n"
-                html += """
+                    out.write(f"                                <li>{c}</li>\n")
+                out.write("""
                             </ul>
                         </div>
-"""
-            html += """
+""")
+            out.write("""
                     </div>
-"""
+""")
 
         if sources:
             sources_str = ', '.join(sources)
-            html += f"""
+            out.write(f"""
                     <div style="margin-bottom: 1rem;">
                         <div class="detail-label" style="margin-bottom: 0.3rem;">Key Sources</div>
                         <div style="color: #6b7280; font-size: 0.9rem;">{sources_str}</div>
                     </div>
-"""
+""")
 
         if finder_prompt:
-            html += f"""
+            out.write(f"""
                     <div class="finder-prompt">
                         <div class="finder-prompt-title">Ready-to-Paste Finder Prompt</div>
                         <code>{finder_prompt}</code>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
-"""
+""")
 
-    html += """
+    out.write("""
             </div>
-"""
+""")
 
     # Themes section
     if themes:
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Segment Insights</h2>
                 <div class="themes-section">
-"""
+""")
 
         if themes.get('segment_insight'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Segment Insight</div>
                         <div class="theme-value">{themes['segment_insight']}</div>
                     </div>
-"""
+""")
 
         if themes.get('best_value'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Best Value</div>
                         <div class="theme-value">{themes['best_value']}</div>
                     </div>
-"""
+""")
 
         if themes.get('quality_leader'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Quality Leader</div>
                         <div class="theme-value">{themes['quality_leader']}</div>
                     </div>
-"""
+""")
 
         if themes.get('rising_star'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Rising Star</div>
                         <div class="theme-value">{themes['rising_star']}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
     # Methodology section
     if methodology:
-        html += """
+        out.write("""
             <div class="methodology">
                 <h3 style="margin-bottom: 1rem; color: #1f2937;">Methodology</h3>
                 <div class="methodology-grid">
-"""
+""")
 
         if methodology.get('agents_dispatched'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Agents Dispatched</div>
                         <div class="detail-value">{methodology['agents_dispatched']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('total_searches'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Total Searches</div>
                         <div class="detail-value">{methodology['total_searches']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('depth'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Research Depth</div>
                         <div class="detail-value">{methodology['depth'].upper()}</div>
                     </div>
-"""
+""")
 
         if methodology.get('sources_covered'):
             sources = ', '.join(methodology['sources_covered'])
-            html += f"""
+            out.write(f"""
                     <div class="detail-item" style="grid-column: 1 / -1;">
                         <div class="detail-label">Sources Covered</div>
                         <div class="detail-value">{sources}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
             <div class="footer">
                 Generated by Camper Recommender on {generated_date}<br>
                 ROK Plugin Marketplace - Camper Recommender v1.0
@@ -956,14 +957,12 @@ def generate_html(data, output_path):
     </div>
 </body>
 </html>
-"""
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+""")
 
 
 def generate_pdf(data, output_path):
     """Generate PDF report from camper/RV recommendations data."""
+    from fpdf import FPDF
 
     class CamperPDF(FPDF):
         def header(self):
@@ -1441,13 +1440,58 @@ def generate_markdown(data, output_path):
         f.write(md)
 
 
+def export_report(data, output_dir, workers=None, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Render every requested format for one recommendation set and return the result dict."""
+    # Validate data type
+    if data.get('type') != 'camper_recommendations':
+        print(f"Warning: Expected type 'camper_recommendations', got '{data.get('type')}'", file=sys.stderr)
+
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Generate filename base
+    req_profile = data.get('requirements_profile', {})
+    type_text = req_profile.get('camper_type', 'general')
+    type_slug = snake_slug(type_text, 'general')
+    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
+    base_filename = f"camper_recs_{type_slug}_{date_str}"
+
+    jobs = [
+        ("html", generate_html, os.path.join(output_dir, f"{base_filename}.html")),
+        ("pdf", generate_pdf, os.path.join(output_dir, f"{base_filename}.pdf")),
+        ("md", generate_markdown, os.path.join(output_dir, f"{base_filename}.md")),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    result = summarize(timings)
+    result["output_folder"] = output_dir
+    return result
+
+
+def export_file(input_path, output_dir, workers=1, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Load one recommendation set JSON file and export it (batch mode entry point)."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Export Camper/RV Recommendations to HTML, PDF, and Markdown')
-    parser.add_argument('--input', required=True, help='Path to recommendations JSON file')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='Path to recommendations JSON file')
+    source.add_argument('--inputs', help='Glob or manifest of JSON files to export in one batch (prints JSON lines)')
     parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel render processes (1 = serial)')
+    parser.add_argument('--formats', default='all', type=formats_arg(['html', 'pdf', 'md']), help='Export formats: all, html, pdf, md (comma-separated)')
+    parser.add_argument('--force', action='store_true', help='Re-render even if outputs are current for this input')
+    parser.add_argument('--profile', action='store_true', help='Profile each render (cProfile + tracemalloc) and write {stem}.profile.json')
+    parser.add_argument('--optimize-pdf', action='store_true', help='Recompress and deduplicate PDF output; report bytes before/after in the result')
 
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     # Read input JSON
     try:
         with open(args.input, 'r', encoding='utf-8') as f:
@@ -1459,42 +1503,10 @@ def main():
         print(f"Error: Invalid JSON in input file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Validate data type
-    if data.get('type') != 'camper_recommendations':
-        print(f"Warning: Expected type 'camper_recommendations', got '{data.get('type')}'", file=sys.stderr)
-
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    # Generate filename base
-    profile = data.get('requirements_profile', {})
-    type_text = profile.get('camper_type', 'general')
-    type_slug = slugify(type_text)
-    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
-    base_filename = f"camper_recs_{type_slug}_{date_str}"
-
-    # Generate outputs
+    # Generate outputs (formats render in parallel worker processes) and print the JSON result
     try:
-        html_path = os.path.join(args.output_dir, f"{base_filename}.html")
-        print(f"Generating HTML: {html_path}")
-        generate_html(data, html_path)
-        print(f"  HTML generated successfully")
-
-        pdf_path = os.path.join(args.output_dir, f"{base_filename}.pdf")
-        print(f"Generating PDF: {pdf_path}")
-        generate_pdf(data, pdf_path)
-        print(f"  PDF generated successfully")
-
-        md_path = os.path.join(args.output_dir, f"{base_filename}.md")
-        print(f"Generating Markdown: {md_path}")
-        generate_markdown(data, md_path)
-        print(f"  Markdown generated successfully")
-
-        print("\nExport complete!")
-        print(f"\nOutput files:")
-        print(f"  - {html_path}")
-        print(f"  - {pdf_path}")
-        print(f"  - {md_path}")
+        result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
+        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error during export: {e}", file=sys.stderr)
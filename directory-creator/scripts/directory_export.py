@@ -5,6 +5,10 @@ Generates CSV, Excel, PDF, and HTML files from directory data JSON.
 
 Usage:
     python3 directory_export.py --input /tmp/directory_data.json
+    python3 directory_export.py --input data.json --formats csv,html   # skip the PDF and Excel backends
+    python3 directory_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 directory_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 directory_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 """
 
 import sys
@@ -12,21 +16,25 @@ import os
 import json
 import argparse
 import csv
+import heapq
 from datetime import datetime
-import re
 
-# Add virtual environment to Python path
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
-from fpdf.enums import XPos, YPos
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.html import HtmlStream
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.text import latin_safe_drop as latin_safe, snake_slug
 
 # Color scheme
 TEAL = "#0D9488"
@@ -41,6 +49,8 @@ STATUS_COLORS = {
 
 DEFAULT_OUTPUT_DIR = "/mnt/c/Users/RonKlatt_3qsjg34/Desktop/Claude Code Plugin Output/Directory_Creator/"
 
+PDF_TOP_LISTINGS = 50
+
 CSV_COLUMNS = [
     "name", "slug", "category", "description", "address", "city", "state",
     "zip_code", "phone", "email", "website", "hours", "service_radius",
@@ -50,20 +60,6 @@ CSV_COLUMNS = [
 ]
 
 
-def latin_safe(text):
-    if text is None:
-        return ""
-    return str(text).encode('latin-1', 'ignore').decode('latin-1')
-
-
-def slugify(text):
-    if not text:
-        return "directory"
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '_', text)
-    return text.strip('_')
-
-
 def score_color(score):
     if score >= 70:
         return "#059669"
@@ -100,11 +96,15 @@ def generate_csv(data, output_path):
         for biz in businesses:
             writer.writerow(flatten_business(biz))
 
-    print(f"  CSV: {len(businesses)} listings exported")
+    print(f"  CSV: {len(businesses)} listings exported", file=sys.stderr)
 
 
 def generate_excel(data, output_path):
     """Generate multi-sheet Excel workbook."""
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.utils import get_column_letter
+
     wb = Workbook()
     businesses = data.get("businesses", [])
     active_businesses = [b for b in businesses if b.get("status") != "removed"]
@@ -263,13 +263,15 @@ def generate_excel(data, output_path):
     ws4.column_dimensions['D'].width = 12
 
     wb.save(output_path)
-    print(f"  Excel: 4 sheets ({len(active_businesses)} listings)")
+    print(f"  Excel: 4 sheets ({len(active_businesses)} listings)", file=sys.stderr)
 
 
 def generate_pdf(data, output_path):
     """Generate PDF summary report."""
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+
     directory_name = data.get("directory_name", "Business Directory")
-    businesses = [b for b in data.get("businesses", []) if b.get("status") != "removed"]
     stats = data.get("statistics", {})
 
     class DirectoryPDF(FPDF):
@@ -346,7 +348,10 @@ def generate_pdf(data, output_path):
     pdf.set_font('Helvetica', '', 7)
     pdf.set_text_color(0, 0, 0)
 
-    top = sorted(businesses, key=lambda x: x.get("quality_score", 0), reverse=True)[:50]
+    # Only the top listings are drawn, so the PDF is the same size for any directory;
+    # select them with a heap rather than copying and sorting every listing
+    active = (b for b in data.get("businesses", []) if b.get("status") != "removed")
+    top = heapq.nlargest(PDF_TOP_LISTINGS, active, key=lambda x: x.get("quality_score", 0))
     for idx, biz in enumerate(top, 1):
         vals = [
             str(idx),
@@ -375,11 +380,17 @@ def generate_pdf(data, output_path):
             pdf.set_text_color(0, 0, 0)
 
     pdf.output(output_path)
-    print(f"  PDF: {len(top)} top listings")
+    print(f"  PDF: {len(top)} top listings", file=sys.stderr)
 
 
 def generate_html(data, output_path):
     """Generate styled HTML directory preview with filterable table."""
+    with HtmlStream(output_path) as out:
+        _write_html(data, out)
+
+
+def _write_html(data, out):
+    """Stream the HTML report to ``out`` section by section."""
     directory_name = data.get("directory_name", "Business Directory")
     businesses = [b for b in data.get("businesses", []) if b.get("status") != "removed"]
     stats = data.get("statistics", {})
@@ -388,7 +399,7 @@ def generate_html(data, output_path):
     generated_date = data.get("generated_date", datetime.now().strftime("%Y-%m-%d"))
     depth = data.get("depth", "standard").upper()
 
-    html = f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -479,13 +490,13 @@ def generate_html(data, output_path):
                 </select>
                 <select id="categoryFilter" onchange="filterTable()">
                     <option value="">All Categories</option>
-"""
+""")
 
     categories = sorted(set(b.get("category", "Uncategorized") or "Uncategorized" for b in businesses))
     for cat in categories:
-        html += f'                    <option value="{cat}">{cat}</option>\n'
+        out.write(f'                    <option value="{cat}">{cat}</option>\n')
 
-    html += """                </select>
+    out.write("""                </select>
             </div>
             <table id="directoryTable">
                 <thead>
@@ -502,7 +513,7 @@ def generate_html(data, output_path):
                     </tr>
                 </thead>
                 <tbody>
-"""
+""")
 
     sorted_biz = sorted(businesses, key=lambda x: x.get("quality_score", 0), reverse=True)
     for idx, biz in enumerate(sorted_biz, 1):
@@ -519,7 +530,7 @@ def generate_html(data, output_path):
         status_class = f"status-{status}" if status else ""
         sc = score_color(score)
 
-        html += f"""                    <tr data-category="{category}" data-status="{status}">
+        out.write(f"""                    <tr data-category="{category}" data-status="{status}">
                         <td>{idx}</td>
                         <td>{name_cell}</td>
                         <td>{category}</td>
@@ -530,9 +541,9 @@ def generate_html(data, output_path):
                         <td>{score} <span class="score-bar"><span class="score-fill" style="width:{score}%;background:{sc};"></span></span></td>
                         <td><span class="status {status_class}">{status.replace('_', ' ')}</span></td>
                     </tr>
-"""
+""")
 
-    html += f"""                </tbody>
+    out.write(f"""                </tbody>
             </table>
         </div>
     </div>
@@ -577,21 +588,59 @@ function sortTable(colIdx) {{
 }}
 </script>
 </body>
-</html>"""
+</html>""")
+
+    print(f"  HTML: {len(businesses)} listings with filtering", file=sys.stderr)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
 
-    print(f"  HTML: {len(businesses)} listings with filtering")
+def export_report(data, output_dir, workers=None, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Render every requested format for one directory and return the result dict."""
+    if data.get('type') != 'directory_data':
+        print(f"Warning: Expected type 'directory_data', got '{data.get('type')}'", file=sys.stderr)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    name_slug = snake_slug(data.get("directory_name", "directory"), "directory")
+    date_str = data.get("generated_date", datetime.now().strftime("%Y-%m-%d"))
+    base = f"directory_{name_slug}_{date_str}"
+
+    jobs = [
+        ("csv", generate_csv, os.path.join(output_dir, f"{base}.csv")),
+        ("xlsx", generate_excel, os.path.join(output_dir, f"{base}.xlsx")),
+        ("pdf", generate_pdf, os.path.join(output_dir, f"{base}.pdf")),
+        ("html", generate_html, os.path.join(output_dir, f"{base}.html")),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    result = summarize(timings)
+    result["output_folder"] = output_dir
+    return result
+
+
+def export_file(input_path, output_dir, workers=1, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Load one directory JSON file and export it (batch mode entry point)."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
 
 
 def main():
     parser = argparse.ArgumentParser(description='Export directory data to CSV, Excel, PDF, and HTML')
-    parser.add_argument('--input', required=True, help='Path to directory_data.json')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='Path to directory_data.json')
+    source.add_argument('--inputs', help='Glob or manifest of JSON files to export in one batch (prints JSON lines)')
     parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel render processes (1 = serial)')
+    parser.add_argument('--formats', default='all', type=formats_arg(['csv', 'xlsx', 'pdf', 'html']), help='Export formats: all, csv, xlsx, pdf, html (comma-separated)')
+    parser.add_argument('--force', action='store_true', help='Re-render even if outputs are current for this input')
+    parser.add_argument('--profile', action='store_true', help='Profile each render (cProfile + tracemalloc) and write {stem}.profile.json')
+    parser.add_argument('--optimize-pdf', action='store_true', help='Recompress and deduplicate PDF output; report bytes before/after in the result')
 
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     try:
         with open(args.input, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -602,38 +651,9 @@ def main():
         print(f"Error: Invalid JSON: {e}", file=sys.stderr)
         sys.exit(1)
 
-    if data.get('type') != 'directory_data':
-        print(f"Warning: Expected type 'directory_data', got '{data.get('type')}'", file=sys.stderr)
-
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    name_slug = slugify(data.get("directory_name", "directory"))
-    date_str = data.get("generated_date", datetime.now().strftime("%Y-%m-%d"))
-    base = f"directory_{name_slug}_{date_str}"
-
     try:
-        csv_path = os.path.join(args.output_dir, f"{base}.csv")
-        print(f"Generating CSV: {csv_path}")
-        generate_csv(data, csv_path)
-
-        xlsx_path = os.path.join(args.output_dir, f"{base}.xlsx")
-        print(f"Generating Excel: {xlsx_path}")
-        generate_excel(data, xlsx_path)
-
-        pdf_path = os.path.join(args.output_dir, f"{base}.pdf")
-        print(f"Generating PDF: {pdf_path}")
-        generate_pdf(data, pdf_path)
-
-        html_path = os.path.join(args.output_dir, f"{base}.html")
-        print(f"Generating HTML: {html_path}")
-        generate_html(data, html_path)
-
-        print(f"\nExport complete!")
-        print(f"\nOutput files:")
-        print(f"  - {csv_path}")
-        print(f"  - {xlsx_path}")
-        print(f"  - {pdf_path}")
-        print(f"  - {html_path}")
+        result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
+        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error during export: {e}", file=sys.stderr)
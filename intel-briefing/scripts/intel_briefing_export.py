@@ -6,6 +6,10 @@ Usage:
     python3 intel_briefing_export.py --input /tmp/intel_briefing_export.json
     python3 intel_briefing_export.py --input data.json --output-dir /custom/path/
     python3 intel_briefing_export.py --input data.json --type predictions
+    python3 intel_briefing_export.py --input data.json --formats html   # skip the PDF backend
+    python3 intel_briefing_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 intel_briefing_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 intel_briefing_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 
 Input: JSON payload from briefing-synthesizer agent or command output
 Output: .html, .pdf, .md in {output_dir}/Intel-Briefings/ folder
@@ -16,18 +20,26 @@ Supported types: briefing, predictions, accuracy
 import argparse
 import json
 import os
-import re
 import sys
 from datetime import date
+from functools import lru_cache
 
-# Use venv packages
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.tables import draw_table
+from rok_export.text import escape_html, slugify
 
 # -- Constants ----------------------------------------------------------------
 
@@ -80,14 +92,6 @@ OUTCOME_COLORS = {
 
 # -- Helpers ------------------------------------------------------------------
 
-def slugify(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^\w\s-]", "", s)
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"-+", "-", s)
-    return s[:60].strip("-") or "untitled"
-
-
 def compute_paths(data: dict, output_dir: str):
     report_type = data.get("type", "briefing")
     d = data.get("date", date.today().isoformat())
@@ -113,24 +117,6 @@ def compute_paths(data: dict, output_dir: str):
     }
 
 
-def escape_html(s) -> str:
-    return (str(s).replace("&", "&amp;")
-                  .replace("<", "&lt;")
-                  .replace(">", "&gt;")
-                  .replace('"', "&quot;"))
-
-
-def latin_safe(s: str) -> str:
-    replacements = {
-        "\u2014": "--", "\u2013": "-", "\u2018": "'", "\u2019": "'",
-        "\u201c": '"', "\u201d": '"', "\u2026": "...", "\u2022": "*",
-        "\u00a0": " ", "\u200b": "", "\u2713": "[x]", "\u2717": "[ ]",
-    }
-    for char, repl in replacements.items():
-        s = s.replace(char, repl)
-    return s.encode("latin-1", errors="replace").decode("latin-1")
-
-
 def confidence_label(score):
     try:
         score = float(score)
@@ -659,84 +645,67 @@ def generate_accuracy_html(data: dict, output_path: str):
 
 # -- PDF Generation ----------------------------------------------------------
 
-class IntelPDF(FPDF):
-    def __init__(self):
-        super().__init__()
-        self.set_auto_page_break(auto=True, margin=20)
-
-    def header(self):
-        self.set_fill_color(*NAVY_RGB)
-        self.rect(0, 0, 210, 18, "F")
-        self.set_font("Helvetica", "B", 10)
-        self.set_text_color(255, 255, 255)
-        self.set_y(4)
-        self.cell(0, 10, "INTEL-BRIEFING", ln=True, align="L")
-        self.set_text_color(*TEAL_RGB)
-        self.set_font("Helvetica", "", 8)
-        self.cell(0, 5, "Intelligence Analysis & Forecasting", ln=True, align="L")
-        self.ln(8)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Helvetica", "I", 8)
-        self.set_text_color(100, 116, 139)
-        self.cell(0, 10, f"Intel-Briefing v1.0 | Page {self.page_no()}", align="C")
-
-    def section_title(self, title: str):
-        self.set_font("Helvetica", "B", 14)
-        self.set_text_color(*NAVY_RGB)
-        self.cell(0, 10, latin_safe(title), ln=True)
-        self.set_draw_color(*TEAL_RGB)
-        self.set_line_width(0.5)
-        self.line(10, self.get_y(), 200, self.get_y())
-        self.ln(4)
-
-    def sub_title(self, title: str):
-        self.set_font("Helvetica", "B", 11)
-        self.set_text_color(44, 82, 130)
-        self.cell(0, 8, latin_safe(title), ln=True)
-        self.ln(2)
-
-    def body_text(self, text: str):
-        self.set_font("Helvetica", "", 10)
-        self.set_text_color(26, 32, 44)
-        self.multi_cell(0, 5, latin_safe(text))
-        self.ln(3)
-
-    def add_table(self, headers: list, rows: list, col_widths: list = None):
-        if not col_widths:
-            w = (self.w - 20) / len(headers)
-            col_widths = [w] * len(headers)
-
-        # Header
-        self.set_font("Helvetica", "B", 8)
-        self.set_fill_color(*NAVY_RGB)
-        self.set_text_color(255, 255, 255)
-        for i, h in enumerate(headers):
-            self.cell(col_widths[i], 7, latin_safe(h), 1, 0, "C", fill=True)
-        self.ln()
-
-        # Rows
-        self.set_font("Helvetica", "", 8)
-        self.set_text_color(26, 32, 44)
-        fill = False
-        for row in rows:
-            if self.get_y() > 265:
-                self.add_page()
-            if fill:
-                self.set_fill_color(247, 249, 252)
-            else:
-                self.set_fill_color(255, 255, 255)
-            max_h = 7
-            for i, cell_text in enumerate(row):
-                safe = latin_safe(str(cell_text))[:int(col_widths[i] / 1.8)]
-                self.cell(col_widths[i], max_h, safe, 1, 0, "L", fill=True)
-            self.ln()
-            fill = not fill
-        self.ln(4)
+@lru_cache(maxsize=None)
+def _pdf_class():
+    """Define IntelPDF on first use so fpdf is only imported when a PDF is requested."""
+    from rok_export.pdf import ReportPDF
+
+    class IntelPDF(ReportPDF):
+        def __init__(self):
+            super().__init__()
+            self.set_auto_page_break(auto=True, margin=20)
+
+        def header(self):
+            self.set_fill_color(*NAVY_RGB)
+            self.rect(0, 0, 210, 18, "F")
+            self.set_font("Helvetica", "B", 10)
+            self.set_text_color(255, 255, 255)
+            self.set_y(4)
+            self.cell(0, 10, "INTEL-BRIEFING", ln=True, align="L")
+            self.set_text_color(*TEAL_RGB)
+            self.set_font("Helvetica", "", 8)
+            self.cell(0, 5, "Intelligence Analysis & Forecasting", ln=True, align="L")
+            self.ln(8)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 8)
+            self.set_text_color(100, 116, 139)
+            self.cell(0, 10, f"Intel-Briefing v1.0 | Page {self.page_no()}", align="C")
+
+        def section_title(self, title: str):
+            self.set_font("Helvetica", "B", 14)
+            self.set_text_color(*NAVY_RGB)
+            self.cell(0, 10, title, ln=True)
+            self.set_draw_color(*TEAL_RGB)
+            self.set_line_width(0.5)
+            self.line(10, self.get_y(), 200, self.get_y())
+            self.ln(4)
+
+        def sub_title(self, title: str):
+            self.set_font("Helvetica", "B", 11)
+            self.set_text_color(44, 82, 130)
+            self.cell(0, 8, title, ln=True)
+            self.ln(2)
+
+        def body_text(self, text: str):
+            self.set_font("Helvetica", "", 10)
+            self.set_text_color(26, 32, 44)
+            self.multi_cell(0, 5, text)
+            self.ln(3)
+
+        def add_table(self, headers: list, rows: list, col_widths: list = None):
+            if not col_widths:
+                w = (self.w - 20) / len(headers)
+                col_widths = [w] * len(headers)
+            draw_table(self, headers, rows, col_widths, NAVY_RGB)
+            self.ln(4)
+
+    return IntelPDF
 
 
 def generate_briefing_pdf(data: dict, output_path: str):
+    IntelPDF = _pdf_class()
     pdf = IntelPDF()
     pdf.add_page()
 
@@ -766,11 +735,11 @@ def generate_briefing_pdf(data: dict, output_path: str):
             pdf.set_font("Helvetica", "B", 9)
             pdf.set_text_color(*NAVY_RGB)
             text = dev.get("development", "") if isinstance(dev, dict) else str(dev)
-            pdf.multi_cell(0, 5, latin_safe(f"* {text}"))
+            pdf.multi_cell(0, 5, f"* {text}")
             if isinstance(dev, dict) and dev.get("source"):
                 pdf.set_font("Helvetica", "I", 8)
                 pdf.set_text_color(100, 116, 139)
-                pdf.cell(0, 5, latin_safe(f"  Source: {dev['source']} | Impact: {dev.get('impact', 'N/A').upper()}"), ln=True)
+                pdf.cell(0, 5, f"  Source: {dev['source']} | Impact: {dev.get('impact', 'N/A').upper()}", ln=True)
             pdf.ln(2)
 
     # Financial Outlook
@@ -790,14 +759,14 @@ def generate_briefing_pdf(data: dict, output_path: str):
             pdf.sub_title("Sector Views")
             rows = [[sv.get("sector", ""), sv.get("outlook", "").upper(),
                       f"{float(sv.get('confidence', 0))*100:.0f}%",
-                      sv.get("rationale", "")[:60]] for sv in svs]
+                      sv.get("rationale", "")] for sv in svs]
             pdf.add_table(["Sector", "Outlook", "Conf.", "Key Factor"], rows,
                          [35, 25, 20, 110])
 
         preds = financial.get("predictions", [])
         if preds:
             pdf.sub_title("Financial Predictions")
-            rows = [[p.get("prediction", "")[:80], p.get("timeframe", ""),
+            rows = [[p.get("prediction", ""), p.get("timeframe", ""),
                       f"{float(p.get('confidence', 0))*100:.0f}%"] for p in preds]
             pdf.add_table(["Prediction", "Timeframe", "Confidence"], rows,
                          [120, 30, 40])
@@ -812,7 +781,7 @@ def generate_briefing_pdf(data: dict, output_path: str):
         risks = geopolitical.get("risk_matrix", [])
         if risks:
             pdf.sub_title("Risk Matrix")
-            rows = [[r.get("risk", "")[:60], r.get("probability", "").upper(),
+            rows = [[r.get("risk", ""), r.get("probability", "").upper(),
                       r.get("impact", "").upper(), r.get("timeframe", "")] for r in risks]
             pdf.add_table(["Risk", "Probability", "Impact", "Timeframe"], rows,
                          [80, 30, 30, 50])
@@ -820,7 +789,7 @@ def generate_briefing_pdf(data: dict, output_path: str):
         preds = geopolitical.get("predictions", [])
         if preds:
             pdf.sub_title("Geopolitical Predictions")
-            rows = [[p.get("prediction", "")[:80], p.get("timeframe", ""),
+            rows = [[p.get("prediction", ""), p.get("timeframe", ""),
                       f"{float(p.get('confidence', 0))*100:.0f}%"] for p in preds]
             pdf.add_table(["Prediction", "Timeframe", "Confidence"], rows,
                          [120, 30, 40])
@@ -843,7 +812,7 @@ def generate_briefing_pdf(data: dict, output_path: str):
             rows = [[si.get("sector", ""), si.get("impact_outlook", "").upper(),
                       si.get("ai_exposure", "").upper(),
                       f"{float(si.get('confidence', 0))*100:.0f}%",
-                      si.get("rationale", "")[:50]] for si in sis]
+                      si.get("rationale", "")] for si in sis]
             pdf.add_table(["Sector", "Impact", "AI Exp.", "Conf.", "Key Factor"], rows,
                          [35, 25, 20, 18, 92])
 
@@ -853,17 +822,17 @@ def generate_briefing_pdf(data: dict, output_path: str):
             for ind in indicators:
                 pdf.set_font("Helvetica", "B", 9)
                 pdf.set_text_color(*NAVY_RGB)
-                pdf.multi_cell(0, 5, latin_safe(f"* {ind.get('indicator', '')}"))
+                pdf.multi_cell(0, 5, f"* {ind.get('indicator', '')}")
                 pdf.set_font("Helvetica", "I", 8)
                 pdf.set_text_color(100, 116, 139)
                 sectors = ", ".join(ind.get("affected_sectors", []))
-                pdf.cell(0, 5, latin_safe(f"  Sectors: {sectors} | Timeline: {ind.get('timeline', 'N/A')} | Severity: {ind.get('severity', 'N/A').upper()}"), ln=True)
+                pdf.cell(0, 5, f"  Sectors: {sectors} | Timeline: {ind.get('timeline', 'N/A')} | Severity: {ind.get('severity', 'N/A').upper()}", ln=True)
                 pdf.ln(2)
 
         preds = labor.get("predictions", [])
         if preds:
             pdf.sub_title("Labor Predictions")
-            rows = [[p.get("prediction", "")[:80], p.get("timeframe", ""),
+            rows = [[p.get("prediction", ""), p.get("timeframe", ""),
                       f"{float(p.get('confidence', 0))*100:.0f}%"] for p in preds]
             pdf.add_table(["Prediction", "Timeframe", "Confidence"], rows,
                          [120, 30, 40])
@@ -879,6 +848,7 @@ def generate_briefing_pdf(data: dict, output_path: str):
 
 
 def generate_predictions_pdf(data: dict, output_path: str):
+    IntelPDF = _pdf_class()
     pdf = IntelPDF()
     pdf.add_page()
 
@@ -889,7 +859,7 @@ def generate_predictions_pdf(data: dict, output_path: str):
 
     predictions = data.get("predictions", [])
     if predictions:
-        rows = [[p.get("prediction_text", "")[:60], p.get("category", ""),
+        rows = [[p.get("prediction_text", ""), p.get("category", ""),
                   f"{float(p.get('initial_confidence', 0))*100:.0f}%",
                   p.get("timeframe", ""), p.get("outcome", "pending").upper()]
                 for p in predictions]
@@ -900,6 +870,7 @@ def generate_predictions_pdf(data: dict, output_path: str):
 
 
 def generate_accuracy_pdf(data: dict, output_path: str):
+    IntelPDF = _pdf_class()
     pdf = IntelPDF()
     pdf.add_page()
 
@@ -1184,39 +1155,59 @@ MD_GENERATORS = {
 }
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Intel Briefing Export")
-    parser.add_argument("--input", required=True, help="Path to JSON input file")
-    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
-    parser.add_argument("--type", default=None, help="Report type override: briefing, predictions, accuracy")
-    parser.add_argument("--formats", default="all", help="Export formats: all, html, pdf, md (comma-separated)")
-    args = parser.parse_args()
-
-    with open(args.input, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    report_type = args.type or data.get("type", "briefing")
+def export_report(data: dict, output_dir: str, workers=None, report_type=None, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Render every requested format for one report and return the result dict."""
+    report_type = report_type or data.get("type", "briefing")
     data["type"] = report_type
 
-    paths = compute_paths(data, args.output_dir)
-    formats = args.formats.split(",") if args.formats != "all" else ["html", "pdf", "md"]
+    paths = compute_paths(data, output_dir)
 
-    results = {}
+    jobs = []
 
-    if "html" in formats and report_type in HTML_GENERATORS:
-        HTML_GENERATORS[report_type](data, paths["html"])
-        results["html"] = paths["html"]
+    if report_type in HTML_GENERATORS:
+        jobs.append(("html", HTML_GENERATORS[report_type], paths["html"]))
 
-    if "pdf" in formats and report_type in PDF_GENERATORS:
-        PDF_GENERATORS[report_type](data, paths["pdf"])
-        results["pdf"] = paths["pdf"]
+    if report_type in PDF_GENERATORS:
+        jobs.append(("pdf", PDF_GENERATORS[report_type], paths["pdf"]))
 
-    if "md" in formats and report_type in MD_GENERATORS:
-        MD_GENERATORS[report_type](data, paths["md"])
-        results["md"] = paths["md"]
+    if report_type in MD_GENERATORS:
+        jobs.append(("md", MD_GENERATORS[report_type], paths["md"]))
 
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    results = summarize(timings)
     results["output_folder"] = paths["folder"]
     results["type"] = report_type
+    return results
+
+
+def export_file(input_path: str, output_dir: str, workers=1, report_type=None, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Load one JSON input and export it (batch mode entry point)."""
+    with open(input_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, report_type=report_type, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Intel Briefing Export")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to JSON input file")
+    source.add_argument("--inputs", help="Glob or manifest of JSON files to export in one batch (prints JSON lines)")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel render processes (1 = serial)")
+    parser.add_argument("--type", default=None, help="Report type override: briefing, predictions, accuracy")
+    parser.add_argument("--formats", default="all", type=formats_arg(["html", "pdf", "md"]), help="Export formats: all, html, pdf, md (comma-separated)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if outputs are current for this input")
+    parser.add_argument("--profile", action="store_true", help="Profile each render (cProfile + tracemalloc) and write {stem}.profile.json")
+    parser.add_argument("--optimize-pdf", action="store_true", help="Recompress and deduplicate PDF output; report bytes before/after in the result")
+    args = parser.parse_args()
+
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, report_type=args.type, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    results = export_report(data, args.output_dir, workers=args.workers, report_type=args.type, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
     print(json.dumps(results, indent=2))
 
 
@@ -5,6 +5,10 @@ Generates HTML, PDF, and Markdown files from medigap selection JSON.
 
 Usage:
     python3 medigap_selector_export.py --input /tmp/medigap_selection.json
+    python3 medigap_selector_export.py --input data.json --formats html   # skip the PDF backend
+    python3 medigap_selector_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 medigap_selector_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 medigap_selector_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 """
 
 import sys
@@ -14,14 +18,22 @@ import argparse
 from datetime import datetime
 import re
 
-# Add virtual environment to Python path
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.html import HtmlStream
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.text import latin_safe_drop as latin_safe
 
 # Color scheme (green-based for healthcare)
 GREEN = "#059669"
@@ -42,22 +54,6 @@ CONFIDENCE_COLORS = {
 DEFAULT_OUTPUT_DIR = "/mnt/c/Users/RonKlatt_3qsjg34/Desktop/Claude Code Plugin Output/Medigap_Selection/"
 
 
-def latin_safe(text):
-    """Convert text to Latin-1 safe string for PDF output."""
-    if text is None:
-        return ""
-    return str(text).encode('latin-1', 'ignore').decode('latin-1')
-
-
-def slugify(text):
-    """Convert text to URL-safe slug."""
-    if not text:
-        return "general"
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '_', text)
-    return text.strip('_')
-
-
 def score_color(score):
     """Return color based on score value."""
     if score >= 85:
@@ -72,6 +68,12 @@ def score_color(score):
 
 def generate_html(data, output_path):
     """Generate HTML report from medigap selection data."""
+    with HtmlStream(output_path) as out:
+        _write_html(data, out)
+
+
+def _write_html(data, out):
+    """Stream the HTML report to ``out`` section by section."""
     profile = data.get('requirements_profile', {})
     recommendation = data.get('recommendation', {})
     scoring = data.get('scoring_detail', {})
@@ -100,7 +102,7 @@ def generate_html(data, output_path):
     winner_color = PLAN_COLORS.get(winner, PLAN_COLORS['Plan G'])
     conf_color = CONFIDENCE_COLORS.get(confidence, CONFIDENCE_COLORS['MEDIUM'])
 
-    html = f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -538,7 +540,7 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
     # Scoring factors
     factors = [
@@ -558,7 +560,7 @@ def generate_html(data, output_path):
         g_val = g_data.get('score', 0) if isinstance(g_data, dict) else 0
         n_val = n_data.get('score', 0) if isinstance(n_data, dict) else 0
 
-        html += f"""
+        out.write(f"""
                         <tr>
                             <td><strong>{label}</strong> ({weight})</td>
                             <td>
@@ -574,9 +576,9 @@ def generate_html(data, output_path):
                                 </div>
                             </td>
                         </tr>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
                         <tr style="background: #f0fdf4; font-weight: 700;">
                             <td><strong>Composite Score</strong></td>
                             <td>
@@ -599,7 +601,7 @@ def generate_html(data, output_path):
             <!-- Premium Comparison -->
             <div class="section">
                 <h2 class="section-title">Premium Comparison</h2>
-"""
+""")
 
     # Build premium table from insurer rankings
     winning_plan = recommendation.get('winner', 'Plan G')
@@ -609,7 +611,7 @@ def generate_html(data, output_path):
     n_insurers = insurer_rankings.get('plan_n', [])
 
     if g_insurers or n_insurers:
-        html += """
+        out.write("""
                 <table>
                     <thead>
                         <tr>
@@ -622,7 +624,7 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
         # Match insurers across plans
         g_by_name = {i.get('insurer', ''): i for i in g_insurers}
         n_by_name = {i.get('insurer', ''): i for i in n_insurers}
@@ -645,7 +647,7 @@ def generate_html(data, output_path):
             except (ValueError, TypeError):
                 pass
 
-            html += f"""
+            out.write(f"""
                         <tr>
                             <td><strong>{insurer_name}</strong></td>
                             <td>{g_premium}</td>
@@ -654,14 +656,14 @@ def generate_html(data, output_path):
                             <td>{am_best}</td>
                             <td>{naic}</td>
                         </tr>
-"""
+""")
 
-        html += """
+        out.write("""
                     </tbody>
                 </table>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
                 <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem;">
                     <div style="background: #f0fdf4; padding: 1rem; border-radius: 8px;">
                         <div style="font-weight: 600; color: {GREEN_DARK};">Plan G Range</div>
@@ -715,14 +717,14 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
     for scenario in scenarios:
         s_winner = scenario.get('winner', '')
         s_savings = scenario.get('savings', '')
         winner_style = f"color: {GREEN}; font-weight: 700;" if 'G' in s_winner else "color: #2563EB; font-weight: 700;"
 
-        html += f"""
+        out.write(f"""
                         <tr>
                             <td><strong>{scenario.get('scenario', '')}</strong></td>
                             <td>{scenario.get('plan_g_cost', '')}</td>
@@ -730,9 +732,9 @@ def generate_html(data, output_path):
                             <td style="{winner_style}">{s_winner}</td>
                             <td>{s_savings}</td>
                         </tr>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
                     </tbody>
                 </table>
             </div>
@@ -746,19 +748,19 @@ def generate_html(data, output_path):
                     <p>{state_rules.get('switching_recommendation', '')}</p>
                 </div>
             </div>
-"""
+""")
 
     # Top Insurer Recommendations
     winner_key = 'plan_g' if 'G' in winner else 'plan_n'
     top_insurers = insurer_rankings.get(winner_key, [])
 
     if top_insurers:
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Top Insurer Recommendations</h2>
-"""
+""")
         for ins in top_insurers[:3]:
-            html += f"""
+            out.write(f"""
                 <div class="insurer-card">
                     <div class="insurer-header">
                         <div class="insurer-name">#{ins.get('rank', '')}. {ins.get('insurer', '')}</div>
@@ -788,28 +790,28 @@ def generate_html(data, output_path):
                     </div>
                     <p style="margin-top: 1rem; color: #374151;">{ins.get('why_recommended', '')}</p>
                 </div>
-"""
-        html += """
+""")
+        out.write("""
             </div>
-"""
+""")
 
     # Strategic Advice
     if advice:
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Strategic Advice</h2>
                 <ul class="advice-list">
-"""
+""")
         for item in advice:
-            html += f"                    <li>{item}</li>\n"
-        html += """
+            out.write(f"                    <li>{item}</li>\n")
+        out.write("""
                 </ul>
             </div>
-"""
+""")
 
     # Methodology
     if methodology:
-        html += f"""
+        out.write(f"""
             <div class="methodology">
                 <h3 style="margin-bottom: 1rem; color: #1f2937;">Methodology</h3>
                 <div class="methodology-grid">
@@ -827,23 +829,23 @@ def generate_html(data, output_path):
                     </div>
                 </div>
             </div>
-"""
+""")
 
     # Disclaimers
     if disclaimers:
-        html += """
+        out.write("""
             <div class="disclaimer">
                 <h4 style="margin-bottom: 0.5rem;">Important Disclaimers</h4>
                 <ul style="padding-left: 1.5rem;">
-"""
+""")
         for d in disclaimers:
-            html += f"                    <li>{d}</li>\n"
-        html += """
+            out.write(f"                    <li>{d}</li>\n")
+        out.write("""
                 </ul>
             </div>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
             <div class="footer">
                 Generated by Medigap Selector on {generated_date}<br>
                 ROK Plugin Marketplace - Medigap Selector v1.0
@@ -852,14 +854,13 @@ def generate_html(data, output_path):
     </div>
 </body>
 </html>
-"""
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+""")
 
 
 def generate_pdf(data, output_path):
     """Generate PDF report from medigap selection data."""
+    from fpdf import FPDF
+
     profile = data.get('requirements_profile', {})
     recommendation = data.get('recommendation', {})
     scoring = data.get('scoring_detail', {})
@@ -1282,13 +1283,58 @@ def generate_markdown(data, output_path):
         f.write(md)
 
 
+def export_report(data, output_dir, workers=None, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Render every requested format for one medigap selection and return the result dict."""
+    # Validate data type
+    if data.get('type') != 'medigap_selection':
+        print(f"Warning: Expected type 'medigap_selection', got '{data.get('type')}'", file=sys.stderr)
+
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Generate filename base
+    req_profile = data.get('requirements_profile', {})
+    state = req_profile.get('state', 'unknown')
+    zip_code = req_profile.get('zip_code', '00000')
+    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
+    base_filename = f"medigap_selection_{state}_{zip_code}_{date_str}"
+
+    jobs = [
+        ("html", generate_html, os.path.join(output_dir, f"{base_filename}.html")),
+        ("pdf", generate_pdf, os.path.join(output_dir, f"{base_filename}.pdf")),
+        ("md", generate_markdown, os.path.join(output_dir, f"{base_filename}.md")),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    result = summarize(timings)
+    result["output_folder"] = output_dir
+    return result
+
+
+def export_file(input_path, output_dir, workers=1, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Load one medigap selection JSON file and export it (batch mode entry point)."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Export Medigap Selection to HTML, PDF, and Markdown')
-    parser.add_argument('--input', required=True, help='Path to medigap selection JSON file')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='Path to medigap selection JSON file')
+    source.add_argument('--inputs', help='Glob or manifest of JSON files to export in one batch (prints JSON lines)')
     parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel render processes (1 = serial)')
+    parser.add_argument('--formats', default='all', type=formats_arg(['html', 'pdf', 'md']), help='Export formats: all, html, pdf, md (comma-separated)')
+    parser.add_argument('--force', action='store_true', help='Re-render even if outputs are current for this input')
+    parser.add_argument('--profile', action='store_true', help='Profile each render (cProfile + tracemalloc) and write {stem}.profile.json')
+    parser.add_argument('--optimize-pdf', action='store_true', help='Recompress and deduplicate PDF output; report bytes before/after in the result')
 
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     # Read input JSON
     try:
         with open(args.input, 'r', encoding='utf-8') as f:
@@ -1300,42 +1346,10 @@ def main():
         print(f"Error: Invalid JSON in input file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Validate data type
-    if data.get('type') != 'medigap_selection':
-        print(f"Warning: Expected type 'medigap_selection', got '{data.get('type')}'", file=sys.stderr)
-
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    # Generate filename base
-    profile = data.get('requirements_profile', {})
-    state = profile.get('state', 'unknown')
-    zip_code = profile.get('zip_code', '00000')
-    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
-    base_filename = f"medigap_selection_{state}_{zip_code}_{date_str}"
-
-    # Generate outputs
+    # Generate outputs (formats render in parallel worker processes) and print the JSON result
     try:
-        html_path = os.path.join(args.output_dir, f"{base_filename}.html")
-        print(f"Generating HTML: {html_path}")
-        generate_html(data, html_path)
-        print(f"  HTML generated successfully")
-
-        pdf_path = os.path.join(args.output_dir, f"{base_filename}.pdf")
-        print(f"Generating PDF: {pdf_path}")
-        generate_pdf(data, pdf_path)
-        print(f"  PDF generated successfully")
-
-        md_path = os.path.join(args.output_dir, f"{base_filename}.md")
-        print(f"Generating Markdown: {md_path}")
-        generate_markdown(data, md_path)
-        print(f"  Markdown generated successfully")
-
-        print("\nExport complete!")
-        print(f"\nOutput files:")
-        print(f"  - {html_path}")
-        print(f"  - {pdf_path}")
-        print(f"  - {md_path}")
+        result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
+        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error during export: {e}", file=sys.stderr)
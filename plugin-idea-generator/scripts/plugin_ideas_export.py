@@ -5,6 +5,10 @@ Generates HTML, PDF, and Markdown files from plugin idea shortlist JSON.
 
 Usage:
     python3 plugin_ideas_export.py --input shortlist.json
+    python3 plugin_ideas_export.py --input data.json --formats html   # skip the PDF backend
+    python3 plugin_ideas_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 plugin_ideas_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 plugin_ideas_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 """
 
 import sys
@@ -12,16 +16,23 @@ import os
 import json
 import argparse
 from datetime import datetime
-import re
 
-# Add virtual environment to Python path
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.html import HtmlStream
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.text import latin_safe_drop as latin_safe, snake_slug
 
 # Load plugin version from plugin.json (single source of truth)
 _PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, ".claude-plugin", "plugin.json")
@@ -55,22 +66,6 @@ PATHWAY_COLORS = {
 DEFAULT_OUTPUT_DIR = "/mnt/c/Users/RonKlatt_3qsjg34/Desktop/Claude Code Plugin Output/Plugin_Ideas/"
 
 
-def latin_safe(text):
-    """Convert text to Latin-1 safe string for PDF output."""
-    if text is None:
-        return ""
-    return str(text).encode('latin-1', 'ignore').decode('latin-1')
-
-
-def slugify(text):
-    """Convert text to URL-safe slug."""
-    if not text:
-        return "open_discovery"
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '_', text)
-    return text.strip('_')
-
-
 def score_color(score):
     """Return color based on score value."""
     if score >= 80:
@@ -90,6 +85,12 @@ def pathway_display(pathway):
 
 def generate_html(data, output_path):
     """Generate HTML report from shortlist data."""
+    with HtmlStream(output_path) as out:
+        _write_html(data, out)
+
+
+def _write_html(data, out):
+    """Stream the HTML report to ``out`` section by section."""
     topic = data.get('topic') or "Open Discovery"
     depth = data.get('depth', 'standard').upper()
     generated_date = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
@@ -98,7 +99,7 @@ def generate_html(data, output_path):
     methodology = data.get('methodology', {})
     portfolio_analysis = data.get('portfolio_analysis', {})
 
-    html = f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -487,7 +488,7 @@ def generate_html(data, output_path):
                         </tr>
                     </thead>
                     <tbody>
-"""
+""")
 
     # Add shortlist table rows
     for idea in shortlist:
@@ -504,7 +505,7 @@ def generate_html(data, output_path):
         tier_style = f"background: {TIER_COLORS.get(tier, TIER_COLORS['BACKLOG'])['bg']}; color: {TIER_COLORS.get(tier, TIER_COLORS['BACKLOG'])['text']};"
         pw_color = PATHWAY_COLORS.get(pathway, '#6b7280')
 
-        html += f"""
+        out.write(f"""
                         <tr>
                             <td class="rank">#{rank}</td>
                             <td><strong>{name}</strong></td>
@@ -536,16 +537,16 @@ def generate_html(data, output_path):
                             <td><span class="pathway-badge" style="background: {pw_color};">{pathway_display(pathway)}</span></td>
                             <td>{extends}</td>
                         </tr>
-"""
+""")
 
-    html += """
+    out.write("""
                     </tbody>
                 </table>
             </div>
 
             <div class="section">
                 <h2 class="section-title">Detailed Analysis</h2>
-"""
+""")
 
     # Add detailed idea cards
     for idea in shortlist:
@@ -580,7 +581,7 @@ def generate_html(data, output_path):
         tier_style = f"background: {TIER_COLORS.get(tier, TIER_COLORS['BACKLOG'])['bg']}; color: {TIER_COLORS.get(tier, TIER_COLORS['BACKLOG'])['text']};"
         pw_color = PATHWAY_COLORS.get(pathway, '#6b7280')
 
-        html += f"""
+        out.write(f"""
                 <div class="idea-card">
                     <div class="idea-card-header">
                         <div class="idea-title">#{rank}. {name}</div>
@@ -646,47 +647,47 @@ def generate_html(data, output_path):
                             <div class="detail-value">{agents} agents, {commands} cmds, {skills} skills</div>
                         </div>
                     </div>
-"""
+""")
 
         if why_it_fits:
-            html += f"""
+            out.write(f"""
                     <div class="market-signal">
                         <div class="market-signal-title">Why It Fits You</div>
                         <div>{why_it_fits}</div>
                     </div>
-"""
+""")
 
         if market_signal:
-            html += f"""
+            out.write(f"""
                     <div class="market-signal">
                         <div class="market-signal-title">Market Signal</div>
                         <div>{market_signal}</div>
                     </div>
-"""
+""")
 
         if ai_advantage:
-            html += f"""
+            out.write(f"""
                     <div class="ai-advantage">
                         <div class="ai-advantage-title">AI-Native Advantage</div>
                         <div>{ai_advantage}</div>
                     </div>
-"""
+""")
 
         if pathway_note:
-            html += f"""
+            out.write(f"""
                     <div style="background:#eef2ff; padding:1rem; border-radius:8px; margin-bottom:1rem;">
                         <div style="font-weight:600; color:{PRIMARY_DARK}; margin-bottom:0.3rem;">Monetization Pathway</div>
                         <div>{pathway_note}</div>
                     </div>
-"""
+""")
 
         if key_risk:
-            html += f"""
+            out.write(f"""
                     <div style="background:#fef2f2; padding:1rem; border-radius:8px; margin-bottom:1rem; border-left:4px solid #dc2626;">
                         <div style="font-weight:600; color:#991b1b; margin-bottom:0.3rem;">Key Risk</div>
                         <div>{key_risk}</div>
                     </div>
-"""
+""")
 
         if architecture:
             arch_agents = architecture.get('agents', [])
@@ -694,47 +695,47 @@ def generate_html(data, output_path):
             arch_flow = architecture.get('data_flow', '')
             arch_connect = architecture.get('interconnections', '')
 
-            html += """
+            out.write("""
                     <div style="background:#f5f3ff; padding:1.5rem; border-radius:8px; margin-bottom:1rem;">
                         <div style="font-weight:600; color:#4F46E5; margin-bottom:0.8rem; font-size:1.1rem;">Architecture Sketch</div>
-"""
+""")
             if arch_agents:
-                html += '                        <div style="margin-bottom:0.8rem;"><strong>Agents:</strong><ul style="margin-top:0.3rem;">'
+                out.write('                        <div style="margin-bottom:0.8rem;"><strong>Agents:</strong><ul style="margin-top:0.3rem;">')
                 for a in arch_agents:
-                    html += f'<li><code>{a.get("name", "")}</code> ({a.get("model", "")}) — {a.get("purpose", "")}</li>'
-                html += '</ul></div>'
+                    out.write(f'<li><code>{a.get("name", "")}</code> ({a.get("model", "")}) — {a.get("purpose", "")}</li>')
+                out.write('</ul></div>')
 
             if arch_commands:
-                html += '                        <div style="margin-bottom:0.8rem;"><strong>Commands:</strong><ul style="margin-top:0.3rem;">'
+                out.write('                        <div style="margin-bottom:0.8rem;"><strong>Commands:</strong><ul style="margin-top:0.3rem;">')
                 for c in arch_commands:
-                    html += f'<li><code>{c.get("name", "")}</code> — {c.get("description", "")}</li>'
-                html += '</ul></div>'
+                    out.write(f'<li><code>{c.get("name", "")}</code> — {c.get("description", "")}</li>')
+                out.write('</ul></div>')
 
             if arch_flow:
-                html += f'                        <div style="margin-bottom:0.5rem;"><strong>Data Flow:</strong> {arch_flow}</div>'
+                out.write(f'                        <div style="margin-bottom:0.5rem;"><strong>Data Flow:</strong> {arch_flow}</div>')
 
             if arch_connect:
-                html += f'                        <div><strong>Interconnections:</strong> {arch_connect}</div>'
+                out.write(f'                        <div><strong>Interconnections:</strong> {arch_connect}</div>')
 
-            html += """
+            out.write("""
                     </div>
-"""
+""")
 
         if create_prompt:
-            html += f"""
+            out.write(f"""
                     <div class="create-prompt">
                         <div class="create-prompt-title">Build This Plugin</div>
                         <code>{create_prompt}</code>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
-"""
+""")
 
-    html += """
+    out.write("""
             </div>
-"""
+""")
 
     # Portfolio Analysis section
     if portfolio_analysis:
@@ -742,7 +743,7 @@ def generate_html(data, output_path):
         gaps = portfolio_analysis.get('gap_domains', [])
         extensions = portfolio_analysis.get('extension_opportunities', [])
 
-        html += f"""
+        out.write(f"""
             <div class="section">
                 <h2 class="section-title">Portfolio Gap Analysis</h2>
                 <div class="portfolio-section">
@@ -760,123 +761,123 @@ def generate_html(data, output_path):
                             <div class="detail-value" style="color:#dc2626; font-size:0.95rem;">{', '.join(gaps)}</div>
                         </div>
                     </div>
-"""
+""")
 
         if extensions:
-            html += """
+            out.write("""
                     <div style="margin-top:1rem;">
                         <div class="detail-label">Extension Opportunities</div>
                         <ul style="margin-top:0.5rem;">
-"""
+""")
             for ext in extensions:
                 existing = ext.get('existing', '')
                 extension = ext.get('extension', '')
-                html += f'                            <li><strong>{existing}</strong> → {extension}</li>\n'
+                out.write(f'                            <li><strong>{existing}</strong> → {extension}</li>\n')
 
-            html += """
+            out.write("""
                         </ul>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
     # Themes section
     if themes:
-        html += """
+        out.write("""
             <div class="section">
                 <h2 class="section-title">Emerging Themes</h2>
                 <div class="themes-section">
-"""
+""")
 
         if themes.get('dominant_theme'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Dominant Theme</div>
                         <div class="theme-value">{themes['dominant_theme']}</div>
                     </div>
-"""
+""")
 
         if themes.get('emerging_capability'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Emerging Capability</div>
                         <div class="theme-value">{themes['emerging_capability']}</div>
                     </div>
-"""
+""")
 
         if themes.get('strongest_market_signal'):
-            html += f"""
+            out.write(f"""
                     <div class="theme-item">
                         <div class="theme-label">Strongest Market Signal</div>
                         <div class="theme-value">{themes['strongest_market_signal']}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
     # Methodology section
     if methodology:
-        html += """
+        out.write("""
             <div class="methodology">
                 <h3 style="margin-bottom: 1rem; color: #1f2937;">Methodology</h3>
                 <div class="methodology-grid">
-"""
+""")
 
         if methodology.get('agents_dispatched'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Agents Dispatched</div>
                         <div class="detail-value">{methodology['agents_dispatched']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('total_searches'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Total Searches</div>
                         <div class="detail-value">{methodology['total_searches']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('dedup_merges'):
-            html += f"""
+            out.write(f"""
                     <div class="detail-item">
                         <div class="detail-label">Duplicates Merged</div>
                         <div class="detail-value">{methodology['dedup_merges']}</div>
                     </div>
-"""
+""")
 
         if methodology.get('sources_covered'):
             sources = ', '.join(methodology['sources_covered'])
-            html += f"""
+            out.write(f"""
                     <div class="detail-item" style="grid-column: 1 / -1;">
                         <div class="detail-label">Sources Covered</div>
                         <div class="detail-value">{sources}</div>
                     </div>
-"""
+""")
 
         strategies = methodology.get('strategies_used', {})
         if strategies:
             strategy_str = ', '.join([f'{k}: {v}' for k, v in strategies.items()])
-            html += f"""
+            out.write(f"""
                     <div class="detail-item" style="grid-column: 1 / -1;">
                         <div class="detail-label">Idea Generation Strategies</div>
                         <div class="detail-value">{strategy_str}</div>
                     </div>
-"""
+""")
 
-        html += """
+        out.write("""
                 </div>
             </div>
-"""
+""")
 
-    html += f"""
+    out.write(f"""
             <div class="footer">
                 Generated by Plugin Idea Generator on {generated_date}<br>
                 ROK Plugin Marketplace - Plugin Idea Generator v{PLUGIN_VERSION}
@@ -885,14 +886,12 @@ def generate_html(data, output_path):
     </div>
 </body>
 </html>
-"""
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+""")
 
 
 def generate_pdf(data, output_path):
     """Generate PDF report from shortlist data."""
+    from fpdf import FPDF
 
     class PluginIdeaPDF(FPDF):
         def header(self):
@@ -1361,13 +1360,57 @@ def generate_markdown(data, output_path):
         f.write(md)
 
 
+def export_report(data, output_dir, workers=None, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Render every requested format for one shortlist and return the result dict."""
+    # Validate data type
+    if data.get('type') != 'plugin_idea_shortlist':
+        print(f"Warning: Expected type 'plugin_idea_shortlist', got '{data.get('type')}'", file=sys.stderr)
+
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Generate filename base
+    topic = data.get('topic')
+    topic_slug = snake_slug(topic, "open_discovery")
+    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
+    base_filename = f"plugin_ideas_{topic_slug}_{date_str}"
+
+    jobs = [
+        ("html", generate_html, os.path.join(output_dir, f"{base_filename}.html")),
+        ("pdf", generate_pdf, os.path.join(output_dir, f"{base_filename}.pdf")),
+        ("md", generate_markdown, os.path.join(output_dir, f"{base_filename}.md")),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    result = summarize(timings)
+    result["output_folder"] = output_dir
+    return result
+
+
+def export_file(input_path, output_dir, workers=1, formats='all', force=False, profile=False, optimize_pdf=False):
+    """Load one shortlist JSON file and export it (batch mode entry point)."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Export Plugin Idea Generator shortlist to HTML, PDF, and Markdown')
-    parser.add_argument('--input', required=True, help='Path to shortlist JSON file')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='Path to shortlist JSON file')
+    source.add_argument('--inputs', help='Glob or manifest of JSON files to export in one batch (prints JSON lines)')
     parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel render processes (1 = serial)')
+    parser.add_argument('--formats', default='all', type=formats_arg(['html', 'pdf', 'md']), help='Export formats: all, html, pdf, md (comma-separated)')
+    parser.add_argument('--force', action='store_true', help='Re-render even if outputs are current for this input')
+    parser.add_argument('--profile', action='store_true', help='Profile each render (cProfile + tracemalloc) and write {stem}.profile.json')
+    parser.add_argument('--optimize-pdf', action='store_true', help='Recompress and deduplicate PDF output; report bytes before/after in the result')
 
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     # Read input JSON
     try:
         with open(args.input, 'r', encoding='utf-8') as f:
@@ -1379,41 +1422,10 @@ def main():
         print(f"Error: Invalid JSON in input file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Validate data type
-    if data.get('type') != 'plugin_idea_shortlist':
-        print(f"Warning: Expected type 'plugin_idea_shortlist', got '{data.get('type')}'", file=sys.stderr)
-
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    # Generate filename base
-    topic = data.get('topic')
-    topic_slug = slugify(topic) if topic else "open_discovery"
-    date_str = data.get('generated_date', datetime.now().strftime('%Y-%m-%d'))
-    base_filename = f"plugin_ideas_{topic_slug}_{date_str}"
-
-    # Generate outputs
+    # Generate outputs (formats render in parallel worker processes) and print the JSON result
     try:
-        html_path = os.path.join(args.output_dir, f"{base_filename}.html")
-        print(f"Generating HTML: {html_path}")
-        generate_html(data, html_path)
-        print(f"  HTML generated successfully")
-
-        pdf_path = os.path.join(args.output_dir, f"{base_filename}.pdf")
-        print(f"Generating PDF: {pdf_path}")
-        generate_pdf(data, pdf_path)
-        print(f"  PDF generated successfully")
-
-        md_path = os.path.join(args.output_dir, f"{base_filename}.md")
-        print(f"Generating Markdown: {md_path}")
-        generate_markdown(data, md_path)
-        print(f"  Markdown generated successfully")
-
-        print("\nExport complete!")
-        print(f"\nOutput files:")
-        print(f"  - {html_path}")
-        print(f"  - {pdf_path}")
-        print(f"  - {md_path}")
+        result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
+        print(json.dumps(result, indent=2))
 
     except Exception as e:
         print(f"Error during export: {e}", file=sys.stderr)
@@ -5,27 +5,42 @@ Code Review Export -- Generate MD, PDF, and HTML from production code review dat
 Usage:
     python3 code_review_export.py --input /tmp/code_review_export.json
     python3 code_review_export.py --input data.json --output-dir /custom/path/
+    python3 code_review_export.py --input data.json --formats html   # skip the PDF backend
+    python3 code_review_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 code_review_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 code_review_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 
-Input: JSON payload from report-generator agent
+Input: JSON payload from report-generator agent (raw per-model findings under
+"model_findings" are fused into "issues" first, see rok_export.fusion)
 Output: .html, .pdf, .md in {output_dir}/Code_Reviews/ folder
 """
 
 import argparse
 import json
 import os
-import re
-import shutil
 import sys
 from datetime import date
+from functools import lru_cache
+from pathlib import Path
 
-# Use venv packages
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.fusion import fuse_payload
+from rok_export.runner import formats_arg, parse_formats, run_exports, summarize
+from rok_export.sync import sync_tree
+from rok_export.text import escape_html, slugify
+from rok_export.thumbs import publish, thumbnails
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 
@@ -35,6 +50,7 @@ INDIGO = "#312E81"
 INDIGO_RGB = (49, 46, 129)
 LIGHT_BG = "#F8FAFC"
 BORDER_COLOR = "#E2E8F0"
+SCREENSHOT_MAX_H = 120  # mm: tall full-page captures are scaled down to fit one PDF page
 
 VERDICT_COLORS = {
     "PASS": {"bg": "#059669", "text": "#FFFFFF", "label": "PASS"},
@@ -77,14 +93,6 @@ MODEL_LABELS = {
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
-def slugify(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^\w\s-]", "", s)
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"-+", "-", s)
-    return s[:60].strip("-") or "untitled"
-
-
 def compute_paths(data: dict, output_dir: str):
     project = slugify(data.get("project_name", "project"))
     d = data.get("date", date.today().isoformat())
@@ -100,26 +108,8 @@ def compute_paths(data: dict, output_dir: str):
     }
 
 
-def escape_html(s: str) -> str:
-    return (str(s).replace("&", "&amp;")
-                  .replace("<", "&lt;")
-                  .replace(">", "&gt;")
-                  .replace('"', "&quot;"))
-
-
-def latin_safe(s: str) -> str:
-    replacements = {
-        "\u2014": "--", "\u2013": "-", "\u2018": "'", "\u2019": "'",
-        "\u201c": '"', "\u201d": '"', "\u2026": "...", "\u2022": "*",
-        "\u00a0": " ", "\u200b": "", "\u2713": "[x]", "\u2717": "[ ]",
-    }
-    for char, repl in replacements.items():
-        s = s.replace(char, repl)
-    return s.encode("latin-1", errors="replace").decode("latin-1")
-
-
 def truncate(s: str, max_len: int = 60) -> str:
-    s = latin_safe(str(s)) if s else ""
+    s = str(s) if s else ""
     return s[:max_len - 3] + "..." if len(s) > max_len else s
 
 
@@ -148,17 +138,38 @@ def group_issues_by_severity(issues: list) -> dict:
     return {k: groups[k] for k in order if k in groups}
 
 
+def attach_screenshot_thumbs(data: dict, folder: str) -> dict:
+    """Copy of ``data`` whose issues carry ``screenshot_thumb``, a cached thumbnail published under ``folder``."""
+    issues = data.get("issues", [])
+    thumbs = thumbnails([iss["screenshot_path"] for iss in issues if iss.get("screenshot_path")])
+    if not thumbs:
+        return data
+    published = {thumb: publish(thumb, folder) for thumb in set(thumbs.values())}
+    return dict(data, issues=[
+        dict(iss, screenshot_thumb=published[thumbs[iss["screenshot_path"]]])
+        if iss.get("screenshot_path") in thumbs else iss
+        for iss in issues
+    ])
+
+
 def screenshot_thumb_html(issue: dict) -> str:
-    """Generate HTML img tag for E2E screenshot if path exists."""
+    """Lazy-loaded thumbnail of the issue's E2E screenshot, linking the full-size image.
+
+    Without a thumbnail (no Pillow, unreadable image) the full-size screenshot is shown instead.
+    """
+    thumb = issue.get("screenshot_thumb", "")
     ss_path = issue.get("screenshot_path", "")
-    if ss_path and os.path.exists(ss_path):
-        abs_ss = os.path.abspath(ss_path).replace("\\", "/")
-        return (
-            f'<br><img src="file:///{abs_ss}" '
-            f'style="max-width:600px;border:1px solid #E2E8F0;margin:8px 0;border-radius:4px" '
-            f'alt="E2E Screenshot">'
-        )
-    return ""
+    full = Path(os.path.abspath(ss_path)).as_uri() if ss_path and os.path.exists(ss_path) else ""
+    if not thumb and not full:
+        return ""
+    img = (
+        f'<img src="{escape_html(thumb or full)}" loading="lazy" decoding="async" '
+        f'style="max-width:600px;width:100%;border:1px solid #E2E8F0;margin:8px 0;border-radius:4px" '
+        f'alt="E2E Screenshot">'
+    )
+    if full:
+        img = f'<a href="{escape_html(full)}">{img}</a>'
+    return f"<br>{img}"
 
 
 def format_model_badges_html(source_models):
@@ -617,35 +628,43 @@ def generate_html(data: dict, output_path: str):
 
 # ── PDF Generation ─────────────────────────────────────────────────────────────
 
-class CodeReviewPDF(FPDF):
-    def __init__(self, data: dict):
-        super().__init__(orientation="P", unit="mm", format="Letter")
-        self.data = data
-        self.set_auto_page_break(auto=True, margin=20)
-
-    def header(self):
-        self.set_font("Helvetica", "B", 16)
-        self.set_text_color(*INDIGO_RGB)
-        self.cell(0, 8, "PRODUCTION CODE REVIEW", new_x="LMARGIN", new_y="NEXT")
-        self.set_font("Helvetica", "", 11)
-        self.set_text_color(120, 120, 120)
-        project = latin_safe(self.data.get("project_name", ""))
-        self.cell(0, 6, project, new_x="LMARGIN", new_y="NEXT")
-        self.set_font("Helvetica", "", 9)
-        d = self.data.get("date", "")
-        stack = latin_safe(self.data.get("tech_stack", ""))
-        self.cell(0, 5, f"{d}  |  {stack}", new_x="LMARGIN", new_y="NEXT")
-        self.line(self.l_margin, self.get_y() + 1, self.w - self.r_margin, self.get_y() + 1)
-        self.ln(4)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Helvetica", "I", 7)
-        self.set_text_color(150, 150, 150)
-        self.cell(0, 10, f"Generated by Claude Code  |  Production Code Review  |  Confidential  |  Page {self.page_no()}/{{nb}}", align="C")
+@lru_cache(maxsize=None)
+def _pdf_class():
+    """Define CodeReviewPDF on first use so fpdf is only imported when a PDF is requested."""
+    from rok_export.pdf import ReportPDF
+
+    class CodeReviewPDF(ReportPDF):
+        def __init__(self, data: dict):
+            super().__init__(orientation="P", unit="mm", format="Letter")
+            self.data = data
+            self.set_auto_page_break(auto=True, margin=20)
+
+        def header(self):
+            self.set_font("Helvetica", "B", 16)
+            self.set_text_color(*INDIGO_RGB)
+            self.cell(0, 8, "PRODUCTION CODE REVIEW", new_x="LMARGIN", new_y="NEXT")
+            self.set_font("Helvetica", "", 11)
+            self.set_text_color(120, 120, 120)
+            project = self.data.get("project_name", "")
+            self.cell(0, 6, project, new_x="LMARGIN", new_y="NEXT")
+            self.set_font("Helvetica", "", 9)
+            d = self.data.get("date", "")
+            stack = self.data.get("tech_stack", "")
+            self.cell(0, 5, f"{d}  |  {stack}", new_x="LMARGIN", new_y="NEXT")
+            self.line(self.l_margin, self.get_y() + 1, self.w - self.r_margin, self.get_y() + 1)
+            self.ln(4)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 7)
+            self.set_text_color(150, 150, 150)
+            self.cell(0, 10, f"Generated by Claude Code  |  Production Code Review  |  Confidential  |  Page {self.page_no()}/{{nb}}", align="C")
+
+    return CodeReviewPDF
 
 
 def generate_pdf(data: dict, output_path: str):
+    CodeReviewPDF = _pdf_class()
     pdf = CodeReviewPDF(data)
     pdf.alias_nb_pages()
     pdf.add_page()
@@ -690,7 +709,7 @@ def generate_pdf(data: dict, output_path: str):
     m = issue_summary.get("medium", 0)
     lo = issue_summary.get("low", 0)
     t = issue_summary.get("total", 0)
-    pdf.cell(0, 6, latin_safe(f"Total Issues: {t}  |  Critical: {c}  |  High: {h}  |  Medium: {m}  |  Low: {lo}"), align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 6, f"Total Issues: {t}  |  Critical: {c}  |  High: {h}  |  Medium: {m}  |  Low: {lo}", align="C", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(6)
 
     # ── Dimension Scores Table ──
@@ -711,7 +730,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.set_font("Helvetica", "", 9)
     for idx, dim in enumerate(dimensions):
         ds = dim.get("score", 0)
-        dn = latin_safe(dim.get("name", ""))
+        dn = dim.get("name", "")
         dic = dim.get("issue_count", 0)
 
         if idx % 2 == 0:
@@ -762,7 +781,7 @@ def generate_pdf(data: dict, output_path: str):
                 pdf.set_fill_color(255, 255, 255)
 
             pdf.set_text_color(60, 60, 60)
-            pdf.cell(mc_col_w, 5.5, latin_safe(DIMENSION_NAMES.get(dk, dk)), border=1, fill=True)
+            pdf.cell(mc_col_w, 5.5, DIMENSION_NAMES.get(dk, dk), border=1, fill=True)
 
             for mk in model_keys:
                 ms = model_scores.get(mk, {}).get(dk, "")
@@ -831,10 +850,10 @@ def generate_pdf(data: dict, output_path: str):
             else:
                 pdf.set_text_color(133, 77, 14)
 
-            pdf.cell(jr_widths[0], 6, latin_safe(jr.get("name", "")), border=1, fill=True)
+            pdf.cell(jr_widths[0], 6, jr.get("name", ""), border=1, fill=True)
             pdf.cell(jr_widths[1], 6, jstatus, border=1, fill=True, align="C")
             pdf.set_text_color(60, 60, 60)
-            pdf.cell(jr_widths[2], 6, latin_safe(jr.get("classification", "")), border=1, fill=True, align="C")
+            pdf.cell(jr_widths[2], 6, jr.get("classification", ""), border=1, fill=True, align="C")
             steps_str = f"{jr.get('steps_passed', 0)}/{jr.get('steps_total', 0)}"
             pdf.cell(jr_widths[3], 6, steps_str, border=1, fill=True, align="C")
             pdf.ln()
@@ -846,7 +865,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.cell(0, 8, "Executive Summary", new_x="LMARGIN", new_y="NEXT")
     pdf.set_font("Helvetica", "", 9)
     pdf.set_text_color(40, 40, 40)
-    pdf.multi_cell(0, 5, latin_safe(data.get("executive_summary", "")))
+    pdf.multi_cell(0, 5, data.get("executive_summary", ""))
     pdf.ln(4)
 
     # ── Issues by Severity ──
@@ -904,14 +923,19 @@ def generate_pdf(data: dict, output_path: str):
                 pdf.set_font("Helvetica", "I", 7)
                 pdf.set_text_color(100, 100, 100)
                 pdf.cell(issue_widths[0], 4, "", border=0)
-                pdf.multi_cell(sum(issue_widths[1:]), 4, truncate(latin_safe(f"Fix: {rec}"), 120))
+                pdf.multi_cell(sum(issue_widths[1:]), 4, truncate(f"Fix: {rec}", 120))
                 pdf.set_font("Helvetica", "", 7.5)
 
-            # E2E screenshot embedding
-            ss_path = iss.get("screenshot_path", "")
-            if ss_path and os.path.exists(ss_path):
+            # E2E screenshot thumbnail (see attach_screenshot_thumbs), fitted to one page
+            thumb = iss.get("screenshot_thumb", "")
+            if thumb:
+                thumb_path = os.path.join(os.path.dirname(output_path), thumb)
                 try:
-                    pdf.image(ss_path, x=pdf.l_margin + issue_widths[0], w=150)
+                    from PIL import Image  # thumbnails only exist when Pillow is installed
+
+                    with Image.open(thumb_path) as im:
+                        w = min(150, SCREENSHOT_MAX_H * im.width / im.height)
+                    pdf.image(thumb_path, x=pdf.l_margin + issue_widths[0], w=w)
                     pdf.ln(5)
                 except Exception:
                     pass  # Skip if image can't be embedded
@@ -925,7 +949,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.set_font("Helvetica", "", 9)
     pdf.set_text_color(40, 40, 40)
     for i, rec in enumerate(data.get("recommendations", []), 1):
-        pdf.multi_cell(0, 5, latin_safe(f"  {i}. {rec}"))
+        pdf.multi_cell(0, 5, f"  {i}. {rec}")
         pdf.ln(1)
 
     # ── Footer metadata ──
@@ -933,7 +957,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.set_font("Helvetica", "I", 8)
     pdf.set_text_color(130, 130, 130)
     files_total = data.get("files_reviewed_total", 0)
-    pdf.cell(0, 5, latin_safe(f"Files Reviewed: {files_total}  |  Stack: {data.get('tech_stack', '')}"), new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 5, f"Files Reviewed: {files_total}  |  Stack: {data.get('tech_stack', '')}", new_x="LMARGIN", new_y="NEXT")
 
     pdf.output(output_path)
 
@@ -1130,40 +1154,67 @@ def generate_md(data: dict, output_path: str):
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 
-def main():
-    parser = argparse.ArgumentParser(description="Export production code review to MD, PDF, and HTML")
-    parser.add_argument("--input", required=True, help="Path to JSON input file")
-    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
-    args = parser.parse_args()
-
-    with open(args.input, "r") as f:
-        data = json.load(f)
-
-    paths = compute_paths(data, args.output_dir)
-
-    generate_html(data, paths["html"])
-    generate_pdf(data, paths["pdf"])
-    generate_md(data, paths["md"])
-
-    # Copy E2E screenshots to output directory if present
+def export_report(data: dict, output_dir: str, workers=None, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Render every requested format for one code review and return the result dict."""
+    paths = compute_paths(data, output_dir)
+    data = fuse_payload(data)
+    jobs = [
+        ("html", generate_html, paths["html"]),
+        ("pdf", generate_pdf, paths["pdf"]),
+        ("md", generate_md, paths["md"]),
+    ]
+    # Only the HTML and PDF show screenshot thumbnails; a Markdown-only run skips building them
+    if {"html", "pdf"} & set(parse_formats(formats, [fmt for fmt, _, _ in jobs])):
+        data = attach_screenshot_thumbs(data, paths["folder"])
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+    # Mirror E2E screenshots into the output directory, moving only new or changed files
     screenshot_dir = data.get("screenshot_dir", "")
     screenshots_dest = ""
     if screenshot_dir and os.path.isdir(screenshot_dir):
         screenshots_dest = os.path.join(paths["folder"], "e2e-screenshots")
-        if os.path.exists(screenshots_dest):
-            shutil.rmtree(screenshots_dest)
-        shutil.copytree(screenshot_dir, screenshots_dest)
+        screenshot_sync = sync_tree(screenshot_dir, screenshots_dest)
 
     result = {
-        "html": paths["html"],
-        "pdf": paths["pdf"],
-        "md": paths["md"],
+        **summarize(timings),
         "output_folder": paths["folder"],
         "verdict": data.get("verdict", ""),
         "score": data.get("production_readiness_score", 0),
     }
     if screenshots_dest:
         result["screenshots"] = screenshots_dest
+        result["screenshot_sync"] = screenshot_sync
+    return result
+
+
+def export_file(input_path: str, output_dir: str, workers=1, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Load one JSON input and export it (batch mode entry point)."""
+    with open(input_path, "r") as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export production code review to MD, PDF, and HTML")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to JSON input file")
+    source.add_argument("--inputs", help="Glob or manifest of JSON files to export in one batch (prints JSON lines)")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel render processes (1 = serial)")
+    parser.add_argument("--formats", default="all", type=formats_arg(["html", "pdf", "md"]), help="Export formats: all, html, pdf, md (comma-separated)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if outputs are current for this input")
+    parser.add_argument("--profile", action="store_true", help="Profile each render (cProfile + tracemalloc) and write {stem}.profile.json")
+    parser.add_argument("--optimize-pdf", action="store_true", help="Recompress and deduplicate PDF output; report bytes before/after in the result")
+    args = parser.parse_args()
+
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
+    with open(args.input, "r") as f:
+        data = json.load(f)
+
+    result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
     print(json.dumps(result, indent=2))
 
 
@@ -5,6 +5,10 @@ Repo Summary Export -- Generate MD, PDF, and HTML from repo analysis data.
 Usage:
     python3 repo_summary_export.py --input /tmp/repo_summary_export.json
     python3 repo_summary_export.py --input data.json --output-dir /custom/path/
+    python3 repo_summary_export.py --input data.json --formats html   # skip the PDF backend
+    python3 repo_summary_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 repo_summary_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 repo_summary_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 
 Input: JSON payload from summary-synthesizer agent
 Output: .html, .pdf, .md in {output_dir}/Repo_Summaries/ folder
@@ -13,18 +17,26 @@ Output: .html, .pdf, .md in {output_dir}/Repo_Summaries/ folder
 import argparse
 import json
 import os
-import re
 import sys
 from datetime import date
+from functools import lru_cache
 
-# Use venv packages
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-for d in os.listdir(VENV_SITE):
-    sp = os.path.join(VENV_SITE, d, "site-packages")
-    if os.path.isdir(sp) and sp not in sys.path:
-        sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.memo import section
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.text import escape_html, slugify
 
 # -- Constants ----------------------------------------------------------------
 
@@ -124,14 +136,6 @@ format_gap_type = format_label
 
 # -- Helpers ------------------------------------------------------------------
 
-def slugify(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^\w\s-]", "", s)
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"-+", "-", s)
-    return s[:60].strip("-") or "untitled"
-
-
 def compute_paths(data: dict, output_dir: str):
     project = slugify(data.get("project_name", "project"))
     d = data.get("date", date.today().isoformat())
@@ -147,26 +151,8 @@ def compute_paths(data: dict, output_dir: str):
     }
 
 
-def escape_html(s: str) -> str:
-    return (str(s).replace("&", "&amp;")
-                  .replace("<", "&lt;")
-                  .replace(">", "&gt;")
-                  .replace('"', "&quot;"))
-
-
-def latin_safe(s: str) -> str:
-    replacements = {
-        "\u2014": "--", "\u2013": "-", "\u2018": "'", "\u2019": "'",
-        "\u201c": '"', "\u201d": '"', "\u2026": "...", "\u2022": "*",
-        "\u00a0": " ", "\u200b": "", "\u2713": "[x]", "\u2717": "[ ]",
-    }
-    for char, repl in replacements.items():
-        s = s.replace(char, repl)
-    return s.encode("latin-1", errors="replace").decode("latin-1")
-
-
 def truncate(s: str, max_len: int = 60) -> str:
-    s = latin_safe(str(s)) if s else ""
+    s = str(s) if s else ""
     return s[:max_len - 3] + "..." if len(s) > max_len else s
 
 
@@ -195,6 +181,7 @@ def group_gaps_by_severity(gaps: list) -> dict:
     return {k: groups[k] for k in order if k in groups}
 
 
+@section("stack_dependencies")
 def _html_stack_deps(data: dict) -> str:
     """Build HTML tables for categorized stack dependencies."""
     stack_deps = data.get("stack_dependencies", {})
@@ -218,6 +205,7 @@ def _html_stack_deps(data: dict) -> str:
     return "\n".join(sections)
 
 
+@section("test_results")
 def _html_test_suite(data: dict) -> str:
     """Build HTML for test suite results section (v1.1)."""
     test_results = data.get("test_results")
@@ -264,6 +252,7 @@ def _html_test_suite(data: dict) -> str:
 </div>"""
 
 
+@section("integration_chains")
 def _html_integration_chains(data: dict) -> str:
     """Build HTML for integration chains section (v1.1)."""
     chains_data = data.get("integration_chains")
@@ -313,6 +302,7 @@ def _html_integration_chains(data: dict) -> str:
   </table>"""
 
 
+@section("recency_data")
 def _html_recency(data: dict) -> str:
     """Build HTML for recency data section (v1.1)."""
     recency = data.get("recency_data")
@@ -335,57 +325,10 @@ def _html_recency(data: dict) -> str:
   {"<h4>Most Active Files</h4><table><tr><th>File</th><th style='width:80px;text-align:center'>Changes</th></tr>" + file_rows + "</table>" if file_rows else ""}"""
 
 
-# -- HTML Generation ---------------------------------------------------------
-
-def generate_html(data: dict, output_path: str):
-    project = escape_html(data.get("project_name", "Project"))
-    d = escape_html(data.get("date", ""))
-    maturity_level = data.get("maturity_level", "PROTOTYPE")
-    score = data.get("maturity_score", 0)
-    dim_scores = data.get("dimension_scores", {})
-    purpose = data.get("purpose", {})
+@section("features", "version")
+def _html_feature_rows(data: dict) -> str:
+    """Build the feature inventory table rows (v1.1 adds depth/tests/recency/chain columns)."""
     features = data.get("features", [])
-    feature_summary = data.get("feature_summary", {})
-    stack = data.get("stack", {})
-    gaps = data.get("gaps", [])
-    gap_summary = data.get("gap_summary", {})
-    architecture = data.get("architecture", {})
-    infra_checklist = data.get("infrastructure_checklist", {})
-    recommendations = data.get("recommendations", [])
-    exec_summary = escape_html(data.get("executive_summary", ""))
-    handoff_brief = data.get("handoff_brief", "")
-    suite_ctx = data.get("suite_context")
-    git_stats = data.get("git_stats", {})
-
-    mc = MATURITY_COLORS.get(maturity_level, MATURITY_COLORS["PROTOTYPE"])
-
-    # Dimension score bars (Fix 9: handle 0-value scores)
-    dim_rows = ""
-    for key, info in dim_scores.items():
-        ds = info.get("score", 0)
-        weight = info.get("weight", 0)
-        dn = escape_html(DIMENSION_NAMES.get(key, key))
-        bg = score_color_bg(ds)
-        tc = score_color_text(ds)
-        if ds == 0:
-            bar_html = f'''<div style="background:#F1F5F9;border-radius:4px;height:24px;position:relative;display:flex;align-items:center;padding-left:8px">
-                <span style="font-size:12px;font-weight:700;color:{tc}">0</span>
-              </div>'''
-        else:
-            pct = max(8, ds)
-            bar_html = f'''<div style="background:#F1F5F9;border-radius:4px;height:24px;position:relative;overflow:hidden">
-              <div style="background:{bg};height:100%;width:{pct}%;border-radius:4px;display:flex;align-items:center;padding-left:8px">
-                <span style="font-size:12px;font-weight:700;color:{tc}">{ds}</span>
-              </div>
-            </div>'''
-        dim_rows += f"""
-        <tr>
-          <td style="font-weight:600">{dn}</td>
-          <td>{bar_html}</td>
-          <td style="text-align:center">{int(weight * 100)}%</td>
-        </tr>"""
-
-    # Feature inventory table -- detect v1.1 features
     is_v11 = data.get("version", "1.0") >= "1.1"
     feature_rows = ""
     for feat in features:
@@ -454,6 +397,97 @@ def generate_html(data: dict, output_path: str):
             {"<br>".join(detail_parts)}
           </td>
         </tr>"""
+    return feature_rows
+
+
+@section("gaps")
+def _html_gap_sections(data: dict) -> str:
+    """Build one severity-colored gap table per severity level."""
+    gaps = data.get("gaps", [])
+    grouped_gaps = group_gaps_by_severity(gaps)
+    gap_sections = ""
+    for sev, sev_gaps in grouped_gaps.items():
+        gc = SEVERITY_COLORS.get(sev, SEVERITY_COLORS["LOW"])
+        rows = ""
+        for g in sev_gaps:
+            effort = g.get("effort_estimate", "")
+            rows += f"""
+            <tr>
+              <td style="font-weight:600">{escape_html(g.get('id', ''))}</td>
+              <td>{escape_html(g.get('title', ''))}</td>
+              <td style="font-size:12px">{escape_html(format_gap_type(g.get('type', '')))}</td>
+              <td style="font-size:12px">{escape_html(effort)}</td>
+            </tr>
+            <tr>
+              <td colspan="4" style="background:{gc['bg']};padding:8px 12px;font-size:13px">
+                <strong>Fix:</strong> {escape_html(g.get('recommendation', ''))}
+              </td>
+            </tr>"""
+        gap_sections += f"""
+        <h3 style="color:{gc['header_bg']}">{sev} ({len(sev_gaps)})</h3>
+        <table>
+          <tr>
+            <th style="background:{gc['header_bg']};width:70px">ID</th>
+            <th style="background:{gc['header_bg']}">Gap</th>
+            <th style="background:{gc['header_bg']};width:140px">Type</th>
+            <th style="background:{gc['header_bg']};width:80px">Effort</th>
+          </tr>
+          {rows}
+        </table>"""
+    return gap_sections
+
+
+# -- HTML Generation ---------------------------------------------------------
+
+def generate_html(data: dict, output_path: str):
+    project = escape_html(data.get("project_name", "Project"))
+    d = escape_html(data.get("date", ""))
+    maturity_level = data.get("maturity_level", "PROTOTYPE")
+    score = data.get("maturity_score", 0)
+    dim_scores = data.get("dimension_scores", {})
+    purpose = data.get("purpose", {})
+    feature_summary = data.get("feature_summary", {})
+    stack = data.get("stack", {})
+    gap_summary = data.get("gap_summary", {})
+    architecture = data.get("architecture", {})
+    infra_checklist = data.get("infrastructure_checklist", {})
+    recommendations = data.get("recommendations", [])
+    exec_summary = escape_html(data.get("executive_summary", ""))
+    handoff_brief = data.get("handoff_brief", "")
+    suite_ctx = data.get("suite_context")
+    git_stats = data.get("git_stats", {})
+
+    mc = MATURITY_COLORS.get(maturity_level, MATURITY_COLORS["PROTOTYPE"])
+
+    # Dimension score bars (Fix 9: handle 0-value scores)
+    dim_rows = ""
+    for key, info in dim_scores.items():
+        ds = info.get("score", 0)
+        weight = info.get("weight", 0)
+        dn = escape_html(DIMENSION_NAMES.get(key, key))
+        bg = score_color_bg(ds)
+        tc = score_color_text(ds)
+        if ds == 0:
+            bar_html = f'''<div style="background:#F1F5F9;border-radius:4px;height:24px;position:relative;display:flex;align-items:center;padding-left:8px">
+                <span style="font-size:12px;font-weight:700;color:{tc}">0</span>
+              </div>'''
+        else:
+            pct = max(8, ds)
+            bar_html = f'''<div style="background:#F1F5F9;border-radius:4px;height:24px;position:relative;overflow:hidden">
+              <div style="background:{bg};height:100%;width:{pct}%;border-radius:4px;display:flex;align-items:center;padding-left:8px">
+                <span style="font-size:12px;font-weight:700;color:{tc}">{ds}</span>
+              </div>
+            </div>'''
+        dim_rows += f"""
+        <tr>
+          <td style="font-weight:600">{dn}</td>
+          <td>{bar_html}</td>
+          <td style="text-align:center">{int(weight * 100)}%</td>
+        </tr>"""
+
+    # Feature inventory table -- detect v1.1 features
+    is_v11 = data.get("version", "1.0") >= "1.1"
+    feature_rows = _html_feature_rows(data)
 
     # Stack dependencies
     stack_deps = ""
@@ -496,36 +530,7 @@ def generate_html(data: dict, output_path: str):
         </tr>"""
 
     # Gaps table
-    grouped_gaps = group_gaps_by_severity(gaps)
-    gap_sections = ""
-    for sev, sev_gaps in grouped_gaps.items():
-        gc = SEVERITY_COLORS.get(sev, SEVERITY_COLORS["LOW"])
-        rows = ""
-        for g in sev_gaps:
-            effort = g.get("effort_estimate", "")
-            rows += f"""
-            <tr>
-              <td style="font-weight:600">{escape_html(g.get('id', ''))}</td>
-              <td>{escape_html(g.get('title', ''))}</td>
-              <td style="font-size:12px">{escape_html(format_gap_type(g.get('type', '')))}</td>
-              <td style="font-size:12px">{escape_html(effort)}</td>
-            </tr>
-            <tr>
-              <td colspan="4" style="background:{gc['bg']};padding:8px 12px;font-size:13px">
-                <strong>Fix:</strong> {escape_html(g.get('recommendation', ''))}
-              </td>
-            </tr>"""
-        gap_sections += f"""
-        <h3 style="color:{gc['header_bg']}">{sev} ({len(sev_gaps)})</h3>
-        <table>
-          <tr>
-            <th style="background:{gc['header_bg']};width:70px">ID</th>
-            <th style="background:{gc['header_bg']}">Gap</th>
-            <th style="background:{gc['header_bg']};width:140px">Type</th>
-            <th style="background:{gc['header_bg']};width:80px">Effort</th>
-          </tr>
-          {rows}
-        </table>"""
+    gap_sections = _html_gap_sections(data)
 
     # Recommendations
     rec_items = "\n".join(f"<li>{escape_html(r)}</li>" for r in recommendations)
@@ -936,35 +941,43 @@ function copyDoc(elementId, btn) {{
 
 # -- PDF Generation -----------------------------------------------------------
 
-class RepoSummaryPDF(FPDF):
-    def __init__(self, data: dict):
-        super().__init__(orientation="P", unit="mm", format="Letter")
-        self.data = data
-        self.set_auto_page_break(auto=True, margin=20)
-
-    def header(self):
-        self.set_font("Helvetica", "B", 16)
-        self.set_text_color(*TEAL_RGB)
-        self.cell(0, 8, "REPOSITORY SUMMARY", new_x="LMARGIN", new_y="NEXT")
-        self.set_font("Helvetica", "", 11)
-        self.set_text_color(120, 120, 120)
-        project = latin_safe(self.data.get("project_name", ""))
-        self.cell(0, 6, project, new_x="LMARGIN", new_y="NEXT")
-        self.set_font("Helvetica", "", 9)
-        d = self.data.get("date", "")
-        stack_info = latin_safe(self.data.get("stack", {}).get("framework", ""))
-        self.cell(0, 5, f"{d}  |  {stack_info}", new_x="LMARGIN", new_y="NEXT")
-        self.line(self.l_margin, self.get_y() + 1, self.w - self.r_margin, self.get_y() + 1)
-        self.ln(4)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Helvetica", "I", 7)
-        self.set_text_color(150, 150, 150)
-        self.cell(0, 10, f"Generated by Claude Code  |  Repo Summarizer  |  Confidential  |  Page {self.page_no()}/{{nb}}", align="C")
+@lru_cache(maxsize=None)
+def _pdf_class():
+    """Define RepoSummaryPDF on first use so fpdf is only imported when a PDF is requested."""
+    from rok_export.pdf import ReportPDF
+
+    class RepoSummaryPDF(ReportPDF):
+        def __init__(self, data: dict):
+            super().__init__(orientation="P", unit="mm", format="Letter")
+            self.data = data
+            self.set_auto_page_break(auto=True, margin=20)
+
+        def header(self):
+            self.set_font("Helvetica", "B", 16)
+            self.set_text_color(*TEAL_RGB)
+            self.cell(0, 8, "REPOSITORY SUMMARY", new_x="LMARGIN", new_y="NEXT")
+            self.set_font("Helvetica", "", 11)
+            self.set_text_color(120, 120, 120)
+            project = self.data.get("project_name", "")
+            self.cell(0, 6, project, new_x="LMARGIN", new_y="NEXT")
+            self.set_font("Helvetica", "", 9)
+            d = self.data.get("date", "")
+            stack_info = self.data.get("stack", {}).get("framework", "")
+            self.cell(0, 5, f"{d}  |  {stack_info}", new_x="LMARGIN", new_y="NEXT")
+            self.line(self.l_margin, self.get_y() + 1, self.w - self.r_margin, self.get_y() + 1)
+            self.ln(4)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 7)
+            self.set_text_color(150, 150, 150)
+            self.cell(0, 10, f"Generated by Claude Code  |  Repo Summarizer  |  Confidential  |  Page {self.page_no()}/{{nb}}", align="C")
+
+    return RepoSummaryPDF
 
 
 def generate_pdf(data: dict, output_path: str):
+    RepoSummaryPDF = _pdf_class()
     pdf = RepoSummaryPDF(data)
     pdf.alias_nb_pages()
     pdf.add_page()
@@ -1010,7 +1023,7 @@ def generate_pdf(data: dict, output_path: str):
     fs = feature_summary
     gs = gap_summary
     pdf.set_x(pdf.l_margin)
-    pdf.multi_cell(avail_w, 6, latin_safe(
+    pdf.multi_cell(avail_w, 6, (
         f"Features: {fs.get('complete', 0)} complete, {fs.get('partial', 0)} partial, "
         f"{fs.get('stub', 0)} stubs, {fs.get('planned', 0)} planned  |  "
         f"Gaps: {gs.get('critical', 0)} crit, {gs.get('high', 0)} high, {gs.get('medium', 0)} med, {gs.get('low', 0)} low"
@@ -1030,7 +1043,7 @@ def generate_pdf(data: dict, output_path: str):
             parts.append(f"Contributors: {', '.join(git_stats['contributors'][:3])}")
         if parts:
             pdf.set_x(pdf.l_margin)
-            pdf.multi_cell(avail_w, 4, latin_safe("  |  ".join(parts)), align="C")
+            pdf.multi_cell(avail_w, 4, "  |  ".join(parts), align="C")
     pdf.ln(4)
 
     # -- Dimension Scores --
@@ -1052,7 +1065,7 @@ def generate_pdf(data: dict, output_path: str):
     for idx, (key, info) in enumerate(dim_scores.items()):
         ds = info.get("score", 0)
         weight = info.get("weight", 0)
-        dn = latin_safe(DIMENSION_NAMES.get(key, key))
+        dn = DIMENSION_NAMES.get(key, key)
 
         if idx % 2 == 0:
             pdf.set_fill_color(248, 250, 252)
@@ -1083,11 +1096,11 @@ def generate_pdf(data: dict, output_path: str):
         pdf.set_font("Helvetica", "B", 10)
         pdf.set_text_color(*TEAL_RGB)
         pdf.set_x(pdf.l_margin)
-        pdf.multi_cell(avail_w, 5, latin_safe(purpose.get("statement", "")))
+        pdf.multi_cell(avail_w, 5, purpose.get("statement", ""))
         pdf.set_font("Helvetica", "", 9)
         pdf.set_text_color(40, 40, 40)
         pdf.set_x(pdf.l_margin)
-        pdf.multi_cell(avail_w, 5, latin_safe(purpose.get("extended", "")))
+        pdf.multi_cell(avail_w, 5, purpose.get("extended", ""))
         pdf.ln(4)
 
     # -- Executive Summary --
@@ -1097,7 +1110,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.set_font("Helvetica", "", 9)
     pdf.set_text_color(40, 40, 40)
     pdf.set_x(pdf.l_margin)
-    pdf.multi_cell(avail_w, 5, latin_safe(data.get("executive_summary", "")))
+    pdf.multi_cell(avail_w, 5, data.get("executive_summary", ""))
     pdf.ln(4)
 
     # -- Architecture --
@@ -1112,7 +1125,7 @@ def generate_pdf(data: dict, output_path: str):
         f"Data Flow: {architecture.get('data_flow', 'N/A')}"
     )
     pdf.set_x(pdf.l_margin)
-    pdf.multi_cell(avail_w, 5, latin_safe(arch_text))
+    pdf.multi_cell(avail_w, 5, arch_text)
     pdf.ln(2)
 
     # Key files table -- proportional widths
@@ -1160,7 +1173,7 @@ def generate_pdf(data: dict, output_path: str):
             stack_meta.append(f"Deploy: {stack['deployment']}")
         if stack_meta:
             pdf.set_x(pdf.l_margin)
-            pdf.multi_cell(avail_w, 5, latin_safe("  |  ".join(stack_meta)))
+            pdf.multi_cell(avail_w, 5, "  |  ".join(stack_meta))
             pdf.ln(2)
 
         if stack_deps:
@@ -1178,14 +1191,14 @@ def generate_pdf(data: dict, output_path: str):
                     ver = "" if isinstance(dep, str) else dep.get("version", "")
                     purp = "" if isinstance(dep, str) else dep.get("purpose", "")
                     pdf.set_fill_color(248, 250, 252)
-                    pdf.cell(sd_widths[0], 4.5, truncate(latin_safe(name), 20), border=0, fill=True)
-                    pdf.cell(sd_widths[1], 4.5, truncate(latin_safe(ver), 28), border=0, fill=True)
-                    pdf.cell(sd_widths[2], 4.5, truncate(latin_safe(purp), 40), border=0, fill=True,
+                    pdf.cell(sd_widths[0], 4.5, truncate(name, 20), border=0, fill=True)
+                    pdf.cell(sd_widths[1], 4.5, truncate(ver, 28), border=0, fill=True)
+                    pdf.cell(sd_widths[2], 4.5, truncate(purp, 40), border=0, fill=True,
                              new_x="LMARGIN", new_y="NEXT")
             pdf.ln(2)
         elif stack.get("key_dependencies"):
             pdf.set_x(pdf.l_margin)
-            pdf.multi_cell(avail_w, 5, latin_safe("Key deps: " + ", ".join(stack["key_dependencies"])))
+            pdf.multi_cell(avail_w, 5, "Key deps: " + ", ".join(stack["key_dependencies"]))
         pdf.ln(4)
 
     # -- Feature Inventory --
@@ -1250,9 +1263,9 @@ def generate_pdf(data: dict, output_path: str):
             pdf.set_fill_color(255, 255, 255)
         pdf.set_text_color(60, 60, 60)
         notes_trunc = int(ic_widths[2] / 1.5)
-        pdf.cell(ic_widths[0], 5.5, latin_safe(f"  {item_name}"), border=1, fill=True)
-        pdf.cell(ic_widths[1], 5.5, latin_safe(q_val.title()), border=1, fill=True, align="C")
-        pdf.cell(ic_widths[2], 5.5, truncate(latin_safe(notes), notes_trunc), border=1, fill=True,
+        pdf.cell(ic_widths[0], 5.5, f"  {item_name}", border=1, fill=True)
+        pdf.cell(ic_widths[1], 5.5, q_val.title(), border=1, fill=True, align="C")
+        pdf.cell(ic_widths[2], 5.5, truncate(notes, notes_trunc), border=1, fill=True,
                  new_x="LMARGIN", new_y="NEXT")
     pdf.ln(4)
 
@@ -1273,7 +1286,7 @@ def generate_pdf(data: dict, output_path: str):
         test_files_t = test_results.get("test_files_count", 0)
         test_line = f"Runner: {runner} | Total: {total_t} | Passed: {passed_t} | Failed: {failed_t} | Rate: {rate_pct} | Files: {test_files_t}"
         pdf.set_x(pdf.l_margin)
-        pdf.multi_cell(avail_w, 5, latin_safe(test_line))
+        pdf.multi_cell(avail_w, 5, test_line)
         pdf.ln(4)
 
     # -- Gaps --
@@ -1317,7 +1330,7 @@ def generate_pdf(data: dict, output_path: str):
                 pdf.set_text_color(100, 100, 100)
                 pdf.set_x(pdf.l_margin + gap_widths[0])
                 rec_width = avail_w - gap_widths[0]
-                pdf.multi_cell(rec_width, 4, latin_safe(f"Fix: {rec}"))
+                pdf.multi_cell(rec_width, 4, f"Fix: {rec}")
                 pdf.set_font("Helvetica", "", 7)
         pdf.ln(4)
 
@@ -1329,7 +1342,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.set_text_color(40, 40, 40)
     for i, rec in enumerate(recommendations, 1):
         pdf.set_x(pdf.l_margin)
-        pdf.multi_cell(avail_w, 5, latin_safe(f"  {i}. {rec}"))
+        pdf.multi_cell(avail_w, 5, f"  {i}. {rec}")
         pdf.ln(1)
 
     # -- Handoff Brief --
@@ -1340,7 +1353,7 @@ def generate_pdf(data: dict, output_path: str):
     pdf.set_font("Courier", "", 7.5)
     pdf.set_text_color(40, 40, 40)
     pdf.set_x(pdf.l_margin)
-    pdf.multi_cell(avail_w, 3.8, latin_safe(handoff_brief))
+    pdf.multi_cell(avail_w, 3.8, handoff_brief)
 
     # -- Gap Analysis (v1.1) --
     gap_analysis_md = data.get("gap_analysis", "")
@@ -1356,7 +1369,7 @@ def generate_pdf(data: dict, output_path: str):
         pdf.set_font("Courier", "", 7.5)
         pdf.set_text_color(40, 40, 40)
         pdf.set_x(pdf.l_margin)
-        pdf.multi_cell(avail_w, 3.8, latin_safe(gap_analysis_md))
+        pdf.multi_cell(avail_w, 3.8, gap_analysis_md)
 
     pdf.output(output_path)
 
@@ -1738,29 +1751,52 @@ def generate_md(data: dict, output_path: str):
 
 # -- Main --------------------------------------------------------------------
 
+def export_report(data: dict, output_dir: str, workers=None, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Render every requested format for one repo summary and return the result dict."""
+    paths = compute_paths(data, output_dir)
+
+    timings = run_exports(data, [
+        ("html", generate_html, paths["html"]),
+        ("pdf", generate_pdf, paths["pdf"]),
+        ("md", generate_md, paths["md"]),
+    ], max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+    result = {
+        **summarize(timings),
+        "output_folder": paths["folder"],
+        "maturity_level": data.get("maturity_level", ""),
+        "maturity_score": data.get("maturity_score", 0),
+    }
+    return result
+
+
+def export_file(input_path: str, output_dir: str, workers=1, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Load one JSON input and export it (batch mode entry point)."""
+    with open(input_path, "r") as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Export repo summary to MD, PDF, and HTML")
-    parser.add_argument("--input", required=True, help="Path to JSON input file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to JSON input file")
+    source.add_argument("--inputs", help="Glob or manifest of JSON files to export in one batch (prints JSON lines)")
     parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Base output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel render processes (1 = serial)")
+    parser.add_argument("--formats", default="all", type=formats_arg(["html", "pdf", "md"]), help="Export formats: all, html, pdf, md (comma-separated)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if outputs are current for this input")
+    parser.add_argument("--profile", action="store_true", help="Profile each render (cProfile + tracemalloc) and write {stem}.profile.json")
+    parser.add_argument("--optimize-pdf", action="store_true", help="Recompress and deduplicate PDF output; report bytes before/after in the result")
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     with open(args.input, "r") as f:
         data = json.load(f)
 
-    paths = compute_paths(data, args.output_dir)
-
-    generate_html(data, paths["html"])
-    generate_pdf(data, paths["pdf"])
-    generate_md(data, paths["md"])
-
-    result = {
-        "html": paths["html"],
-        "pdf": paths["pdf"],
-        "md": paths["md"],
-        "output_folder": paths["folder"],
-        "maturity_level": data.get("maturity_level", ""),
-        "maturity_score": data.get("maturity_score", 0),
-    }
+    result = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
     print(json.dumps(result, indent=2))
 
 
@@ -6,6 +6,9 @@ Usage:
     python3 estate_snapshot_export.py --input /tmp/estate_snapshot_export.json
     python3 estate_snapshot_export.py --input data.json --output-dir /custom/path/
     python3 estate_snapshot_export.py --input data.json --formats html,pdf
+    python3 estate_snapshot_export.py --inputs '/tmp/batch/*.json'   # batch: one JSON line per report
+    python3 estate_snapshot_export.py --input data.json --profile   # cProfile + tracemalloc summary beside the outputs
+    python3 estate_snapshot_export.py --input data.json --optimize-pdf   # recompress + deduplicate the PDF, bytes saved in the result
 
 Input: JSON payload from estate-synthesizer agent or command output
 Output: .html, .pdf, .md in {output_dir}/ folder
@@ -16,19 +19,26 @@ Supported types: estate_snapshot
 import argparse
 import json
 import os
-import re
 import sys
 from datetime import date
+from functools import lru_cache
 
-# Use venv packages
-VENV_SITE = os.path.expanduser("~/.claude/scripts/.venv/lib")
-if os.path.isdir(VENV_SITE):
-    for d in os.listdir(VENV_SITE):
-        sp = os.path.join(VENV_SITE, d, "site-packages")
-        if os.path.isdir(sp) and sp not in sys.path:
-            sys.path.insert(0, sp)
+# Shared export helpers live in the marketplace's shared/ directory
+SHARED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared")
+if not os.path.isdir(SHARED_DIR):
+    SHARED_DIR = os.path.expanduser("~/.claude/plugins/marketplaces/rok-plugin-marketplace/shared")
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
 
-from fpdf import FPDF
+# Use venv packages (resolved path is cached in the venv, see rok_export.bootstrap)
+from rok_export.bootstrap import add_venv_site_packages
+
+add_venv_site_packages()
+
+from rok_export.batch import run_batch
+from rok_export.runner import formats_arg, run_exports, summarize
+from rok_export.tables import draw_table
+from rok_export.text import escape_html
 
 # -- Constants ----------------------------------------------------------------
 
@@ -72,14 +82,6 @@ HEALTH_COLORS = {
 
 # -- Helpers ------------------------------------------------------------------
 
-def slugify(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^\w\s-]", "", s)
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"-+", "-", s)
-    return s[:60].strip("-") or "untitled"
-
-
 def compute_paths(data: dict, output_dir: str):
     d = data.get("date", data.get("snapshot_date", date.today().isoformat()))
     version = data.get("version", 1)
@@ -95,24 +97,6 @@ def compute_paths(data: dict, output_dir: str):
     }
 
 
-def escape_html(s) -> str:
-    return (str(s).replace("&", "&amp;")
-                  .replace("<", "&lt;")
-                  .replace(">", "&gt;")
-                  .replace('"', "&quot;"))
-
-
-def latin_safe(s: str) -> str:
-    replacements = {
-        "\u2014": "--", "\u2013": "-", "\u2018": "'", "\u2019": "'",
-        "\u201c": '"', "\u201d": '"', "\u2026": "...", "\u2022": "*",
-        "\u00a0": " ", "\u200b": "", "\u2713": "[x]", "\u2717": "[ ]",
-    }
-    for char, repl in replacements.items():
-        s = s.replace(char, repl)
-    return s.encode("latin-1", errors="replace").decode("latin-1")
-
-
 def strip_git_suffix(url: str) -> str:
     s = url.replace("https://github.com/", "")
     if s.endswith(".git"):
@@ -516,75 +500,59 @@ def generate_estate_html(data: dict, output_path: str):
 
 # -- PDF Generation ----------------------------------------------------------
 
-class EstatePDF(FPDF):
-    def header(self):
-        if self.page_no() == 1:
-            return
-        self.set_font("Helvetica", "I", 8)
-        self.set_text_color(*SLATE_LIGHT_RGB)
-        self.cell(0, 6, "CONFIDENTIAL - Digital Estate Snapshot", align="C")
-        self.ln(8)
-
-    def footer(self):
-        self.set_y(-15)
-        self.set_font("Helvetica", "I", 8)
-        self.set_text_color(100, 116, 139)
-        self.cell(0, 10, f"Digital Estate Snapshot | Page {self.page_no()}", align="C")
-
-    def section_title(self, title: str):
-        self.set_font("Helvetica", "B", 14)
-        self.set_text_color(*SLATE_RGB)
-        self.cell(0, 10, latin_safe(title), ln=True)
-        self.set_draw_color(*AMBER_RGB)
-        self.set_line_width(0.5)
-        self.line(10, self.get_y(), 200, self.get_y())
-        self.ln(4)
-
-    def sub_title(self, title: str):
-        self.set_font("Helvetica", "B", 11)
-        self.set_text_color(*SLATE_LIGHT_RGB)
-        self.cell(0, 8, latin_safe(title), ln=True)
-        self.ln(2)
-
-    def body_text(self, text: str):
-        self.set_font("Helvetica", "", 10)
-        self.set_text_color(26, 32, 44)
-        self.multi_cell(0, 5, latin_safe(text))
-        self.ln(3)
-
-    def add_table(self, headers: list, rows: list, col_widths: list = None):
-        if not col_widths:
-            w = (self.w - 20) / len(headers)
-            col_widths = [w] * len(headers)
-
-        # Header
-        self.set_font("Helvetica", "B", 8)
-        self.set_fill_color(*SLATE_RGB)
-        self.set_text_color(255, 255, 255)
-        for i, h in enumerate(headers):
-            self.cell(col_widths[i], 7, latin_safe(h), 1, 0, "C", fill=True)
-        self.ln()
-
-        # Rows
-        self.set_font("Helvetica", "", 8)
-        self.set_text_color(26, 32, 44)
-        fill = False
-        for row in rows:
-            if self.get_y() > 265:
-                self.add_page()
-            if fill:
-                self.set_fill_color(247, 249, 252)
-            else:
-                self.set_fill_color(255, 255, 255)
-            for i, cell_text in enumerate(row):
-                safe = latin_safe(str(cell_text))[:int(col_widths[i] / 1.8)]
-                self.cell(col_widths[i], 7, safe, 1, 0, "L", fill=True)
-            self.ln()
-            fill = not fill
-        self.ln(4)
+@lru_cache(maxsize=None)
+def _pdf_class():
+    """Define EstatePDF on first use so fpdf is only imported when a PDF is requested."""
+    from rok_export.pdf import ReportPDF
+
+    class EstatePDF(ReportPDF):
+        def header(self):
+            if self.page_no() == 1:
+                return
+            self.set_font("Helvetica", "I", 8)
+            self.set_text_color(*SLATE_LIGHT_RGB)
+            self.cell(0, 6, "CONFIDENTIAL - Digital Estate Snapshot", align="C")
+            self.ln(8)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font("Helvetica", "I", 8)
+            self.set_text_color(100, 116, 139)
+            self.cell(0, 10, f"Digital Estate Snapshot | Page {self.page_no()}", align="C")
+
+        def section_title(self, title: str):
+            self.set_font("Helvetica", "B", 14)
+            self.set_text_color(*SLATE_RGB)
+            self.cell(0, 10, title, ln=True)
+            self.set_draw_color(*AMBER_RGB)
+            self.set_line_width(0.5)
+            self.line(10, self.get_y(), 200, self.get_y())
+            self.ln(4)
+
+        def sub_title(self, title: str):
+            self.set_font("Helvetica", "B", 11)
+            self.set_text_color(*SLATE_LIGHT_RGB)
+            self.cell(0, 8, title, ln=True)
+            self.ln(2)
+
+        def body_text(self, text: str):
+            self.set_font("Helvetica", "", 10)
+            self.set_text_color(26, 32, 44)
+            self.multi_cell(0, 5, text)
+            self.ln(3)
+
+        def add_table(self, headers: list, rows: list, col_widths: list = None):
+            if not col_widths:
+                w = (self.w - 20) / len(headers)
+                col_widths = [w] * len(headers)
+            draw_table(self, headers, rows, col_widths, SLATE_RGB)
+            self.ln(4)
+
+    return EstatePDF
 
 
 def generate_estate_pdf(data: dict, output_path: str):
+    EstatePDF = _pdf_class()
     pdf = EstatePDF()
     pdf.add_page()
 
@@ -622,8 +590,8 @@ def generate_estate_pdf(data: dict, output_path: str):
             pdf.set_font("Helvetica", "B", 10)
             pdf.set_text_color(*tc["rgb"])
             pdf.cell(0, 7, f"{tier_label} ({len(items)} items)", ln=True)
-            rows = [[it.get("item", "")[:40], it.get("type", ""),
-                      str(it.get("days_left", "")), it.get("action", "")[:50]] for it in items]
+            rows = [[it.get("item", ""), it.get("type", ""),
+                      str(it.get("days_left", "")), it.get("action", "")] for it in items]
             pdf.add_table(["Item", "Type", "Days", "Action"], rows, [60, 30, 20, 80])
 
     stable_count = bus_factor.get("stable_count", 0)
@@ -635,9 +603,9 @@ def generate_estate_pdf(data: dict, output_path: str):
     # 3. Project Inventory
     pdf.section_title("3. Project Inventory")
     if projects:
-        rows = [[p.get("name", "")[:25], p.get("status", "").upper(),
-                  ", ".join(p.get("tech_stack", []))[:25],
-                  (p.get("deployment_provider") or "-")[:10],
+        rows = [[p.get("name", ""), p.get("status", "").upper(),
+                  ", ".join(p.get("tech_stack", [])),
+                  p.get("deployment_provider") or "-",
                   "Dirty" if p.get("is_dirty") else "Clean",
                   p.get("last_activity", "") or ""] for p in projects]
         pdf.add_table(["Project", "Status", "Stack", "Provider", "Git", "Last Activity"], rows,
@@ -652,11 +620,11 @@ def generate_estate_pdf(data: dict, output_path: str):
                     pdf.add_page()
                 pdf.set_font("Helvetica", "I", 7)
                 pdf.set_text_color(100, 116, 139)
-                detail = latin_safe(p.get("name", ""))
+                detail = p.get("name", "")
                 if desc:
-                    detail += f" -- {latin_safe(desc[:80])}"
+                    detail += f" -- {desc[:80]}"
                 if repo_url:
-                    detail += f" | {latin_safe(repo_url)}"
+                    detail += f" | {repo_url}"
                 pdf.cell(0, 4, detail, ln=True)
 
     # 6. Subscriptions & Costs
@@ -664,7 +632,7 @@ def generate_estate_pdf(data: dict, output_path: str):
     if subs:
         pdf.section_title("6. Subscriptions & Costs")
         pdf.body_text(f"Monthly Burn: {format_cost(cost_summary.get('monthly_burn', 0))} | Annual: {format_cost(cost_summary.get('annual_burn', 0))}")
-        rows = [[s.get("service", "")[:30], format_cost(s.get("monthly_cost", 0)),
+        rows = [[s.get("service", ""), format_cost(s.get("monthly_cost", 0)),
                   s.get("renewal_date", ""),
                   "Yes" if s.get("auto_renew") else "NO"] for s in subs]
         pdf.add_table(["Service", "Cost/mo", "Renewal", "Auto-Renew"], rows,
@@ -677,15 +645,15 @@ def generate_estate_pdf(data: dict, output_path: str):
         pdf.set_text_color(146, 64, 14)
         pdf.cell(0, 6, "NO actual passwords in this document. See credential master location.", ln=True)
         pdf.ln(2)
-        rows = [[s.get("service", ""), s.get("login_method", "")[:40],
-                  s.get("credential_location", "")[:40]] for s in access_guide]
+        rows = [[s.get("service", ""), s.get("login_method", ""),
+                  s.get("credential_location", "")] for s in access_guide]
         pdf.add_table(["Service", "Login Method", "Credential Location"], rows,
                      [40, 75, 75])
 
     # 9. Contact List
     if contacts:
         pdf.section_title("9. Contact List")
-        rows = [[c.get("name", ""), c.get("role", "")[:30],
+        rows = [[c.get("name", ""), c.get("role", ""),
                   c.get("email", ""), c.get("phone", "")] for c in contacts]
         pdf.add_table(["Name", "Role", "Email", "Phone"], rows,
                      [40, 40, 55, 55])
@@ -700,7 +668,7 @@ def generate_estate_pdf(data: dict, output_path: str):
             pdf.cell(8, 6, f"{i}.")
             pdf.set_font("Helvetica", "", 10)
             pdf.set_text_color(26, 32, 44)
-            pdf.multi_cell(0, 5, latin_safe(step_text))
+            pdf.multi_cell(0, 5, step_text)
             pdf.ln(2)
 
     # 11. Plugin Portfolio
@@ -710,7 +678,7 @@ def generate_estate_pdf(data: dict, output_path: str):
         categories = plugin_portfolio.get("categories", {})
         for cat_name, plugins in categories.items():
             pdf.sub_title(f"{cat_name} ({len(plugins)})")
-            rows = [[pl.get("name", ""), pl.get("description", "")[:80]] for pl in plugins]
+            rows = [[pl.get("name", ""), pl.get("description", "")] for pl in plugins]
             pdf.add_table(["Plugin", "Description"], rows, [50, 140])
 
     pdf.output(output_path)
@@ -847,35 +815,50 @@ def generate_estate_md(data: dict, output_path: str):
 
 # -- Dispatch ----------------------------------------------------------------
 
+def export_report(data: dict, output_dir: str, workers=None, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Render every requested format for one estate snapshot and return the result dict."""
+    paths = compute_paths(data, output_dir)
+
+    jobs = [
+        ("html", generate_estate_html, paths["html"]),
+        ("pdf", generate_estate_pdf, paths["pdf"]),
+        ("md", generate_estate_md, paths["md"]),
+    ]
+
+    timings = run_exports(data, jobs, max_workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+    results = summarize(timings)
+    results["output_folder"] = paths["folder"]
+    results["type"] = "estate_snapshot"
+    return results
+
+
+def export_file(input_path: str, output_dir: str, workers=1, formats="all", force=False, profile=False, optimize_pdf=False) -> dict:
+    """Load one JSON input and export it (batch mode entry point)."""
+    with open(input_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return export_report(data, output_dir, workers=workers, formats=formats, force=force, profile=profile, optimize_pdf=optimize_pdf)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Estate Snapshot Export")
-    parser.add_argument("--input", required=True, help="Path to JSON input file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to JSON input file")
+    source.add_argument("--inputs", help="Glob or manifest of JSON files to export in one batch (prints JSON lines)")
     parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Output directory")
-    parser.add_argument("--formats", default="all", help="Export formats: all, html, pdf, md (comma-separated)")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel render processes (1 = serial)")
+    parser.add_argument("--formats", default="all", type=formats_arg(["html", "pdf", "md"]), help="Export formats: all, html, pdf, md (comma-separated)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if outputs are current for this input")
+    parser.add_argument("--profile", action="store_true", help="Profile each render (cProfile + tracemalloc) and write {stem}.profile.json")
+    parser.add_argument("--optimize-pdf", action="store_true", help="Recompress and deduplicate PDF output; report bytes before/after in the result")
     args = parser.parse_args()
 
+    if args.inputs:
+        sys.exit(run_batch(export_file, args.inputs, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf))
+
     with open(args.input, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    paths = compute_paths(data, args.output_dir)
-    formats = args.formats.split(",") if args.formats != "all" else ["html", "pdf", "md"]
-
-    results = {}
-
-    if "html" in formats:
-        generate_estate_html(data, paths["html"])
-        results["html"] = paths["html"]
-
-    if "pdf" in formats:
-        generate_estate_pdf(data, paths["pdf"])
-        results["pdf"] = paths["pdf"]
-
-    if "md" in formats:
-        generate_estate_md(data, paths["md"])
-        results["md"] = paths["md"]
-
-    results["output_folder"] = paths["folder"]
-    results["type"] = "estate_snapshot"
+    results = export_report(data, args.output_dir, workers=args.workers, formats=args.formats, force=args.force, profile=args.profile, optimize_pdf=args.optimize_pdf)
     print(json.dumps(results, indent=2))
 
 
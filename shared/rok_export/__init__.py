@@ -0,0 +1,8 @@
+"""
+ROK Export -- helpers shared by the plugin ``*_export.py`` scripts.
+
+Each exporter adds the marketplace ``shared/`` directory to ``sys.path`` and
+imports what it needs from here, e.g.:
+
+    from rok_export.runner import run_exports
+"""
@@ -0,0 +1,81 @@
+"""
+Batch mode -- export many JSON inputs from one interpreter.
+
+``--inputs`` takes either a glob pattern (``/tmp/reports/*.json``) or a
+manifest file: a ``.json`` file holding a list of paths (or an object with
+an ``"inputs"`` list), or a text file with one path per line (blank lines
+and ``#`` comments are skipped). Any other JSON file counts as one report. Relative
+manifest entries resolve against the manifest's own directory.
+
+Reports are exported in a process pool whose workers stay alive for the
+whole batch, so the venv path setup and the ``fpdf``/``openpyxl`` imports are
+paid once per worker rather than once per report. Each finished report is
+printed as one JSON line as soon as it completes.
+"""
+
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def expand_inputs(spec: str) -> list:
+    """Resolve an ``--inputs`` value to a sorted list of input paths."""
+    if os.path.isfile(spec):
+        base = os.path.dirname(os.path.abspath(spec))
+        with open(spec, "r", encoding="utf-8") as f:
+            if spec.endswith(".json"):
+                entries = json.load(f)
+                if isinstance(entries, dict):
+                    if "inputs" not in entries:
+                        return [spec]  # a single report, not a manifest
+                    entries = entries["inputs"]
+            else:
+                entries = [line.strip() for line in f]
+        entries = [e for e in entries if e and not e.startswith("#")]
+        return [os.path.join(base, os.path.expanduser(e)) for e in entries]
+    return sorted(glob.glob(os.path.expanduser(spec), recursive=True))
+
+
+def _export_one(export_file, input_path, output_dir, options):
+    """Worker body: export one input and return its JSON-lines record."""
+    start = time.perf_counter()
+    try:
+        # Generator progress messages go to stderr so stdout stays pure JSON lines
+        with contextlib.redirect_stdout(sys.stderr):
+            result = export_file(input_path, output_dir, **options)
+    except Exception as e:
+        return {"input": input_path, "status": "error", "error": f"{type(e).__name__}: {e}"}
+    record = {"input": input_path, "status": "ok"}
+    record.update(result)
+    record["total_seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def run_batch(export_file, inputs: str, output_dir: str, workers=None, **options) -> int:
+    """Export every input matched by ``inputs`` and stream JSON lines to stdout.
+
+    ``export_file(input_path, output_dir, **options)`` must be a module-level
+    function of the exporter (so it can be sent to worker processes) that
+    returns the exporter's result dict. Returns a process exit code: 0 when
+    every report exported, 1 otherwise.
+    """
+    paths = expand_inputs(inputs)
+    if not paths:
+        print(f"Error: no input files matched: {inputs}", file=sys.stderr)
+        return 1
+
+    failures = 0
+    # Reports already run one per core; PDF sections must not fan out again (rok_export.pages)
+    os.environ.setdefault("ROK_EXPORT_PDF_WORKERS", "1")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_export_one, export_file, p, output_dir, options) for p in paths]
+        for future in as_completed(futures):
+            record = future.result()
+            if record["status"] != "ok":
+                failures += 1
+            print(json.dumps(record), flush=True)
+    return 1 if failures else 0
@@ -0,0 +1,69 @@
+"""
+Venv bootstrap -- puts the shared ``~/.claude/scripts/.venv`` site-packages
+on ``sys.path`` without listing the venv on every run.
+
+The first run scans ``.venv/lib/*/site-packages`` and records the result in
+a small stamp file inside the venv. Later runs read the stamp and confirm
+the cached directory with a single stat. A stale stamp (venv rebuilt for a
+new Python) falls back to a rescan, and a missing venv is not an error: the
+exporter simply runs on the interpreter's own packages.
+"""
+
+import os
+import sys
+
+VENV_DIR = os.path.expanduser("~/.claude/scripts/.venv")
+STAMP_NAME = ".rok_site_packages"
+
+
+def _scan(venv_dir: str):
+    """Return the first ``lib/*/site-packages`` under the venv, or None."""
+    lib = os.path.join(venv_dir, "lib")
+    try:
+        entries = sorted(os.listdir(lib))
+    except OSError:
+        return None
+    for d in entries:
+        sp = os.path.join(lib, d, "site-packages")
+        if os.path.isdir(sp):
+            return sp
+    return None
+
+
+def _write_stamp(stamp_path: str, site_packages: str):
+    """Record the resolved path; a read-only venv just means no caching."""
+    tmp = f"{stamp_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(site_packages)
+        os.replace(tmp, stamp_path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def resolve_site_packages(venv_dir: str = VENV_DIR):
+    """Return the venv's site-packages directory, or None if there is no venv."""
+    stamp_path = os.path.join(venv_dir, STAMP_NAME)
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            cached = f.read().strip()
+    except OSError:
+        cached = ""
+    if cached and os.path.isdir(cached):
+        return cached
+
+    site_packages = _scan(venv_dir)
+    if site_packages:
+        _write_stamp(stamp_path, site_packages)
+    return site_packages
+
+
+def add_venv_site_packages(venv_dir: str = VENV_DIR):
+    """Prepend the venv's site-packages to ``sys.path`` if it exists."""
+    site_packages = resolve_site_packages(venv_dir)
+    if site_packages and site_packages not in sys.path:
+        sys.path.insert(0, site_packages)
+    return site_packages
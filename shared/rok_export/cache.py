@@ -0,0 +1,108 @@
+"""
+Incremental export cache -- skip formats whose output is already current.
+
+A report's cache key is a SHA-256 over the exporter's own source, the
+``rok_export`` sources and the canonical JSON of the input payload, so a
+change to the data *or* to the code that renders it invalidates the entry.
+Each output folder keeps a sidecar ``.export-manifest.json`` mapping output
+file names to the key they were rendered from plus the file's size and
+mtime; an entry only counts as current if the file on disk still matches.
+Manifest updates are serialized with a lock file kept under
+``~/.cache/rok_export/locks`` (one per output folder), not in the folder
+itself.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows: manifest updates are unlocked
+    fcntl = None
+
+MANIFEST_NAME = ".export-manifest.json"
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOCK_DIR = os.path.expanduser("~/.cache/rok_export/locks")
+
+
+@lru_cache(maxsize=None)
+def exporter_version(exporter_path: str) -> str:
+    """Hash of the exporter script plus the shared package it renders with."""
+    h = hashlib.sha256()
+    for path in [exporter_path] + sorted(glob.glob(os.path.join(PACKAGE_DIR, "*.py"))):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def cache_key(data, exporter_path: str) -> str:
+    """Content address for one report: exporter version + canonical input JSON."""
+    h = hashlib.sha256(exporter_version(exporter_path).encode("ascii"))
+    h.update(json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _lock_path(folder: str) -> str:
+    """Lock file for ``folder``'s manifest, outside the folder so reports stay uncluttered."""
+    name = hashlib.sha256(os.path.realpath(folder).encode("utf-8")).hexdigest()[:32] + ".lock"
+    try:
+        os.makedirs(LOCK_DIR, exist_ok=True)
+        return os.path.join(LOCK_DIR, name)
+    except OSError:  # read-only home
+        return os.path.join(tempfile.gettempdir(), f"rok_export-{name}")
+
+
+@contextmanager
+def _locked(folder: str):
+    """Serialize manifest read-modify-write between batch workers."""
+    if fcntl is None:
+        yield
+        return
+    with open(_lock_path(folder), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _load(folder: str) -> dict:
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_current(output_path: str, key: str) -> bool:
+    """True if ``output_path`` exists and was rendered from ``key``."""
+    entry = _load(os.path.dirname(output_path)).get(os.path.basename(output_path))
+    if not entry or entry.get("key") != key:
+        return False
+    try:
+        st = os.stat(output_path)
+    except OSError:
+        return False
+    return st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns")
+
+
+def record(output_paths, key: str):
+    """Mark freshly rendered ``output_paths`` as produced from ``key``."""
+    by_folder = {}
+    for path in output_paths:
+        by_folder.setdefault(os.path.dirname(path), []).append(path)
+    for folder, paths in by_folder.items():
+        with _locked(folder):
+            manifest = _load(folder)
+            for path in paths:
+                st = os.stat(path)
+                manifest[os.path.basename(path)] = {"key": key, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            tmp = os.path.join(folder, f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp, os.path.join(folder, MANIFEST_NAME))
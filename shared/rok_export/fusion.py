@@ -0,0 +1,308 @@
+"""
+Issue fusion -- merge raw findings from several review models into consensus issues.
+
+Multi-model code reviews used to arrive with ``source_models`` and
+``model_agreement`` already computed by the agent. ``fuse_payload(data)``
+does that merge in the exporter when a payload carries the raw findings
+under ``model_findings``; ``python3 shared/rok_export/fusion.py --input
+raw.json`` runs it on its own (``--min-confidence 0`` keeps every issue).
+
+Input: the multi-model synthesizer's input shape, either the whole object
+(``{"models": {...}}``), just its ``models`` map, or a review payload
+holding that map under ``model_findings``:
+``{model: {dimension: {"issues": [...]}}}`` (a dimension may also be a bare
+list of issues, and a model a flat list of issues carrying ``dimension``).
+
+Each finding is fingerprinted by its file, a line window and its title
+normalized to sorted content words. Findings are then clustered greedily
+in a fixed order (model order of the input, then dimension, then id),
+looking up candidate clusters through two indexes instead of comparing
+every pair:
+
+* findings with files: clusters by ``(path, line // LINE_WINDOW)``, so only
+  clusters within ``LINE_WINDOW`` lines of one of the finding's locations
+  are scored;
+* findings without files (UX, E2E): clusters by ``(dimension, word)``.
+
+A finding joins the most similar candidate cluster that has no finding
+from its model yet when it is nearby and either from the same dimension
+or at least ``SIMILARITY`` alike (Jaccard of title + description words).
+A finding with the same fingerprint as one in the cluster always joins it
+(a model repeating itself under two dimensions). Each cluster becomes one
+issue with ``source_models``, ``model_agreement``, the highest severity
+(``severity_consensus`` is the majority vote), confidence boosted by 5 per
+extra model, and a stable ``fingerprint``.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import Counter
+
+LINE_WINDOW = 5  # lines either side that count as the same location
+SIMILARITY = 0.3  # word-set Jaccard for cross-dimension merges
+MIN_CONFIDENCE = 80
+AGREEMENT_BOOST = 5  # confidence points per additional model
+SEVERITY_RANK = {"CRITICAL": 4, "HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+WORD = re.compile(r"[a-z][a-z0-9_]+")
+LEADING_DOT = re.compile(r"^(?:\./)+")
+ID_PREFIX = re.compile(r"^[A-Za-z]+")
+STOPWORDS = frozenset(
+    "the and for with that this from are was were not but can could should would "
+    "will into than then there their when which while use used using may might has "
+    "have had its also any all via per".split()
+)
+
+
+# ── Normalization ──────────────────────────────────────────────────────────────
+
+def words(text: str) -> frozenset:
+    """Content words of ``text``: lowercased, numbers dropped, plural ``s`` stripped."""
+    found = set()
+    for word in WORD.findall(str(text or "").lower()):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        found.add(word)
+    return frozenset(found)
+
+
+def _path(file: dict) -> str:
+    return LEADING_DOT.sub("", str(file.get("path") or "").replace("\\", "/")).lower()
+
+
+def _locations(finding: dict) -> list:
+    """``[(normalized path, line)]`` of a finding's files."""
+    locations = []
+    for f in finding.get("files") or []:
+        path = _path(f)
+        if path:
+            try:
+                line = int(f.get("line") or 0)
+            except (TypeError, ValueError):
+                line = 0
+            locations.append((path, line))
+    return locations
+
+
+def fingerprint(finding: dict) -> str:
+    """Stable id of a finding: first file, line window and normalized title."""
+    locations = _locations(finding)
+    path, line = locations[0] if locations else ("", 0)
+    key = "|".join([path, str(line // LINE_WINDOW), " ".join(sorted(words(finding.get("title", ""))))])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# ── Input ──────────────────────────────────────────────────────────────────────
+
+def raw_findings(models: dict) -> list:
+    """Flatten ``{model: {dimension: {"issues": [...]}}}`` to findings tagged with model and dimension."""
+    findings = []
+    for model, report in models.items():
+        if isinstance(report, list):
+            sections = [(None, report)]
+        else:
+            sections = [(dim, (entry or {}).get("issues", []) if isinstance(entry, dict) else entry or [])
+                        for dim, entry in (report or {}).items()]
+        model_findings = []
+        for dim, issues in sections:
+            for issue in issues:
+                model_findings.append(dict(issue, model=model, dimension=issue.get("dimension") or dim or ""))
+        model_findings.sort(key=lambda f: (f["dimension"], str(f.get("id", ""))))
+        findings.extend(model_findings)
+    return findings
+
+
+# ── Clustering ─────────────────────────────────────────────────────────────────
+
+class _Cluster:
+    __slots__ = ("members", "models", "fingerprints", "dimensions")
+
+    def __init__(self):
+        self.members = []
+        self.models = set()
+        self.fingerprints = set()
+        self.dimensions = set()
+
+
+def cluster_findings(findings: list) -> list:
+    """Greedy, order-stable clustering of ``findings``; returns a list of finding lists."""
+    clusters = []
+    by_location = {}  # (path, line bucket) -> [(cluster index, line)]
+    by_word = {}  # (dimension, word) -> [cluster index] for findings without files
+
+    for finding in findings:
+        locations = _locations(finding)
+        text = words(f"{finding.get('title', '')} {finding.get('description', '')}")
+        fp = fingerprint(finding)
+        dim = finding["dimension"]
+
+        # Candidate clusters from the indexes: within LINE_WINDOW lines, or sharing a word
+        candidates = set()
+        if locations:
+            for path, line in locations:
+                bucket = line // LINE_WINDOW
+                for b in (bucket - 1, bucket, bucket + 1):
+                    for index, other_line in by_location.get((path, b), ()):
+                        if abs(other_line - line) <= LINE_WINDOW:
+                            candidates.add(index)
+        else:
+            for word in text:
+                candidates.update(by_word.get((dim, word), ()))
+
+        best, best_score = None, -1.0
+        for index in sorted(candidates):
+            cluster = clusters[index]
+            if fp in cluster.fingerprints:
+                best = index
+                break
+            if finding["model"] in cluster.models:
+                continue
+            score = max(_similarity(text, member_words) for _, member_words in cluster.members)
+            if dim not in cluster.dimensions and score < SIMILARITY:
+                continue
+            if not locations and score < SIMILARITY:
+                continue
+            if score > best_score:
+                best, best_score = index, score
+
+        if best is None:
+            best = len(clusters)
+            clusters.append(_Cluster())
+        cluster = clusters[best]
+        cluster.members.append((finding, text))
+        cluster.models.add(finding["model"])
+        cluster.fingerprints.add(fp)
+        cluster.dimensions.add(dim)
+        if locations:
+            for path, line in locations:
+                by_location.setdefault((path, line // LINE_WINDOW), []).append((best, line))
+        else:
+            for word in text:
+                entries = by_word.setdefault((dim, word), [])
+                if not entries or entries[-1] != best:
+                    entries.append(best)
+    return [[finding for finding, _ in cluster.members] for cluster in clusters]
+
+
+# ── Consensus ──────────────────────────────────────────────────────────────────
+
+def _confidence(finding: dict) -> float:
+    try:
+        return float(finding.get("confidence") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def fuse_cluster(members: list, model_order: list) -> dict:
+    """One consensus issue from a cluster of findings."""
+    models = sorted({m["model"] for m in members}, key=model_order.index)
+    agreement = len(models)
+    votes = Counter(str(m.get("severity", "LOW")).upper() for m in members)
+    severity = max(votes, key=lambda s: SEVERITY_RANK.get(s, 0))
+    consensus = max(votes, key=lambda s: (votes[s], SEVERITY_RANK.get(s, 0)))
+    # Representative: most severe, then most confident, then most descriptive title
+    lead = max(members, key=lambda m: (SEVERITY_RANK.get(str(m.get("severity", "")).upper(), 0),
+                                       _confidence(m), len(m.get("title", ""))))
+    # The lead's locations, then any file only other models pointed at
+    files = list(lead.get("files") or [])
+    seen = {_path(f) for f in files}
+    for m in members:
+        for f in m.get("files") or []:
+            if _path(f) not in seen:
+                seen.add(_path(f))
+                files.append(f)
+    confidence = min(100, max(_confidence(m) for m in members) + (agreement - 1) * AGREEMENT_BOOST)
+    issue = {k: v for k, v in lead.items() if k != "model"}
+    issue.update(
+        severity=severity,
+        severity_consensus=consensus,
+        severity_votes=dict(sorted(votes.items(), key=lambda kv: -SEVERITY_RANK.get(kv[0], 0))),
+        confidence=int(confidence) if float(confidence).is_integer() else round(confidence, 2),
+        title=max((m.get("title", "") for m in members), key=len),
+        files=files,
+        source_models=models,
+        model_agreement=agreement,
+        fingerprint=fingerprint(lead),
+    )
+    return issue
+
+
+def fuse(models: dict, min_confidence=MIN_CONFIDENCE) -> dict:
+    """Fuse raw per-model findings; returns ``issues``, ``issue_summary`` and ``consensus_analysis``."""
+    models = models.get("models", models)
+    model_order = list(models)
+    issues = [fuse_cluster(members, model_order) for members in cluster_findings(raw_findings(models))]
+    issues = [iss for iss in issues if iss["confidence"] >= min_confidence]
+    issues.sort(key=lambda iss: (-iss["model_agreement"], -SEVERITY_RANK.get(iss["severity"], 0),
+                                 -iss["confidence"], iss["fingerprint"]))
+    # Models number their findings independently, so renumber per id prefix (SEC-001, CQ-001, ...)
+    counters = Counter()
+    for iss in issues:
+        prefix = ID_PREFIX.match(str(iss.get("id", "")))
+        prefix = prefix.group().upper() if prefix else "ISS"
+        counters[prefix] += 1
+        iss["id"] = f"{prefix}-{counters[prefix]:03d}"
+
+    summary = {sev.lower(): 0 for sev in SEVERITY_RANK}
+    for iss in issues:
+        key = iss["severity"].lower()
+        summary[key] = summary.get(key, 0) + 1
+    summary["total"] = len(issues)
+
+    unique = {model: 0 for model in model_order}
+    for iss in issues:
+        if iss["model_agreement"] == 1:
+            unique[iss["source_models"][0]] += 1
+    return {
+        "issues": issues,
+        "issue_summary": summary,
+        "consensus_analysis": {
+            "high_agreement_count": sum(1 for iss in issues if iss["model_agreement"] >= 2),
+            "unique_findings": unique,
+        },
+    }
+
+
+def fuse_payload(data: dict, min_confidence=MIN_CONFIDENCE) -> dict:
+    """Copy of a review payload with ``issues`` fused from its ``model_findings`` (unchanged without them)."""
+    if not data.get("model_findings"):
+        return data
+    fused = fuse(data["model_findings"], min_confidence)
+    return dict(
+        data,
+        issues=fused["issues"],
+        issue_summary=fused["issue_summary"],
+        consensus_analysis={**(data.get("consensus_analysis") or {}), **fused["consensus_analysis"]},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuse raw multi-model review findings into consensus issues")
+    parser.add_argument("--input", required=True, help="JSON of per-model findings ('-' for stdin)")
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE,
+                        help="Drop fused issues below this confidence (after the agreement boost)")
+    args = parser.parse_args()
+
+    if args.input == "-":
+        data = json.load(sys.stdin)
+    else:
+        with open(args.input, "r") as f:
+            data = json.load(f)
+    # A full review payload carries its raw findings under model_findings
+    json.dump(fuse(data.get("model_findings", data), args.min_confidence), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Dealer distances -- fill ``dealer_distance_miles`` from a local ZIP table.
+
+Agents often leave ``dealer_distance_miles`` as ``"N/A"``. When a listing
+carries a ``dealer_zip`` and the search has a ``search_params.zip_code``,
+``fill_distances`` computes the great-circle (haversine) distance between
+the two ZIP centroids, for all such listings in one vectorized pass, without
+any network calls. Distances the agent did supply are never changed.
+
+The centroid table is a flat binary file (``TABLE_PATH``, override with
+``ROK_EXPORT_ZIP_TABLE``) of fixed-width ``(zip, lat, lon)`` records sorted
+by ZIP. It is memory-mapped, so a lookup reads only the pages it touches
+instead of parsing ~33k rows per export. Build it once from the Census
+Gazetteer ZCTA file (or any CSV with zip/lat/lon columns):
+
+    python3 shared/rok_export/geo.py build 2023_Gaz_zcta_national.txt
+
+Without a table the payload is returned unchanged. Results are cached per
+(origin ZIP, dealer, dealer ZIP) for the life of the process, so batch
+exports that share dealers look each one up once.
+"""
+
+import argparse
+import csv
+import math
+import mmap
+import os
+import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python lookups below
+    np = None
+
+TABLE_PATH = os.path.expanduser("~/.cache/rok_export/zip_centroids.bin")
+MAGIC = b"ROKZIP1\0"
+HEADER = struct.Struct("<8sI4x")
+RECORD = struct.Struct("<Iff")  # zip, latitude, longitude
+EARTH_RADIUS_MILES = 3958.8
+
+_tables = {}
+_cache = {}
+
+
+def _table_path():
+    return os.path.expanduser(os.environ.get("ROK_EXPORT_ZIP_TABLE", TABLE_PATH))
+
+
+def parse_zip(value):
+    """``"20147"`` / ``"20147-1234"`` / ``20147`` -> 20147, or None."""
+    digits = str(value or "").strip()[:5]
+    return int(digits) if len(digits) == 5 and digits.isdigit() else None
+
+
+class ZipTable:
+    """Read-only view of a centroid table file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a ZIP centroid table (rebuild it with geo.py build)")
+        if np is not None:
+            self._rows = np.frombuffer(self._mm, dtype=[("zip", "<u4"), ("lat", "<f4"), ("lon", "<f4")],
+                                       count=self.count, offset=HEADER.size)
+
+    def _find(self, zip_code):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = RECORD.unpack_from(self._mm, HEADER.size + mid * RECORD.size)
+            if value[0] < zip_code:
+                lo = mid + 1
+            elif value[0] > zip_code:
+                hi = mid
+            else:
+                return value[1], value[2]
+        return None
+
+    def lookup(self, zip_codes):
+        """(lats, lons, found) for ``zip_codes``; missing entries have found = False."""
+        if np is not None:
+            zips = np.asarray(zip_codes, dtype="<u4")
+            if not self.count:
+                return np.zeros(len(zips)), np.zeros(len(zips)), np.zeros(len(zips), dtype=bool)
+            idx = np.minimum(np.searchsorted(self._rows["zip"], zips), self.count - 1)
+            found = self._rows["zip"][idx] == zips
+            return self._rows["lat"][idx].astype(float), self._rows["lon"][idx].astype(float), found
+        points = [self._find(z) for z in zip_codes]
+        return ([p[0] if p else 0.0 for p in points], [p[1] if p else 0.0 for p in points],
+                [p is not None for p in points])
+
+
+def load_table(path=None):
+    """The memory-mapped table at ``path`` (default ``_table_path()``), or None if absent."""
+    path = path or _table_path()
+    if path not in _tables:
+        try:
+            _tables[path] = ZipTable(path)
+        except (OSError, ValueError):
+            _tables[path] = None
+    return _tables[path]
+
+
+def haversine_miles(lat1, lon1, lats, lons):
+    """Distances in miles from one point to each of ``lats``/``lons``."""
+    if np is not None:
+        lat1, lon1 = np.radians(lat1), np.radians(lon1)
+        lats, lons = np.radians(lats), np.radians(lons)
+        a = np.sin((lats - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lats) * np.sin((lons - lon1) / 2) ** 2
+        return (2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))).tolist()
+    lat1, lon1 = math.radians(lat1), math.radians(lon1)
+    result = []
+    for lat, lon in zip(lats, lons):
+        lat, lon = math.radians(lat), math.radians(lon)
+        a = math.sin((lat - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat) * math.sin((lon - lon1) / 2) ** 2
+        result.append(2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a)))
+    return result
+
+
+def _missing(distance):
+    return isinstance(distance, bool) or not isinstance(distance, (int, float))
+
+
+def fill_distances(data: dict, table_path=None) -> dict:
+    """Return ``data`` with missing dealer distances computed from ZIP centroids."""
+    origin = parse_zip(data.get("search_params", {}).get("zip_code"))
+    listings = data.get("listings", [])
+    wanted = [i for i, listing in enumerate(listings)
+              if _missing(listing.get("dealer_distance_miles")) and parse_zip(listing.get("dealer_zip"))]
+    if origin is None or not wanted:
+        return data
+
+    def cache_key(listing):
+        return origin, listing.get("dealer_name", ""), parse_zip(listing["dealer_zip"])
+
+    todo = sorted({cache_key(listings[i]) for i in wanted} - set(_cache))
+    if todo:
+        table = load_table(table_path)
+        if table is None:
+            return data
+        lats, lons, found = table.lookup([origin] + [key[2] for key in todo])
+        if not found[0]:
+            return data
+        miles = haversine_miles(lats[0], lons[0], lats[1:], lons[1:])
+        for key, distance, ok in zip(todo, miles, list(found)[1:]):
+            _cache[key] = round(distance) if ok else None
+
+    filled = list(listings)
+    for i in wanted:
+        distance = _cache.get(cache_key(listings[i]))
+        if distance is not None:
+            filled[i] = dict(listings[i], dealer_distance_miles=distance)
+    return dict(data, listings=filled)
+
+
+def _columns(header):
+    """Indexes of the zip, latitude and longitude columns in a source header."""
+    names = [h.strip().lower() for h in header]
+
+    def find(*candidates):
+        for candidate in candidates:
+            if candidate in names:
+                return names.index(candidate)
+        raise ValueError(f"no {candidates[0]} column in header {header}")
+    return (find("zip", "zip_code", "zcta", "zcta5", "geoid"), find("lat", "latitude", "intptlat"),
+            find("lon", "lng", "longitude", "intptlong"))
+
+
+def build_table(source: str, output: str) -> int:
+    """Write a sorted centroid table from a Gazetteer/CSV ``source``; returns the row count."""
+    with open(source, "r", encoding="utf-8-sig", newline="") as f:
+        first = f.readline()
+        f.seek(0)
+        reader = csv.reader(f, delimiter="\t" if "\t" in first else ",")
+        zip_col, lat_col, lon_col = _columns(next(reader))
+        rows = {}
+        for row in reader:
+            zip_code = parse_zip(row[zip_col]) if len(row) > max(zip_col, lat_col, lon_col) else None
+            if zip_code is not None:
+                rows[zip_code] = (float(row[lat_col]), float(row[lon_col]))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    tmp = f"{output}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(rows)))
+        for zip_code in sorted(rows):
+            f.write(RECORD.pack(zip_code, *rows[zip_code]))
+    os.replace(tmp, output)
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the ZIP-centroid table used for dealer distances")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build the table from a Census Gazetteer ZCTA file or zip,lat,lon CSV")
+    build.add_argument("source", help="Gazetteer .txt (tab-separated) or CSV with zip/lat/lon columns")
+    build.add_argument("--output", default=_table_path(), help=f"Table path (default: {TABLE_PATH})")
+    args = parser.parse_args()
+    try:
+        count = build_table(args.source, args.output)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {count} ZIP centroids to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
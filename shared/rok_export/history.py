@@ -0,0 +1,141 @@
+"""
+Listing history -- remember inventory listings across daily exports.
+
+Each camper/vehicle export is otherwise standalone, so a price drop or a
+listing that has sat for weeks is invisible. With ``--history-db PATH`` the
+exporter annotates the payload from an embedded SQLite database before
+rendering and then records every listing it rendered, one row per listing
+per search date:
+
+* ``price_trend`` -- change since the listing was last seen, e.g.
+  ``"-$1,500 since 2026-01-10"``, ``"unchanged since ..."`` or ``"new"``;
+* ``days_on_market`` -- filled from the first sighting when the payload has
+  no number of its own.
+
+A listing is identified by its stock number (campers) or VIN (vehicles) plus
+dealer name, falling back to its URL; listings with none of these are not
+tracked. Rows are indexed by kind/make/model/date so lookups touch only the
+sightings of the listings being exported, never earlier JSON files.
+Re-exporting the same search date replaces that day's rows, and an export
+whose formats were all cache hits (the same payload again) records
+nothing, so re-runs never add snapshots of their own.
+"""
+
+import sqlite3
+from datetime import date
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sightings (
+    listing_key TEXT NOT NULL,
+    seen_date   TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    make        TEXT,
+    model       TEXT,
+    price       REAL,
+    PRIMARY KEY (listing_key, seen_date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sightings_model_date ON sightings (kind, make, model, seen_date);
+"""
+
+# Listing field holding the unit's own identifier, per inventory kind
+ID_FIELDS = {"camper": "stock_number", "vehicle": "vin"}
+
+
+def listing_key(kind: str, listing: dict):
+    """Stable identity for one listing, or None when it cannot be tracked."""
+    unit_id = listing.get(ID_FIELDS[kind])
+    if unit_id and unit_id != "N/A":
+        return f"{kind}:{unit_id}|{listing.get('dealer_name', '')}"
+    if listing.get("listing_url"):
+        return f"{kind}:{listing['listing_url']}"
+    return None
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30)  # batch workers may write concurrently
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _price_trend(price, previous_price, previous_date):
+    if previous_date is None:
+        return "new"
+    if not isinstance(price, (int, float)) or previous_price is None:
+        return f"seen {previous_date}"
+    change = price - previous_price
+    if change == 0:
+        return f"unchanged since {previous_date}"
+    sign = "-" if change < 0 else "+"
+    return f"{sign}${abs(change):,.0f} since {previous_date}"
+
+
+def _tracked(kind, data):
+    listings = data.get("listings", [])
+    keys = [listing_key(kind, listing) for listing in listings]
+    return keys, listings, [(key, listing) for key, listing in zip(keys, listings) if key]
+
+
+def _seen_date(data):
+    return data.get("generated_date") or date.today().isoformat()
+
+
+def annotate(db_path: str, kind: str, data: dict) -> dict:
+    """Return a copy of ``data`` with its listings annotated from the history store (read-only)."""
+    seen_date = _seen_date(data)
+    keys, listings, tracked = _tracked(kind, data)
+
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute("CREATE TEMP TABLE current_keys (listing_key TEXT PRIMARY KEY)")
+            conn.executemany("INSERT OR IGNORE INTO current_keys VALUES (?)", [(key,) for key, _ in tracked])
+            # First sighting and the latest sighting before this search date, per listing
+            rows = conn.execute("""
+                SELECT k.listing_key,
+                       (SELECT MIN(seen_date) FROM sightings s WHERE s.listing_key = k.listing_key),
+                       p.seen_date, p.price
+                FROM current_keys k
+                LEFT JOIN sightings p ON p.listing_key = k.listing_key AND p.seen_date = (
+                    SELECT MAX(seen_date) FROM sightings s
+                    WHERE s.listing_key = k.listing_key AND s.seen_date < ?)
+            """, (seen_date,)).fetchall()
+            conn.execute("DROP TABLE current_keys")
+    finally:
+        conn.close()
+
+    history = {key: (first_seen, previous_date, previous_price) for key, first_seen, previous_date, previous_price in rows}
+    annotated = []
+    for key, listing in zip(keys, listings):
+        if key is None:
+            annotated.append(listing)
+            continue
+        first_seen, previous_date, previous_price = history[key]
+        extra = {"price_trend": _price_trend(listing.get("price"), previous_price, previous_date)}
+        days = listing.get("days_on_market")
+        if not isinstance(days, (int, float)) and first_seen and first_seen < seen_date:
+            try:
+                extra["days_on_market"] = (date.fromisoformat(seen_date) - date.fromisoformat(first_seen)).days
+            except ValueError:  # non-ISO generated_date
+                pass
+        annotated.append(dict(listing, **extra))
+    return dict(data, listings=annotated)
+
+
+def record(db_path: str, kind: str, data: dict):
+    """Record ``data['listings']`` in the history store as seen on the payload's search date."""
+    seen_date = _seen_date(data)
+    make = data.get("search_params", {}).get("make")
+    model = data.get("search_params", {}).get("model")
+    _, _, tracked = _tracked(kind, data)
+
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sightings (listing_key, seen_date, kind, make, model, price) VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, seen_date, kind, listing.get("make", make), listing.get("model", model),
+                  listing.get("price") if isinstance(listing.get("price"), (int, float)) else None)
+                 for key, listing in tracked])
+    finally:
+        conn.close()
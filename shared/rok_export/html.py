@@ -0,0 +1,37 @@
+"""
+Streaming HTML output for the report generators.
+
+Generators that used to grow one big string with ``html += f"..."`` write
+each section and row straight to an ``HtmlStream`` instead. Text goes
+through a 64 KiB write buffer to a temporary file that replaces the target
+only when rendering succeeds, so memory stays flat for 10k+ row inventories
+and a failed render never leaves a half-written report behind.
+"""
+
+import os
+
+BUFFER_SIZE = 1 << 16
+
+
+class HtmlStream:
+    """Buffered, write-only text sink for one HTML report.
+
+    Use as a context manager; ``write`` appends a chunk of markup.
+    """
+
+    def __init__(self, output_path: str, buffer_size: int = BUFFER_SIZE):
+        self.output_path = output_path
+        self._tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        self._file = open(self._tmp_path, "w", encoding="utf-8", buffering=buffer_size)
+        self.write = self._file.write
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.output_path)
+        else:
+            os.remove(self._tmp_path)
+        return False
@@ -0,0 +1,65 @@
+"""
+Listing view-models -- normalize inventory listings once per export.
+
+The inventory exporters (camper, vehicle) render the same listings three
+times, and each renderer used to repeat a dozen ``listing.get(...)`` calls
+and rebuild display strings per row. ``ListingRecord`` reads every field
+once into a ``__slots__`` record and precomputes the derived display
+values; each exporter subclasses it with its own fields (see
+``CamperListing`` / ``VehicleListing``).
+
+Each exporter's ``export_report`` builds and ranks the list once with
+``listing_records`` and passes it to every format's generator.
+"""
+
+
+def format_price_diff(diff):
+    """Format price difference with +/- prefix."""
+    if diff is None:
+        return "N/A"
+    if diff < 0:
+        return f"-${abs(diff):,.0f}"
+    elif diff > 0:
+        return f"+${diff:,.0f}"
+    else:
+        return "$0"
+
+
+class ListingRecord:
+    """Fields and derived display values common to every inventory listing.
+
+    ``FIELDS`` maps attribute names (the listing's JSON keys) to the
+    default used when the key is missing. Subclasses append their own
+    fields, list every new attribute in ``__slots__`` and extend
+    ``derive`` for computed values.
+    """
+
+    FIELDS = (
+        ("rank", 0), ("deal_rating", "FAIR_PRICE"), ("composite_score", 0),
+        ("year", ""), ("make", ""), ("model", ""),
+        ("price", 0), ("msrp", 0), ("fmv", 0), ("price_vs_fmv", None), ("price_vs_fmv_pct", None),
+        ("exterior_color", "N/A"), ("mileage", "N/A"),
+        ("dealer_name", "Unknown"), ("dealer_distance_miles", "N/A"), ("dealer_rating", "N/A"),
+        ("dealer_review_count", "N/A"),
+        ("key_features", []), ("incentives", []), ("negotiation_notes", ""),
+        ("listing_url", ""), ("phone", ""), ("source", "N/A"), ("days_on_market", "N/A"), ("confidence", "N/A"),
+        ("price_trend", ""),  # set by rok_export.history
+    )
+    __slots__ = tuple(name for name, _ in FIELDS) + ("deal_display", "fmv_display", "pct_display")
+
+    def __init__(self, listing):
+        get = listing.get
+        for name, default in self.FIELDS:
+            setattr(self, name, get(name, default))
+        self.derive(listing)
+
+    def derive(self, listing):
+        """Compute display values; ``listing`` is the raw dict for fields read with other defaults."""
+        self.deal_display = self.deal_rating.replace('_', ' ')
+        self.fmv_display = format_price_diff(self.price_vs_fmv)
+        self.pct_display = f"{self.price_vs_fmv_pct:+.1f}%" if self.price_vs_fmv_pct is not None else "N/A"
+
+
+def listing_records(data, record_class):
+    """Normalized ``record_class`` records for ``data['listings']``, one per listing, in payload order."""
+    return [record_class(listing) for listing in data.get('listings', [])]
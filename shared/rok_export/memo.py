@@ -0,0 +1,95 @@
+"""
+Section memoization -- reuse rendered report sections across versions.
+
+Incremental report versions (``v2``, ``v3``, ...) usually change one part of
+the payload, yet every section was rebuilt on each export. ``section()``
+wraps a ``_html_*`` helper so its output is keyed on the SHA-256 of the
+helper's name, the exporter version (see ``rok_export.cache``) and the JSON
+subtree the helper actually reads. Results live as one file per key in an
+on-disk store shared by all exporters; a hit refreshes the file's mtime and
+the store is trimmed back to ``MAX_ENTRIES`` least-recently-used entries
+whenever it grows past it.
+
+Set ``ROK_EXPORT_SECTION_CACHE`` to another directory to move the store, or
+to ``off`` to disable it. An unwritable store is never an error: the helper
+just renders as it would without the decorator.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+
+from rok_export.cache import exporter_version
+
+CACHE_DIR = os.path.expanduser("~/.cache/rok_export/sections")
+MAX_ENTRIES = 512
+
+
+def _store_dir():
+    spec = os.environ.get("ROK_EXPORT_SECTION_CACHE", CACHE_DIR)
+    return None if spec.lower() in ("", "0", "off", "false") else os.path.expanduser(spec)
+
+
+def _prune(store: str):
+    """Drop least-recently-used entries until at most MAX_ENTRIES remain."""
+    entries = []
+    with os.scandir(store) as it:
+        for entry in it:
+            if entry.name.endswith(".html"):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    pass
+    if len(entries) <= MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def section(*fields):
+    """Memoize an ``f(data) -> str`` section helper on ``data[field]`` for ``fields``."""
+    def decorate(fn):
+        source = inspect.getfile(fn)
+
+        @functools.wraps(fn)
+        def wrapper(data):
+            store = _store_dir()
+            if store is None:
+                return fn(data)
+            subtree = {field: data.get(field) for field in fields}
+            h = hashlib.sha256(f"{exporter_version(source)}:{fn.__qualname__}".encode("utf-8"))
+            h.update(json.dumps(subtree, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+            path = os.path.join(store, f"{h.hexdigest()}.html")
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    html = f.read()
+            except OSError:
+                pass
+            else:
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return html
+
+            html = fn(data)
+            try:
+                os.makedirs(store, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(html)
+                os.replace(tmp, path)
+                _prune(store)
+            except OSError:
+                pass
+            return html
+
+        wrapper.uncached = fn
+        return wrapper
+    return decorate
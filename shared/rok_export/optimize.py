@@ -0,0 +1,205 @@
+"""
+PDF size optimization -- recompress streams and share identical objects.
+
+``--optimize-pdf`` rewrites every PDF after it is rendered. fpdf2 already
+compresses page content and shares an image or font between the pages of
+one document, but it writes a separate, identical ``/Resources`` dictionary
+for every page, compresses at zlib's default level, and embeds an image
+twice when it is placed from two different paths. ``optimize_file``:
+
+* recompresses every Flate stream at level 9 (and compresses plain streams,
+  except XMP metadata), keeping whichever encoding is smaller;
+* merges byte-identical objects -- images, font files and descriptors,
+  resource dictionaries -- repeating until none are left, and points every
+  reference at the kept copy (pages, the page tree and annotations are
+  never merged);
+* renumbers the remaining objects and writes a new cross-reference table.
+
+Only the classic layout fpdf2 writes is understood (one xref table, no
+object streams, no encryption). Anything else is left byte-for-byte as it
+was, as is any file the rewrite would not make smaller.
+"""
+
+import os
+import re
+import zlib
+
+OBJ_HEADER = re.compile(rb"(\d+) 0 obj\s*")
+STREAM_START = re.compile(rb">>\s*stream\r?\n")
+STREAM_LENGTH = re.compile(rb"/Length\s+(\d+)(?!\s+\d+\s+R)")
+FILTER = re.compile(rb"/Filter\s*(/\w+|\[[^\]]*\])")
+REF = re.compile(rb"(\d+) 0 R\b")
+LITERAL_STRING = re.compile(rb"\((?:\\.|[^\\()])*\)", re.S)
+TRAILER = re.compile(rb"trailer\s*(<<.*>>)\s*startxref", re.S)
+# Objects whose identity matters: merging two of them would break the page tree or links
+UNMERGEABLE = re.compile(rb"/Type\s*/(?:Page|Pages|Catalog|Annot|StructTreeRoot|StructElem|Outlines)\b|/Parent\b")
+NOT_COMPRESSED = re.compile(rb"/Type\s*/Metadata\b")
+MAX_MERGE_PASSES = 8
+
+
+def _xref_offsets(data, xref_at):
+    """``{object number: offset}`` of the in-use entries of the xref table at ``xref_at``."""
+    lines = data[xref_at:data.index(b"trailer", xref_at)].split(b"\n")[1:]
+    offsets = {}
+    i = 0
+    while i < len(lines):
+        header = lines[i].split()
+        i += 1
+        if len(header) != 2:
+            continue
+        first, count = int(header[0]), int(header[1])
+        for k in range(count):
+            offset, _, kind = lines[i + k].split()[:3]
+            if kind == b"n":
+                offsets[first + k] = int(offset)
+        i += count
+    return offsets
+
+
+def _parse(data):
+    """``(header, {number: (dictionary, stream or None)}, trailer)``, or None for layouts not handled here."""
+    start = data.rfind(b"startxref")
+    xref_at = int(data[start + 9:].split()[0])
+    trailer = TRAILER.search(data, xref_at)
+    if data[xref_at:xref_at + 4] != b"xref" or trailer is None:
+        return None
+    trailer = trailer.group(1)
+    if b"/Encrypt" in trailer or b"/Prev" in trailer:
+        return None
+    offsets = _xref_offsets(data, xref_at)
+    order = sorted(offsets, key=offsets.get)
+    ends = [offsets[n] for n in order[1:]] + [xref_at]
+    objects = {}
+    for number, end in zip(order, ends):
+        body = data[offsets[number]:end]
+        header = OBJ_HEADER.match(body)
+        if header is None or int(header.group(1)) != number:
+            return None
+        body = body[header.end():].rstrip()
+        if not body.endswith(b"endobj"):
+            return None
+        body = body[:-6].rstrip()
+        stream_start = STREAM_START.search(body)
+        if stream_start is None:
+            objects[number] = (body, None)
+            continue
+        head = body[:stream_start.start() + 2]
+        length = STREAM_LENGTH.search(head)
+        if length is None:
+            return None
+        stream = body[stream_start.end():stream_start.end() + int(length.group(1))]
+        if body[stream_start.end() + len(stream):].strip() != b"endstream":
+            return None
+        objects[number] = (head, stream)
+    return data[:offsets[order[0]]], objects, trailer
+
+
+def _recompress(head, stream):
+    """``(head, stream)`` with the stream Flate-encoded at level 9 when that is smaller."""
+    filters = FILTER.search(head)
+    if filters is None:
+        if NOT_COMPRESSED.search(head):
+            return head, stream
+        packed = zlib.compress(stream, 9)
+        if len(packed) + 20 >= len(stream):
+            return head, stream
+        head = head[:2] + b"/Filter /FlateDecode " + head[2:]
+    elif filters.group(1) == b"/FlateDecode":
+        try:
+            packed = zlib.compress(zlib.decompress(stream), 9)
+        except zlib.error:
+            return head, stream
+        if len(packed) >= len(stream):
+            return head, stream
+    else:
+        return head, stream  # JPEG and other filters are kept as they are
+    return STREAM_LENGTH.sub(b"/Length %d" % len(packed), head, count=1), packed
+
+
+def _renumber(head, numbers):
+    """Rewrite ``N 0 R`` references in ``head`` through ``numbers``, skipping literal strings."""
+    def ref(match):
+        return b"%d 0 R" % numbers.get(int(match.group(1)), int(match.group(1)))
+
+    parts = []
+    last = 0
+    for string in LITERAL_STRING.finditer(head):
+        parts.append(REF.sub(ref, head[last:string.start()]))
+        parts.append(string.group())
+        last = string.end()
+    parts.append(REF.sub(ref, head[last:]))
+    return b"".join(parts)
+
+
+def _merge_duplicates(objects, trailer):
+    """Drop byte-identical duplicates from ``objects`` in place; returns the updated trailer."""
+    keep = {int(n) for n in REF.findall(trailer)}
+    for _ in range(MAX_MERGE_PASSES):
+        first_seen = {}
+        merged = {}
+        for number in sorted(objects):
+            head, stream = objects[number]
+            if number in keep or UNMERGEABLE.search(head):
+                continue
+            merged_into = first_seen.setdefault((head, stream), number)
+            if merged_into != number:
+                merged[number] = merged_into
+        if not merged:
+            break
+        for number in merged:
+            del objects[number]
+        for number, (head, stream) in objects.items():
+            objects[number] = (_renumber(head, merged), stream)
+        trailer = _renumber(trailer, merged)
+    return trailer
+
+
+def _write(header, objects, trailer):
+    order = sorted(objects)
+    numbers = {old: new for new, old in enumerate(order, 1)}
+    out = bytearray(header)
+    offsets = []
+    for old in order:
+        head, stream = objects[old]
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % numbers[old] + _renumber(head, numbers)
+        if stream is not None:
+            out += b"\nstream\n" + stream + b"\nendstream"
+        out += b"\nendobj\n"
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(order) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    trailer = re.sub(rb"/Size\s+\d+", b"/Size %d" % (len(order) + 1), _renumber(trailer, numbers))
+    out += b"trailer\n" + trailer + b"\nstartxref\n%d\n%%%%EOF\n" % xref_at
+    return bytes(out)
+
+
+def optimize_bytes(data: bytes) -> bytes:
+    """The optimized form of the PDF ``data`` (``data`` itself when it cannot be improved)."""
+    try:
+        parsed = _parse(data)
+    except (ValueError, IndexError):
+        parsed = None
+    if parsed is None:
+        return data
+    header, objects, trailer = parsed
+    for number, (head, stream) in objects.items():
+        if stream is not None:
+            objects[number] = _recompress(head, stream)
+    trailer = _merge_duplicates(objects, trailer)
+    optimized = _write(header, objects, trailer)
+    return optimized if len(optimized) < len(data) else data
+
+
+def optimize_file(path: str) -> dict:
+    """Optimize the PDF at ``path`` in place; returns ``{"bytes_before", "bytes_after"}``."""
+    with open(path, "rb") as f:
+        data = f.read()
+    optimized = optimize_bytes(data)
+    if optimized is not data:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(optimized)
+        os.replace(tmp, path)
+    return {"bytes_before": len(data), "bytes_after": len(optimized)}
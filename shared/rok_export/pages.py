@@ -0,0 +1,124 @@
+"""
+Parallel PDF sections -- render runs of pages in worker processes, splice them in.
+
+A long repeated section (one block per listing) dominates a report's PDF
+time and does not depend on anything drawn before it. ``render_section``
+splits its items into contiguous chunks, renders each chunk into a
+throwaway document of the same class in a process pool, and appends the
+finished pages to the real document in order:
+
+* each chunk starts on a new page, so chunk boundaries are the only layout
+  difference from a serial render (at most ``workers - 1`` part-filled
+  pages);
+* workers draw their pages' headers but no footers; the parent adds every
+  spliced page itself and draws its footer, so ``page_no()`` and anything
+  else the footer shows are numbered in the final document;
+* a spliced page's content stream is wrapped in ``q ... Q`` and its font
+  references are renumbered to the parent's fonts, so the parent's
+  graphics state and font table stay valid around it.
+
+Only text and vector drawing can be spliced: sections that place images or
+links, and documents with embedded (subsetted) TrueType fonts, render
+serially, as does any section smaller than two chunks of ``MIN_CHUNK``
+items. ``ROK_EXPORT_PDF_WORKERS`` caps the pool (``1`` renders serially);
+batch mode sets it to 1 because its reports already run one per core.
+Splicing writes through fpdf2's private ``_out`` and ``_resource_catalog``,
+so on an fpdf2 outside ``rok_export.pdf.FPDF2_TESTED``, or one without
+them, every section renders serially.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from fpdf.enums import PDFResourceType
+from fpdf.fonts import CoreFont
+
+from rok_export.pdf import fpdf2_tested
+
+MIN_CHUNK = 40  # items per worker below which the pool costs more than it saves
+FONT_REF = re.compile(rb"/F(\d+) ([-+]?\d+(?:\.\d+)?) Tf")
+
+
+def _workers(requested):
+    if requested is None:
+        requested = int(os.environ.get("ROK_EXPORT_PDF_WORKERS") or os.cpu_count() or 1)
+    return max(1, requested)
+
+
+def _can_splice(pdf):
+    """Whether pages can be spliced into ``pdf``: core fonts only, on an fpdf2 whose internals were checked."""
+    if not (fpdf2_tested() and hasattr(pdf, "_out") and hasattr(pdf, "_resource_catalog")):
+        return False
+    return not any(font.type == "TTF" for font in pdf.fonts.values())
+
+
+def _chunks(items, count):
+    size, extra = divmod(len(items), count)
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        yield items[start:end]
+        start = end
+
+
+def _render_chunk(make_pdf, render, chunk, first):
+    """Worker body: ``[(content bytes, {font number: (fontkey, style)})]`` per page."""
+    pdf = make_pdf()
+    pdf.footer = lambda: None
+    pdf.add_page()
+    render(pdf, chunk, first)
+    if pdf.image_cache.images or pdf.links or any(page.annots for page in pdf.pages.values()):
+        raise ValueError("render_section can only splice text and vector drawing")
+    fonts = {font.i: (fontkey, font.emphasis.style) for fontkey, font in pdf.fonts.items()}
+    return [(bytes(pdf.pages[n].contents), fonts) for n in sorted(pdf.pages)]
+
+
+def _splice(pdf, content, worker_fonts):
+    """Add a page to ``pdf`` holding ``content``, with worker font numbers mapped to ``pdf``'s."""
+    numbers = {}
+    for i, (fontkey, style) in worker_fonts.items():
+        if fontkey not in pdf.fonts:
+            pdf.fonts[fontkey] = CoreFont(len(pdf.fonts) + 1, fontkey, style)
+        numbers[i] = pdf.fonts[fontkey].i
+    pdf.header = lambda: None  # the worker already drew this page's header
+    try:
+        pdf.add_page()
+    finally:
+        del pdf.header
+    used = set()
+
+    def renumber(match):
+        i = numbers[int(match.group(1))]
+        used.add(i)
+        return b"/F%d %s Tf" % (i, match.group(2))
+
+    pdf._out(b"q\n" + FONT_REF.sub(renumber, content) + b"Q")
+    for i in used:
+        pdf._resource_catalog.add(PDFResourceType.FONT, i, pdf.page)
+
+
+def render_section(pdf, make_pdf, render, items, workers=None):
+    """Render ``items`` onto new pages of ``pdf`` with ``render(pdf, chunk, first)``.
+
+    ``make_pdf()`` builds an empty document of ``pdf``'s class and layout;
+    ``render`` draws a chunk of items from the top of a fresh page (``first``
+    is True for the chunk that opens the section, e.g. to draw its title).
+    Both are run in worker processes, so they must be module-level functions
+    (or ``functools.partial`` objects of them) with picklable arguments.
+    Returns the number of worker processes used (1 when rendered serially).
+    """
+    items = list(items)
+    workers = min(_workers(workers), len(items) // MIN_CHUNK)
+    if workers < 2 or not _can_splice(pdf):
+        pdf.add_page()
+        render(pdf, items, True)
+        return 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_render_chunk, make_pdf, render, chunk, i == 0)
+                   for i, chunk in enumerate(_chunks(items, workers))]
+        for future in futures:
+            for content, fonts in future.result():
+                _splice(pdf, content, fonts)
+    return workers
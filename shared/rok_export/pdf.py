@@ -0,0 +1,298 @@
+"""
+PDF base class -- one embedded Unicode font for every report.
+
+The report PDFs used the core Helvetica font, which only covers Latin-1, so
+every string went through ``latin_safe`` first. ``ReportPDF`` is an ``FPDF``
+subclass that embeds a system TrueType font instead and serves the
+exporters' existing ``set_font("Helvetica", ...)`` calls from it:
+
+* The first font family found in ``FONT_DIRS`` (or ``ROK_EXPORT_FONT_DIR``)
+  wins: Liberation Sans, which is metric-compatible with Helvetica, then
+  DejaVu Sans and Noto Sans. Styles a family does not ship fall back to the
+  nearest one it does (no italic file -> upright).
+* Font sizes are scaled so the embedded font sets text at Helvetica's
+  average width; layouts, column widths and hand truncation sized for the
+  core font keep fitting.
+* Parsing a TTF costs ~60 ms per style. The first document in a process
+  parses each style with ``add_font`` and keeps the results (cmap, glyph
+  widths, descriptor); later documents in the same process (batch mode,
+  the benchmark) rebuild the font from them and only reopen the file for
+  subsetting, ~10% off each further PDF. A single export gains nothing
+  from this -- the parse saved is spent loading the tables at output --
+  so nothing is stored on disk. Rebuilding sets fpdf2's private font
+  attributes, so it is only done on the fpdf2 versions in
+  ``FPDF2_TESTED`` (see ``fpdf2_tested``), and a rebuilt font that lacks
+  any attribute a parsed one has is parsed normally instead. fpdf2 embeds
+  only the glyphs a document uses, so PDFs stay small.
+
+With no font found, or ``ROK_EXPORT_FONT_DIR=core``, the class keeps the
+core fonts and transliterates text through ``latin_safe`` in
+``normalize_text``, so callers never need to pre-clean strings.
+
+``ReportPDF`` builds on ``StatePDF``, which the core-font exporters (the
+camper/vehicle finders) use directly. Drawing helpers call ``set_font`` and
+the ``set_*_color`` methods before every row or cell, mostly with the
+values already in effect. fpdf2 then writes no operator, but still parses
+the style, resolves the Arial alias (raising a ``DeprecationWarning`` and
+walking the stack for it) and builds a colour object on every call.
+``StatePDF`` remembers what each ``set_font`` argument tuple resolved to and
+each colour's device value, and returns before any of that work when the
+result matches the current state.
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+
+import fpdf
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.drawing_primitives import convert_to_device_color
+from fpdf.enums import FontDescriptorFlags, TextEmphasis
+from fpdf.fonts import CORE_FONTS_CHARWIDTHS, PDFFontDescriptor, SubsetMap, TTFFont
+
+from rok_export.text import latin_safe
+
+FONT_DIRS = ["/usr/share/fonts", "/usr/local/share/fonts", "~/.local/share/fonts", "~/.fonts",
+             "/Library/Fonts", "~/Library/Fonts", "C:/Windows/Fonts"]
+# family name -> file name per style, in order of preference
+FONT_FAMILIES = {
+    "LiberationSans": {"": "LiberationSans-Regular.ttf", "B": "LiberationSans-Bold.ttf",
+                       "I": "LiberationSans-Italic.ttf", "BI": "LiberationSans-BoldItalic.ttf"},
+    "DejaVuSans": {"": "DejaVuSans.ttf", "B": "DejaVuSans-Bold.ttf",
+                   "I": "DejaVuSans-Oblique.ttf", "BI": "DejaVuSans-BoldOblique.ttf"},
+    "NotoSans": {"": "NotoSans-Regular.ttf", "B": "NotoSans-Bold.ttf",
+                 "I": "NotoSans-Italic.ttf", "BI": "NotoSans-BoldItalic.ttf"},
+}
+# Core font names the exporters ask for; these are served by the embedded font
+CORE_ALIASES = ("helvetica", "arial")
+# fpdf2 releases whose private internals (font attributes, page output) were checked: [low, high)
+FPDF2_TESTED = ((2, 8), (2, 9))
+# Text the width scale is measured on
+WIDTH_SAMPLE = "The quick brown fox jumps over the lazy dog 0123456789 $1,234.56 (Mon-Fri)"
+
+_family = None
+_metrics = {}  # font path -> metrics of its first parse in this process
+
+
+def _font_dirs():
+    spec = os.environ.get("ROK_EXPORT_FONT_DIR")
+    if spec is not None:
+        return [] if spec.lower() in ("", "core", "off") else [spec]
+    return FONT_DIRS
+
+
+def find_font_family():
+    """``(name, {style: path})`` for the first installed family, or None (cached per process)."""
+    global _family
+    if _family is None:
+        wanted = {file_name for files in FONT_FAMILIES.values() for file_name in files.values()}
+        found = {}
+        for root in map(os.path.expanduser, _font_dirs()):
+            for dirpath, _, file_names in os.walk(root):
+                for file_name in wanted.intersection(file_names):
+                    found.setdefault(file_name, os.path.join(dirpath, file_name))
+        _family = (None,)
+        for name, files in FONT_FAMILIES.items():
+            if files[""] in found:
+                _family = (name, {style: found[f] for style, f in files.items() if f in found})
+                break
+    return _family if _family[0] else None
+
+
+def fpdf2_tested():
+    """True if the installed fpdf2 is one ``rok_export`` was checked against for its private API."""
+    try:
+        version = tuple(int(part) for part in fpdf.__version__.split(".")[:2])
+    except ValueError:
+        return False
+    return FPDF2_TESTED[0] <= version < FPDF2_TESTED[1]
+
+
+def _set_attributes(font):
+    """Names of the attributes ``font`` has set (``TTFFont`` uses ``__slots__``)."""
+    names = {name for cls in type(font).__mro__ for name in getattr(cls, "__slots__", ())}
+    names.update(getattr(font, "__dict__", ()))
+    return sorted(name for name in names if hasattr(font, name))
+
+
+def _extract_metrics(font):
+    """The parse results of a ``TTFFont``, enough to rebuild it with ``_font_from_metrics``."""
+    desc = font.desc
+    return {
+        "name": font.name, "scale": font.scale, "up": font.up, "ut": font.ut, "sp": font.sp, "ss": font.ss,
+        "desc": {"ascent": desc.ascent, "descent": desc.descent, "cap_height": desc.cap_height,
+                 "flags": desc.flags.value, "font_b_box": desc.font_b_box, "italic_angle": desc.italic_angle,
+                 "stem_v": desc.stem_v, "missing_width": desc.missing_width},
+        "cmap": font.cmap, "cw": dict(font.cw), "glyph_ids": font.glyph_ids,
+        "attrs": _set_attributes(font),  # what a parsed font carries, checked by _font_from_metrics
+    }
+
+
+def _font_from_metrics(pdf, path, fontkey, style, metrics):
+    """A ``TTFFont`` rebuilt from an earlier parse's metrics, reopening the file for subsetting at output.
+
+    This sets fpdf2's private attributes directly; if they no longer match
+    the ones a parsed font carries, raises AttributeError so the caller can
+    fall back to ``add_font``.
+    """
+    font = TTFFont.__new__(TTFFont)
+    font.i = len(pdf.fonts) + 1
+    font.type = "TTF"
+    font.ttffile = Path(path)
+    font.fontkey = fontkey
+    font.emphasis = TextEmphasis.coerce(style)
+    font.ttfont = ttLib.TTFont(path, recalcTimestamp=False, lazy=None)
+    font.is_compressed = font.is_cff = font.is_cid_keyed = font.is_symbol = False
+    font.cff_ros = None
+    font.collection_font_number = 0
+    font.biggest_size_pt = 0
+    font._hbfont = None
+    font.color_font = None
+    font.palette_index = 0
+    for attr in ("name", "scale", "up", "ut", "sp", "ss"):
+        setattr(font, attr, metrics[attr])
+    desc = dict(metrics["desc"], flags=FontDescriptorFlags(metrics["desc"]["flags"]))
+    font.desc = PDFFontDescriptor(**desc)
+    font.cmap = metrics["cmap"]  # read-only, shared like TTFFont.__deepcopy__ does
+    font.cw = defaultdict(lambda: desc["missing_width"], metrics["cw"])
+    font.glyph_ids = dict(metrics["glyph_ids"])
+    font.missing_glyphs = []
+    font.subset = SubsetMap(font)
+    if _set_attributes(font) != metrics["attrs"]:
+        raise AttributeError("fpdf2's TTFFont attributes changed; parsing the font instead")
+    return font
+
+
+def _cacheable(font):
+    """Only plain TrueType fonts are rebuilt from stored metrics; anything else is parsed each time."""
+    return not (font.is_compressed or font.is_cff or font.is_symbol or font.color_font)
+
+
+class StatePDF(FPDF):
+    """``FPDF`` whose ``set_font`` and colour setters return early when nothing would change."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._font_requests = {}  # (family, style, size) -> resulting font state
+        self._device_colors = {}  # (r, g, b) -> DeviceGray / DeviceRGB
+
+    def _font_state(self):
+        return self.font_family, self.font_style, self.font_size_pt, self.underline, self.strikethrough
+
+    def _resolve_font(self, family, style, size):
+        """Arguments for ``FPDF.set_font``; core-font aliases (Arial) are mapped without fpdf2's warning."""
+        if family and family.lower() in self.font_aliases:
+            style_name = style.style if isinstance(style, TextEmphasis) else style
+            emphasis = "".join(sorted(c for c in style_name.upper() if c in "BI"))
+            if family.lower() + emphasis not in self.fonts:
+                family = self.font_aliases[family.lower()]
+        return family, style, size
+
+    def set_font(self, family=None, style="", size=0):
+        key = (family, style, size)
+        state = self._font_requests.get(key)
+        if state is not None:
+            if state != self._font_state():
+                # The font is registered already: select it as FPDF.set_font would
+                self.font_family, self.font_style, self.font_size_pt, self.underline, self.strikethrough = state
+                self.current_font = self.fonts[state[0] + state[1]]
+                self.current_font_is_set_on_page = False
+            return
+        super().set_font(*self._resolve_font(family, style, size))
+        if family and size:  # otherwise the result depends on the current font
+            self._font_requests[key] = self._font_state()
+
+    def _device_color(self, r, g, b):
+        if isinstance(r, (int, float)):
+            key = (r, g, b)
+            color = self._device_colors.get(key)
+            if color is None:
+                color = self._device_colors[key] = convert_to_device_color(r, g, b)
+            return color
+        return convert_to_device_color(r, g, b)
+
+    def set_text_color(self, r, g=-1, b=-1):
+        color = self._device_color(r, g, b)
+        if color != self.text_color:
+            super().set_text_color(color)
+
+    def set_fill_color(self, r, g=-1, b=-1):
+        color = self._device_color(r, g, b)
+        if color != self.fill_color:
+            super().set_fill_color(color)
+
+    def set_draw_color(self, r, g=-1, b=-1):
+        color = self._device_color(r, g, b)
+        if color != self.draw_color:
+            super().set_draw_color(color)
+
+
+class ReportPDF(StatePDF):
+    """``FPDF`` that renders the core Helvetica/Arial requests with an embedded Unicode font."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unicode_family = None
+        self.unicode_styles = ()
+        self.width_scale = 1.0
+        family = find_font_family()
+        if family:
+            name, paths = family
+            for style, path in paths.items():
+                self._add_cached_font(name, style, path)
+            self.unicode_family = name.lower()
+            self.unicode_styles = tuple(paths)
+            self.width_scale = self._helvetica_width_scale()
+
+    def _add_cached_font(self, family, style, path):
+        fontkey = f"{family.lower()}{style}"
+        metrics = _metrics.get(path)
+        if metrics is not None:
+            try:
+                self.fonts[fontkey] = _font_from_metrics(self, path, fontkey, style, metrics)
+                return
+            except (AttributeError, TypeError, KeyError, ValueError):
+                pass  # fpdf2 builds its fonts differently: parse the file as usual
+        self.add_font(family, style, path)
+        if metrics is None and fpdf2_tested() and _cacheable(self.fonts[fontkey]):
+            _metrics[path] = _extract_metrics(self.fonts[fontkey])
+
+    def _helvetica_width_scale(self):
+        """Helvetica's width of ``WIDTH_SAMPLE`` over the embedded font's, both in 1/1000 em."""
+        core = CORE_FONTS_CHARWIDTHS["helvetica"]
+        embedded = self.fonts[self.unicode_family].cw
+        return sum(core[c] for c in WIDTH_SAMPLE) / sum(embedded[ord(c)] for c in WIDTH_SAMPLE)
+
+    def _style_for(self, style):
+        """``style`` reduced to one the embedded family ships (italic falls back to upright)."""
+        style = "".join(sorted(style.upper()))
+        emphasis = "".join(c for c in style if c in "BI")
+        if emphasis not in self.unicode_styles:
+            emphasis = "B" if "B" in emphasis and "B" in self.unicode_styles else ""
+        return emphasis + "".join(c for c in style if c in "SU")
+
+    def font_widths(self, family, style=""):
+        """``(fontkey, char widths, size factor)`` that ``set_font(family, style, ...)`` selects.
+
+        Widths are in 1/1000 em, keyed by code point for the embedded font and by
+        character for core fonts (whose text is ``latin_safe``-d first).
+        """
+        style = "".join(sorted(c for c in style.upper() if c in "BI"))
+        if self.unicode_family and family.lower() in CORE_ALIASES:
+            fontkey = self.unicode_family + self._style_for(style)
+            return fontkey, self.fonts[fontkey].cw, self.width_scale
+        family = "helvetica" if family.lower() in CORE_ALIASES else family.lower()
+        return family + style, CORE_FONTS_CHARWIDTHS[family + style], 1.0
+
+    def _resolve_font(self, family, style, size):
+        if self.unicode_family and family and family.lower() in CORE_ALIASES:
+            style = self._style_for(style.style if isinstance(style, TextEmphasis) else style)
+            return self.unicode_family, style, size * self.width_scale
+        return super()._resolve_font(family, style, size)
+
+    def normalize_text(self, text):
+        text = "" if text is None else str(text)
+        if not self.is_ttf_font:
+            text = latin_safe(text)
+        return super().normalize_text(text)
@@ -0,0 +1,75 @@
+"""
+Render profiling -- what ``--profile`` records for each ``generate_*`` call.
+
+``profile_render`` runs one generator under cProfile and tracemalloc and
+returns a JSON-friendly summary: wall and CPU time, peak traced memory, the
+functions with the most self time (where ``latin_safe`` or string building
+shows up) and the source lines still holding the most memory when it
+returned. ``write_summary`` stores the per-format summaries as
+``{stem}.profile.json`` beside the report so a slow customer export can be
+diagnosed after the fact.
+
+Both profilers slow rendering down considerably, so profiled timings are
+only meaningful relative to each other.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+TOP_FUNCTIONS = 15
+TOP_ALLOCATIONS = 10
+
+
+def _function_label(key):
+    filename, line, name = key
+    if filename == "~":  # built-in
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def profile_render(generator, data, output_path):
+    """Run one generator under cProfile + tracemalloc and summarize both."""
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    profiler.enable()
+    try:
+        generator(data, output_path)
+    finally:
+        profiler.disable()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    stats = pstats.Stats(profiler).stats
+    by_self_time = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:TOP_FUNCTIONS]
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)])
+    return {
+        "seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "peak_traced_bytes": peak,
+        "top_functions": [
+            {"function": _function_label(key), "calls": nc, "self_seconds": round(tt, 4), "cumulative_seconds": round(ct, 4)}
+            for key, (_, nc, tt, ct, _) in by_self_time
+        ],
+        "top_allocations": [
+            {"site": f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+             "bytes": stat.size, "blocks": stat.count}
+            for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+        ],
+    }
+
+
+def write_summary(output_path, profiles):
+    """Write ``{fmt: profile}`` next to ``output_path`` and return the summary's path."""
+    path = f"{os.path.splitext(output_path)[0]}.profile.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profiles, f, indent=2)
+    return path
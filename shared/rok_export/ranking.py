@@ -0,0 +1,110 @@
+"""
+Listing ranking -- re-order inventory records in the exporter on request.
+
+The agent ranks listings before writing the payload, and its order and
+``rank`` numbers are what the user discussed with it, so without weights
+the reports keep them on purpose: ``rank_records`` returns the records as
+they came and ``top_records(records, k)`` the first ``k``. Given weights
+(``--rank-weights`` or the payload's ``rank_weights``, e.g.
+``score=2,fmv=1,distance=0.5``), ``rank_records`` re-orders normalized
+records (see ``rok_export.listings``) and renumbers ``rank`` from 1, and
+``top_records`` picks the best ``k`` with a heap when the full order is not
+needed. The exporters rank once per export and take the detail cards'
+top three from the ranked list.
+
+Each weighted criterion is min-max scaled to 0..1 across the listings,
+best = 1, and records are ordered by the weighted sum. Ties fall back to a
+stable multi-key sort: composite score (high first), then price vs FMV %
+(low first), dealer distance (near first) and dealer rating (high first);
+missing values sort last on each key and full ties keep the payload's
+order.
+"""
+
+import heapq
+
+# criterion -> (record attribute, True if higher values rank first)
+CRITERIA = {
+    "score": ("composite_score", True),
+    "fmv": ("price_vs_fmv_pct", False),
+    "distance": ("dealer_distance_miles", False),
+    "rating": ("dealer_rating", True),
+}
+
+
+def parse_weights(spec):
+    """Parse ``"score=2,fmv=1"`` into ``{"score": 2.0, "fmv": 1.0}``; raises ValueError."""
+    weights = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, sep, value = part.partition("=")
+        name = name.strip()
+        if not sep or name not in CRITERIA:
+            raise ValueError(f"expected NAME=WEIGHT with NAME one of {', '.join(CRITERIA)}, got {part.strip()!r}")
+        weights[name] = float(value)
+    return weights
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _default_key(rec):
+    key = []
+    for attr, higher_first in CRITERIA.values():
+        value = getattr(rec, attr)
+        if _is_number(value):
+            key += (0, -value if higher_first else value)
+        else:
+            key += (1, 0)
+    return tuple(key)
+
+
+def _weighted_key(records, weights):
+    """Sort key putting the highest weighted score first; ``_default_key`` breaks ties."""
+    scales = []
+    for name, weight in weights.items():
+        attr, higher_first = CRITERIA[name]
+        values = [v for v in (getattr(rec, attr) for rec in records) if _is_number(v)]
+        if weight and values:
+            scales.append((attr, higher_first, weight, min(values), max(values) - min(values)))
+
+    def key(rec):
+        total = 0.0
+        for attr, higher_first, weight, low, span in scales:
+            value = getattr(rec, attr)
+            if not _is_number(value):
+                continue  # missing counts as the worst value (0)
+            scaled = (value - low) / span if span else 1.0
+            total += weight * (scaled if higher_first else 1.0 - scaled)
+        return (-total,) + _default_key(rec)
+    return key
+
+
+def _normalize(weights):
+    """Weights from a spec string or dict as a hashable, validated tuple."""
+    if isinstance(weights, str):
+        weights = parse_weights(weights)
+    unknown = set(weights or {}) - set(CRITERIA)
+    if unknown:
+        raise ValueError(f"unknown rank weight(s) {', '.join(sorted(unknown))}; expected {', '.join(CRITERIA)}")
+    return tuple(sorted((name, float(weight)) for name, weight in (weights or {}).items()))
+
+
+def rank_records(records, weights=None):
+    """``records`` in weighted ranking order with ``rank`` renumbered from 1; the payload's order without weights."""
+    weights = dict(_normalize(weights))
+    if not weights:
+        return list(records)
+    ranked = sorted(records, key=_weighted_key(records, weights))
+    for position, rec in enumerate(ranked, 1):
+        rec.rank = position
+    return ranked
+
+
+def top_records(records, k, weights=None):
+    """The best ``k`` of ``records`` by ``weights`` (the first ``k`` without); ranks are left as they are."""
+    weights = dict(_normalize(weights))
+    if not weights:
+        return list(records[:k])
+    return heapq.nsmallest(k, records, key=_weighted_key(records, weights))
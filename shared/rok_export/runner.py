@@ -0,0 +1,173 @@
+"""
+Export runner -- renders the requested formats of one report in parallel.
+
+Every exporter builds a list of ``(fmt, generator, output_path)`` jobs and
+hands it to ``run_exports``; a generator may be a ``functools.partial``
+carrying values the exporter prepared once for all formats. The jobs run in a process pool, so a slow PDF
+pass overlaps the HTML and Markdown passes instead of following them, and
+each job reports wall time, CPU time, output bytes and the rendering
+process's peak RSS. Peak RSS is a process high-water mark: per format when
+formats render in separate workers, cumulative when they render serially.
+
+Generators import their heavy backends (``fpdf``, ``openpyxl``) inside the
+function body, so a run that skips a format via ``--formats`` never pays for
+that import.
+
+Unless ``force`` is set, formats whose output is already current for this
+input and exporter version (see ``rok_export.cache``) are skipped, which
+makes re-exporting unchanged JSON close to free.
+
+With ``profile`` set, every pending format renders under
+``rok_export.profiling`` and the per-format summaries are written beside
+the outputs and returned with the timings.
+
+With ``optimize_pdf`` set (``--optimize-pdf``), each rendered PDF is
+rewritten by ``rok_export.optimize`` and its metrics gain an ``"optimize"``
+entry with the bytes before and after. Optimized PDFs are cached under
+their own key, so toggling the flag re-renders them.
+"""
+
+import argparse
+import inspect
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rok_export import cache, optimize, profiling
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _render(generator, data, output_path, profile=False, optimize_pdf=False):
+    """Run one generator and return its metrics (plus a profile if asked)."""
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    if profile:
+        report = profiling.profile_render(generator, data, output_path)
+    else:
+        generator(data, output_path)
+    sizes = optimize.optimize_file(output_path) if optimize_pdf and _is_pdf(output_path) else None
+    metrics = {
+        "wall_seconds": round(time.perf_counter() - wall_start, 3),
+        "cpu_seconds": round(time.process_time() - cpu_start, 3),
+        "bytes": os.path.getsize(output_path),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    if sizes:
+        metrics["optimize"] = sizes
+    if profile:
+        metrics["profile"] = report
+    return metrics
+
+
+def _is_pdf(path):
+    return path.lower().endswith(".pdf")
+
+
+def parse_formats(spec, available):
+    """Turn a ``--formats`` value ("all" or "html,pdf") into a list of formats.
+
+    Raises ValueError for names not in ``available``.
+    """
+    if not spec or spec == "all":
+        return list(available)
+    requested = [fmt.strip().lower() for fmt in spec.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in requested if fmt not in available]
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(unknown)} (choose from: {', '.join(available)})")
+    return [fmt for fmt in available if fmt in requested]
+
+
+def formats_arg(available):
+    """``argparse`` ``type=`` for ``--formats``: an unknown name is a usage error before any work starts."""
+    def check(spec):
+        try:
+            parse_formats(spec, available)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+        return spec
+    return check
+
+
+def run_exports(data, jobs, max_workers=None, formats="all", force=False, profile=False, optimize_pdf=False):
+    """Render each ``(fmt, generator, output_path)`` job for ``data``.
+
+    ``formats`` is a ``--formats`` value; jobs for other formats are skipped,
+    as are jobs whose output is already current unless ``force`` is set.
+    Returns ``{fmt: {"path": ..., "metrics": {...}}}`` in job order; the
+    metrics of skipped-as-current entries carry ``"cached": True``.
+    ``profile`` implies ``force`` and adds a ``"profile"`` summary to each
+    entry; ``optimize_pdf`` shrinks PDF outputs after rendering. With a
+    single pending job, or ``max_workers=1``, everything runs in-process.
+    A failing generator re-raises its exception here once the other jobs
+    finish.
+    """
+    selected = parse_formats(formats, [fmt for fmt, _, _ in jobs])
+    jobs = [job for job in jobs if job[0] in selected]
+    if not jobs:
+        return {}
+
+    generator = jobs[0][1]
+    base_key = cache.cache_key(data, inspect.getfile(getattr(generator, "func", generator)))  # unwrap a functools.partial
+
+    def key(path):
+        return f"{base_key}+optimized" if optimize_pdf and _is_pdf(path) else base_key
+
+    current = set() if force or profile else {fmt for fmt, _, path in jobs if cache.is_current(path, key(path))}
+    pending = [job for job in jobs if job[0] not in current]
+
+    if max_workers is None:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+
+    if max_workers <= 1 or len(pending) <= 1:
+        outcomes = [_render(generator, data, path, profile, optimize_pdf) for _, generator, path in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_render, generator, data, path, profile, optimize_pdf)
+                       for _, generator, path in pending]
+            outcomes = [future.result() for future in futures]
+    for job_key in {key(path) for _, _, path in pending}:
+        cache.record([path for _, _, path in pending if key(path) == job_key], job_key)
+
+    rendered = dict(zip([fmt for fmt, _, _ in pending], outcomes))
+    if profile:
+        summary_path = profiling.write_summary(jobs[0][2], {fmt: m["profile"] for fmt, m in rendered.items()})
+    results = {}
+    for fmt, _, path in jobs:
+        if fmt in current:
+            metrics = {"wall_seconds": 0.0, "cpu_seconds": 0.0, "bytes": os.path.getsize(path),
+                       "peak_rss_mb": None, "cached": True}
+            results[fmt] = {"path": path, "metrics": metrics}
+        elif profile:
+            metrics = rendered[fmt]
+            results[fmt] = {"path": path, "profile": metrics.pop("profile"), "profile_path": summary_path,
+                            "metrics": metrics}
+        else:
+            results[fmt] = {"path": path, "metrics": rendered[fmt]}
+    return results
+
+
+def summarize(results):
+    """Result-dict fields every exporter reports: output paths, per-format metrics, profiles."""
+    summary = {fmt: info["path"] for fmt, info in results.items()}
+    summary["metrics"] = {fmt: info["metrics"] for fmt, info in results.items()}
+    profiled = {fmt: info for fmt, info in results.items() if "profile" in info}
+    if profiled:
+        summary["profile"] = {
+            "path": next(iter(profiled.values()))["profile_path"],
+            "formats": {fmt: info["profile"] for fmt, info in profiled.items()},
+        }
+    return summary
+
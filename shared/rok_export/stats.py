@@ -0,0 +1,194 @@
+"""
+Market statistics -- columnar aggregates over normalized inventory listings.
+
+The inventory payloads carry ``market_context`` figures (FMV average, asking
+average) that upstream agents computed by hand, and nothing about how the
+listings are distributed. ``market_stats`` loads price, FMV, distance, score
+and an optional size column (``length_ft`` for campers) from the
+``rok_export.listings`` records into float arrays once, then derives FMV
+deltas, price percentiles, price per unit, deal-rating buckets and a
+composite-score histogram from them.
+
+NumPy is used when it is installed: for 100k listings, gathering the columns
+from the records takes about 0.1 s and the aggregates a few milliseconds.
+Without it the same numbers come from a pure-Python fallback. Percentiles use
+linear interpolation in both paths, so reports do not change with the
+environment. ``stat_rows`` turns the result into ``(label, value)`` pairs
+that each renderer lays out in its own style.
+"""
+
+import math
+from collections import Counter
+from operator import attrgetter
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python fallback below
+    np = None
+
+PERCENTILES = (10, 25, 50, 75, 90)
+SCORE_BINS = 10  # composite scores 0-100 in bins of 10; 100 counts in the last bin
+
+
+def _number(value):
+    """float(value), or NaN for placeholders like 'N/A' (matches ``np.fromiter``)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _columns(records, fields):
+    """One float column per field, NaN where a value is missing or not a number."""
+    columns = {}
+    for field in fields:
+        get = attrgetter(field)
+        if np is not None:
+            try:
+                # One C-level pass when every value is numeric (the common case)
+                columns[field] = np.fromiter(map(get, records), dtype=float, count=len(records))
+                continue
+            except (TypeError, ValueError):
+                pass
+        values = [_number(v) for v in map(get, records)]
+        columns[field] = np.array(values, dtype=float) if np is not None else values
+    return columns
+
+
+def _valid(values):
+    """Drop NaNs (missing or non-numeric values)."""
+    if np is not None:
+        return values[~np.isnan(values)]
+    return [v for v in values if v == v]
+
+
+def _percentile(ordered, q):
+    """Linear-interpolated percentile of an ascending list (NumPy's default method)."""
+    pos = (len(ordered) - 1) * q / 100
+    low = math.floor(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def _summary(values):
+    """min/max/mean and PERCENTILES of a NaN-free column, or None when it is empty."""
+    if len(values) == 0:
+        return None
+    if np is not None:
+        points = np.percentile(values, PERCENTILES)
+        result = {"count": int(values.size), "min": float(values.min()), "max": float(values.max()),
+                  "mean": float(values.mean())}
+    else:
+        ordered = sorted(values)
+        points = [_percentile(ordered, q) for q in PERCENTILES]
+        result = {"count": len(ordered), "min": ordered[0], "max": ordered[-1], "mean": sum(ordered) / len(ordered)}
+    for q, point in zip(PERCENTILES, points):
+        result["median" if q == 50 else f"p{q}"] = float(point)
+    return result
+
+
+def _paired(values, base):
+    """(values, base) restricted to rows where the value is known and base > 0."""
+    if np is not None:
+        mask = ~np.isnan(values) & (base > 0)
+        return values[mask], base[mask]
+    pairs = [(v, b) for v, b in zip(values, base) if v == v and b > 0]
+    return [v for v, _ in pairs], [b for _, b in pairs]
+
+
+def _score_histogram(scores):
+    if np is not None:
+        counts, _ = np.histogram(scores, bins=SCORE_BINS, range=(0, 100))
+        return [int(c) for c in counts]
+    counts = [0] * SCORE_BINS
+    for score in scores:
+        if 0 <= score <= 100:
+            counts[min(int(score * SCORE_BINS // 100), SCORE_BINS - 1)] += 1
+    return counts
+
+
+def market_stats(records, unit_field=None):
+    """Aggregate ``records`` (see ``listing_records``) into a JSON-friendly dict.
+
+    ``unit_field`` names a size attribute (e.g. ``"length_ft"``) for a
+    price-per-unit summary.
+    """
+    fields = ("price", "fmv", "dealer_distance_miles", "composite_score") + ((unit_field,) if unit_field else ())
+    columns = _columns(records, fields)
+    price = columns["price"]
+    # Deltas only for listings with both a price and a usable FMV
+    priced, fmv = _paired(price, columns["fmv"])
+    if np is not None:
+        delta = priced - fmv
+        delta_pct = delta / fmv * 100
+    else:
+        delta = [p - f for p, f in zip(priced, fmv)]
+        delta_pct = [d / f * 100 for d, f in zip(delta, fmv)]
+    if unit_field:
+        unit_price, units = _paired(price, columns[unit_field])
+        per_unit = unit_price / units if np is not None else [p / u for p, u in zip(unit_price, units)]
+
+    stats = {
+        "count": len(records),
+        "price": _summary(_valid(price)),
+        "fmv": _summary(_valid(columns["fmv"])),
+        "fmv_delta": _summary(delta),
+        "fmv_delta_pct": _summary(delta_pct),
+        "below_fmv": int((delta < 0).sum()) if np is not None else sum(1 for d in delta if d < 0),
+        "price_per_unit": _summary(per_unit) if unit_field else None,
+        "distance": _summary(_valid(columns["dealer_distance_miles"])),
+        "deal_buckets": dict(Counter(map(attrgetter("deal_rating"), records)).most_common()),
+        "score_histogram": _score_histogram(_valid(columns["composite_score"])),
+    }
+    return stats
+
+
+def stat_mean(stats, column):
+    """Mean of ``column`` ("price", "fmv", ...) or 0 when no listing has it."""
+    summary = stats[column]
+    return summary["mean"] if summary else 0
+
+
+def _money(value):
+    return f"-${abs(value):,.0f}" if value < 0 else f"${value:,.0f}"
+
+
+def stat_rows(stats, unit=None):
+    """``(label, value)`` display pairs for the report's Market Statistics section.
+
+    ``unit`` is ``(name, abbreviation)`` for the price-per-unit row, e.g. ``("foot", "ft")``.
+    """
+    rows = []
+    price = stats["price"]
+    if price:
+        rows.append(("Asking Price Range", f"{_money(price['min'])} - {_money(price['max'])}"))
+        rows.append(("Asking Price Percentiles",
+                     f"P10 {_money(price['p10'])} / P25 {_money(price['p25'])} / Median {_money(price['median'])} / "
+                     f"P75 {_money(price['p75'])} / P90 {_money(price['p90'])}"))
+    delta, delta_pct = stats["fmv_delta"], stats["fmv_delta_pct"]
+    if delta and delta_pct:
+        sign = "+" if delta["median"] > 0 else ""
+        # Medians of the dollar and percent deltas are taken separately, so their signs can differ near zero
+        rows.append(("Price vs FMV",
+                     f"Median {sign}{_money(delta['median'])}, median {delta_pct['median']:+.1f}%; "
+                     f"{stats['below_fmv']} of {delta['count']} listed below FMV"))
+    per_unit = stats["price_per_unit"]
+    if per_unit and unit:
+        name, abbreviation = unit
+        rows.append((f"Price per {name.title()}",
+                     f"Median {_money(per_unit['median'])}/{abbreviation} "
+                     f"({_money(per_unit['min'])} - {_money(per_unit['max'])})"))
+    distance = stats["distance"]
+    if distance:
+        rows.append(("Dealer Distance", f"Median {distance['median']:,.0f} mi, farthest {distance['max']:,.0f} mi"))
+    if stats["deal_buckets"]:
+        rows.append(("Deal Ratings", ", ".join(f"{rating.replace('_', ' ')} {count}"
+                                               for rating, count in stats["deal_buckets"].items())))
+    histogram = stats["score_histogram"]
+    if any(histogram):
+        width = 100 // SCORE_BINS
+        bins = [f"{i * width}-{100 if i == SCORE_BINS - 1 else (i + 1) * width - 1}: {count}"
+                for i, count in enumerate(histogram) if count]
+        rows.append(("Composite Scores", ", ".join(bins)))
+    return rows
+
@@ -0,0 +1,133 @@
+"""
+Directory sync -- mirror a folder into the output tree, moving only what changed.
+
+Review exports used to delete their ``e2e-screenshots`` copy and copy the
+whole ``screenshot_dir`` again on every run: hundreds of MB per review, and
+slow on ``/mnt/c``. ``sync_tree(source, dest)`` makes ``dest`` an exact
+mirror of ``source`` incrementally:
+
+* a file whose size and mtime match its copy (or that is the same inode)
+  is left alone; same size but a different mtime is settled by comparing
+  SHA-256 hashes, and an identical file only gets its mtime updated;
+* a new or changed file is reflinked (copy-on-write clone) or, failing
+  that, hardlinked when ``source`` and ``dest`` are on one filesystem, and
+  copied otherwise -- copies run in a thread pool, since they wait on I/O;
+* files and empty folders under ``dest`` that ``source`` no longer has are
+  removed.
+
+Every new file is written beside its target and renamed into place, so an
+interrupted sync never leaves a half-written file. The returned counts say
+what moved.
+"""
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflinks
+    fcntl = None
+
+FICLONE = 0x40049409  # linux/fs.h: clone a whole file (btrfs, XFS)
+COPY_WORKERS = 8
+
+
+def _files(root):
+    """``{relative path: stat}`` of every regular file under ``root``."""
+    found = {}
+    for folder, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(folder, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            found[os.path.relpath(path, root)] = st
+    return found
+
+
+def _digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _current(src, dst, src_st, dst_st):
+    """True if ``dst`` already holds ``src``'s content (its mtime is brought in line if needed)."""
+    if dst_st is None or src_st.st_size != dst_st.st_size:
+        return False
+    if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino) or src_st.st_mtime_ns == dst_st.st_mtime_ns:
+        return True
+    if _digest(src) != _digest(dst):
+        return False
+    os.utime(dst, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+    return True
+
+
+def _reflink(src, tmp):
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as s, open(tmp, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+    shutil.copystat(src, tmp)
+    return True
+
+
+def _place(src, dst, same_device):
+    """Put ``src``'s content at ``dst``; returns ``"linked"`` or ``"copied"``."""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    how = "copied"
+    if same_device and _reflink(src, tmp):
+        how = "linked"
+    elif same_device:
+        try:
+            os.link(src, tmp)
+            how = "linked"
+        except OSError:
+            pass  # no hardlinks on this filesystem (drvfs, some network shares)
+    if how == "copied":
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+    return how
+
+
+def sync_tree(source: str, dest: str, workers=COPY_WORKERS) -> dict:
+    """Mirror ``source`` into ``dest``; returns ``{"unchanged", "linked", "copied", "removed", "bytes_copied"}``."""
+    os.makedirs(dest, exist_ok=True)
+    src_files = _files(source)
+    dst_files = _files(dest)
+    same_device = os.stat(source).st_dev == os.stat(dest).st_dev
+
+    report = {"unchanged": 0, "linked": 0, "copied": 0, "removed": 0, "bytes_copied": 0}
+    for rel in dst_files.keys() - src_files.keys():
+        os.remove(os.path.join(dest, rel))
+        report["removed"] += 1
+
+    todo = []
+    for rel, src_st in src_files.items():
+        if _current(os.path.join(source, rel), os.path.join(dest, rel), src_st, dst_files.get(rel)):
+            report["unchanged"] += 1
+        else:
+            todo.append(rel)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(todo) or 1))) as pool:
+        moves = pool.map(lambda rel: _place(os.path.join(source, rel), os.path.join(dest, rel), same_device), todo)
+        for rel, how in zip(todo, moves):
+            report[how] += 1
+            if how == "copied":
+                report["bytes_copied"] += src_files[rel].st_size
+
+    for folder, _, _ in os.walk(dest, topdown=False):
+        if folder != dest and not os.listdir(folder):
+            os.rmdir(folder)
+    return report
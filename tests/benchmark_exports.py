@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+ROK Plugin Marketplace - Export Benchmarks
+==========================================
+Times every generate_* function of every exporter on synthetic payloads
+(see tests/synthetic_payloads.py) at several row counts and records wall
+time, CPU time, output size and peak RSS per measurement.
+
+Each measurement runs in a fresh interpreter, so peak RSS belongs to that
+one render and module-level caches never leak between runs. Peak RSS
+includes the synthetic payload itself; ``render_rss_mb`` is the growth
+during the render alone (imports included), which is what should stay flat
+for summary formats such as the directory PDF as the row count grows.
+
+Run: python3 tests/benchmark_exports.py --save tests/benchmark_baseline.json
+     python3 tests/benchmark_exports.py --sizes 10,1000 --compare tests/benchmark_baseline.json
+     python3 tests/benchmark_exports.py --types camper_inventory --formats html
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+MARKETPLACE_ROOT = Path(__file__).parent.parent
+PASS = "\033[92m PASS\033[0m"
+FAIL = "\033[91m FAIL\033[0m"
+
+DEFAULT_SIZES = "10,1000,100000"
+
+# report type -> (exporter script, [(format, generator function), ...])
+REPORTS = {
+    "camper_inventory": ("camper-finder/scripts/camper_finder_export.py",
+                         [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "vehicle_inventory": ("vehicle-finder/scripts/vehicle_finder_export.py",
+                          [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "camper_recommendations": ("camper-recommender/scripts/camper_recommender_export.py",
+                               [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "vehicle_recommendations": ("vehicle-recommender/scripts/vehicle_recommender_export.py",
+                                [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "directory_data": ("directory-creator/scripts/directory_export.py",
+                       [("csv", "generate_csv"), ("xlsx", "generate_excel"), ("pdf", "generate_pdf"),
+                        ("html", "generate_html")]),
+    "medigap_selection": ("medigap-selector/scripts/medigap_selector_export.py",
+                          [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "idea_finder_shortlist": ("business-idea-finder/scripts/idea_finder_export.py",
+                              [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "plugin_idea_shortlist": ("plugin-idea-generator/scripts/plugin_ideas_export.py",
+                              [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_markdown")]),
+    "business_analysis": ("business-idea-analyzer/scripts/business_analysis_export.py",
+                          [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_md")]),
+    "briefing": ("intel-briefing/scripts/intel_briefing_export.py",
+                 [("html", "generate_briefing_html"), ("pdf", "generate_briefing_pdf"), ("md", "generate_briefing_md")]),
+    "predictions": ("intel-briefing/scripts/intel_briefing_export.py",
+                    [("html", "generate_predictions_html"), ("pdf", "generate_predictions_pdf"),
+                     ("md", "generate_predictions_md")]),
+    "accuracy": ("intel-briefing/scripts/intel_briefing_export.py",
+                 [("html", "generate_accuracy_html"), ("pdf", "generate_accuracy_pdf"), ("md", "generate_accuracy_md")]),
+    "code_review": ("production-code-review/scripts/code_review_export.py",
+                    [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_md")]),
+    "repo_summary": ("repo-summarizer/scripts/repo_summary_export.py",
+                     [("html", "generate_html"), ("pdf", "generate_pdf"), ("md", "generate_md")]),
+    "estate_snapshot": ("rok-digital-estate/scripts/estate_snapshot_export.py",
+                        [("html", "generate_estate_html"), ("pdf", "generate_estate_pdf"),
+                         ("md", "generate_estate_md")]),
+}
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure(report_type, rows, fmt):
+    """Render one format in this process and return its measurement dict."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from synthetic_payloads import make_payload
+
+    script, generators = REPORTS[report_type]
+    func_name = dict(generators)[fmt]
+    spec = importlib.util.spec_from_file_location(f"bench_{report_type}", MARKETPLACE_ROOT / script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    generator = getattr(module, func_name)
+
+    data = make_payload(report_type, rows)
+    rss_before = _peak_rss_mb()
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, f"bench.{fmt}")
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        generator(data, output_path)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        size = os.path.getsize(output_path)
+    peak = _peak_rss_mb()
+    return {
+        "function": func_name, "wall_seconds": round(wall, 4), "cpu_seconds": round(cpu, 4),
+        "output_bytes": size, "rss_before_mb": rss_before, "peak_rss_mb": peak,
+        "render_rss_mb": round(peak - rss_before, 1),
+    }
+
+
+def run_one(report_type, rows, fmt, timeout):
+    """Measure in a child interpreter; returns the measurement or an error dict."""
+    cmd = [sys.executable, __file__, "--measure", report_type, str(rows), fmt]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout}s"}
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {proc.returncode}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """Print regressions against ``baseline``; returns the number found."""
+    regressions = 0
+    for key, current in results.items():
+        before = baseline.get("results", {}).get(key)
+        if not before or "error" in before or "error" in current:
+            continue
+        for metric in ("wall_seconds", "peak_rss_mb"):
+            old, new = before[metric], current[metric]
+            # Sub-10ms renders are timer noise, not regressions
+            if metric == "wall_seconds" and max(old, new) < 0.01:
+                continue
+            ok = new <= old * (1 + tolerance)
+            if not ok:
+                regressions += 1
+            print(f"  {PASS if ok else FAIL} {key} {metric}: {old} -> {new}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every exporter's generate_* functions")
+    parser.add_argument("--types", default="all", help=f"Comma-separated report types (default: all of {', '.join(REPORTS)})")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated row counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--formats", default="all", help="Comma-separated formats to time (default: all)")
+    parser.add_argument("--timeout", type=int, default=1800, help="Seconds before one measurement is abandoned")
+    parser.add_argument("--save", help="Write results to this JSON baseline file")
+    parser.add_argument("--compare", help="Baseline JSON to check against; exits 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown / RSS growth before --compare fails (default: 0.25 = 25%%)")
+    parser.add_argument("--measure", nargs=3, metavar=("TYPE", "ROWS", "FORMAT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        report_type, rows, fmt = args.measure
+        print(json.dumps(measure(report_type, int(rows), fmt)))
+        return
+
+    types = list(REPORTS) if args.types == "all" else [t.strip() for t in args.types.split(",")]
+    unknown = [t for t in types if t not in REPORTS]
+    if unknown:
+        parser.error(f"unknown report type(s): {', '.join(unknown)}")
+    sizes = [int(s) for s in args.sizes.split(",")]
+    wanted = None if args.formats == "all" else {f.strip() for f in args.formats.split(",")}
+
+    print("ROK Plugin Marketplace - Export Benchmarks")
+    print("=" * 50)
+    results = {}
+    for report_type in types:
+        print(f"\n=== {report_type} ===")
+        for rows in sizes:
+            for fmt, _ in REPORTS[report_type][1]:
+                if wanted and fmt not in wanted:
+                    continue
+                key = f"{report_type}/{rows}/{fmt}"
+                results[key] = run_one(report_type, rows, fmt, args.timeout)
+                r = results[key]
+                if "error" in r:
+                    print(f"  {FAIL} {key}: {r['error']}")
+                else:
+                    print(f"  {key:<45} {r['wall_seconds']:>9.3f}s  {r['peak_rss_mb']:>8.1f} MB "
+                          f"(render +{r['render_rss_mb']:.1f})  {r['output_bytes']:>12,} B")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "date": time.strftime("%Y-%m-%d"), "results": results}, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.save}")
+
+    failed = sum(1 for r in results.values() if "error" in r)
+    if args.compare:
+        print("\n=== Comparison ===")
+        with open(args.compare, "r", encoding="utf-8") as f:
+            failed += compare(results, json.load(f), args.tolerance)
+
+    print("\n" + "=" * 50)
+    print(f"Results: {len(results)} measurements, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""pytest setup: the shared ``rok_export`` package is imported from ``shared/``, as the exporters do."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+ROK Plugin Marketplace - Synthetic Export Payloads
+===================================================
+Deterministic fake agent JSON for every report type the exporters accept,
+scaled by a row count. Used by tests/benchmark_exports.py; can also write a
+payload to disk for running an exporter by hand.
+
+Run: python3 tests/synthetic_payloads.py camper_inventory 1000 > /tmp/camper.json
+"""
+
+import json
+import random
+import sys
+
+DATE = "2026-01-15"
+
+LOREM = ("Solid option with strong reviews; dealer negotiates on accessories and "
+         "the regional market has softened since the spring model-year changeover.").split()
+
+
+def _text(r, words=12):
+    """A short sentence of filler, with one non-Latin-1 character for the PDF path."""
+    return " ".join(r.choice(LOREM) for _ in range(words)).capitalize() + " — est."
+
+
+def _listing(r, i, kind):
+    price = r.randint(30000, 90000)
+    fmv = price + r.randint(-8000, 8000)
+    listing = {
+        "rank": i + 1, "year": "2025", "price": price, "msrp": price + 9000, "fmv": fmv,
+        "price_vs_fmv": price - fmv, "price_vs_fmv_pct": round((price - fmv) / fmv * 100, 1),
+        "deal_rating": r.choice(["GREAT_DEAL", "GOOD_DEAL", "FAIR_PRICE", "OVERPRICED"]),
+        "composite_score": r.randint(40, 99), "dealer_name": f"Dealer {i % 97}",
+        "dealer_distance_miles": r.randint(5, 300), "dealer_rating": round(r.uniform(3, 5), 1),
+        "dealer_review_count": r.randint(10, 900), "exterior_color": r.choice(["White", "Silver", "Black"]),
+        "mileage": r.choice([0, 0, r.randint(100, 40000)]), "stock_number": f"S{i:06d}",
+        "key_features": ["Solar", "Power awning", "King bed"][:r.randint(1, 3)],
+        "incentives": ["$500 rebate"] if i % 3 == 0 else [], "negotiation_notes": _text(r),
+        "listing_url": f"https://example.com/listing/{i}", "phone": "555-0100",
+        "source": r.choice(["RVTrader", "Cars.com", "Dealer site"]), "days_on_market": r.randint(1, 200),
+        "confidence": r.choice(["HIGH", "MEDIUM", "LOW"]),
+    }
+    if kind == "camper":
+        listing.update(make="Grand Design", model="Imagine", floorplan=f"{r.randint(20, 34)}00RL",
+                       rv_type="Travel Trailer", length_ft=r.randint(20, 40), dry_weight_lbs=r.randint(4500, 9000),
+                       gvwr_lbs=r.randint(7000, 11000), slides=r.randint(0, 3), sleeping_capacity=r.randint(2, 8),
+                       fresh_water_gal=50, gray_water_gal=40, black_water_gal=40)
+    else:
+        listing.update(make="Toyota", model="RAV4", trim=r.choice(["LE", "XLE", "Limited"]),
+                       vin=f"2T3P1RFV{i:09d}", interior_color="Black")
+    return listing
+
+
+def _inventory(r, n, kind):
+    camper = kind == "camper"
+    return {
+        "type": f"{kind}_inventory", "generated_date": DATE,
+        "search_params": {"year": "2025", "make": "Grand Design" if camper else "Toyota",
+                          "model": "Imagine" if camper else "RAV4", "max_price": 95000, "radius_miles": 250,
+                          "zip_code": "20850", "condition": "New", "features": ["solar"], "trims": ["XLE"],
+                          "floorplan": "2500RL", "rv_type": "Travel Trailer"},
+        "market_context": {"fmv_average": 60000, "fmv_nada": 59000, "fmv_jd_power": 61000, "fmv_rvtrader_avg": 60500,
+                           "total_listings_found": n, "unique_listings": n, "average_asking": 61000,
+                           "market_trend": "Stable", "best_time_insight": _text(r), "prep_fee_notes": _text(r),
+                           "incentives_summary": ["Fall rebates"]},
+        "methodology": {"sources_covered": ["RVTrader", "Cars.com"], "fmv_sources": ["NADA"], "total_searches": 12,
+                        "agents_dispatched": 4, "deduplication_removals": n // 10},
+        "listings": [_listing(r, i, kind) for i in range(n)],
+    }
+
+
+def camper_inventory(r, n):
+    return _inventory(r, n, "camper")
+
+
+def vehicle_inventory(r, n):
+    return _inventory(r, n, "vehicle")
+
+
+def _recommendations(r, n, kind):
+    camper = kind == "camper"
+    recs = []
+    for i in range(n):
+        rec = {
+            "rank": i + 1, "tier": r.choice(["TOP_PICK", "STRONG", "CONSIDER"]), "year": "2025",
+            "make_model": f"Model {i}", "composite_score": r.randint(50, 99), "fit_score": r.randint(50, 99),
+            "market_score": r.randint(50, 99), "msrp_range": "$40,000 - $55,000", "tco_5year": "$61,000",
+            "resale_3year": "62%", "pros": [_text(r, 6) for _ in range(3)], "cons": [_text(r, 6) for _ in range(2)],
+            "key_sources": ["Consumer Reports", "Owner forums"], "finder_prompt": f"/find model-{i} --zip 20850",
+        }
+        if camper:
+            rec.update(rv_type="Travel Trailer", floorplan="2500RL", best_floorplan_recommendation="2500RL",
+                       length_ft=28, dry_weight_lbs=6200, gvwr_lbs=8000, slides=1, sleeping_capacity=4,
+                       build_quality_rating="4/5",
+                       tank_capacities={"fresh_water": 50, "gray_water": 40, "black_water": 40, "propane": 30})
+        else:
+            rec.update(trim="XLE", best_trim_recommendation="XLE Premium", reliability_rating="4.5/5")
+        recs.append(rec)
+    profile = {"budget_range": "$40k-$60k", "buying_preference": "New", "must_haves": ["AWD"],
+               "priorities": ["Reliability", "Value"]}
+    if camper:
+        profile.update(camper_type="Travel Trailer", rv_type="Travel Trailer", tow_vehicle="F-150")
+    else:
+        profile.update(vehicle_type="SUV")
+    return {
+        "type": f"{kind}_recommendations", "generated_date": DATE, "depth": "standard",
+        "requirements_profile": profile, f"{kind}s_analyzed": n * 3, "shortlist_count": n,
+        "themes": {"best_value": "Model 1", "rising_star": "Model 2", "segment_insight": _text(r),
+                   "quality_leader": "Model 3", "reliability_leader": "Model 3"},
+        "methodology": {"agents_dispatched": 4, "depth": "standard", "sources_covered": ["Edmunds"], "total_searches": 20},
+        "recommendations": recs,
+    }
+
+
+def camper_recommendations(r, n):
+    return _recommendations(r, n, "camper")
+
+
+def vehicle_recommendations(r, n):
+    return _recommendations(r, n, "vehicle")
+
+
+def directory_data(r, n):
+    return {
+        "type": "directory_data", "directory_name": "Synthetic Plumbers", "niche_type": "plumbers",
+        "geography": "Maryland", "generated_date": DATE, "depth": "standard",
+        "statistics": {"total_found": n, "verified": n * 3 // 4, "needs_verification": n // 4,
+                       "duplicates_removed": n // 20, "low_quality_removed": n // 50},
+        "methodology": {"agents_dispatched": 4, "total_searches": 40, "websites_crawled": n, "duration_minutes": 12},
+        "businesses": [{
+            "name": f"Business {i} & Sons", "category": r.choice(["Residential", "Commercial", "Emergency"]),
+            "city": r.choice(["Rockville", "Bethesda", "Gaithersburg"]), "state": "MD", "phone": "301-555-0100",
+            "website": f"https://biz{i}.example.com", "rating": round(r.uniform(3, 5), 1),
+            "review_count": r.randint(0, 500), "quality_score": r.randint(20, 100),
+            "status": r.choice(["verified", "needs_verification"]),
+            "social_links": {"facebook": f"https://facebook.com/biz{i}"},
+        } for i in range(n)],
+    }
+
+
+def medigap_selection(r, n):
+    def insurers():
+        return [{"rank": i + 1, "insurer": f"Insurer {i}", "monthly_premium": round(r.uniform(110, 260), 2),
+                 "am_best": r.choice(["A+", "A", "A-"]), "naic_ratio": round(r.uniform(0.6, 0.9), 2),
+                 "rating_method": r.choice(["Attained", "Issue", "Community"]),
+                 "avg_annual_increase": f"{r.randint(2, 9)}%", "household_discount": "7%",
+                 "why_recommended": _text(r)} for i in range(n)]
+
+    def plan_score():
+        return {"score": r.randint(60, 95), "monthly_premium": 180, "am_best": "A", "naic_ratio": 0.8}
+
+    return {
+        "type": "medigap_selection", "generated_date": DATE,
+        "requirements_profile": {"age": 65, "state": "MD", "zip_code": "20850", "enrollment_status": "Open enrollment",
+                                 "medical_usage": "Moderate", "estimated_annual_visits": 8,
+                                 "provider_assignment": "Accepts assignment", "priorities": ["Predictability"]},
+        "recommendation": {"winner": "plan_g", "confidence": "HIGH", "one_line_summary": _text(r),
+                           "plan_g_score": 88, "plan_n_score": 81},
+        "scoring_detail": {"plan_g": plan_score(), "plan_n": plan_score()},
+        "premium_comparison": {"plan_g_range": "$150-$260", "plan_n_range": "$110-$200", "avg_monthly_spread": 42},
+        "insurer_rankings": {"plan_g": insurers(), "plan_n": insurers()},
+        "break_even_analysis": {"monthly_premium_spread": 42, "visits_to_break_even": 25, "user_estimated_visits": 8,
+                                "excess_charge_risk_level": "LOW", "bottom_line": _text(r)},
+        "scenario_summary": [{"scenario": f"Scenario {i}", "plan_g_cost": 2400 + i, "plan_n_cost": 2100 + i,
+                              "savings": 300, "winner": "plan_n"} for i in range(max(3, n // 10))],
+        "state_rules_impact": {"birthday_rule": False, "switching_recommendation": _text(r), "strategic_value": _text(r)},
+        "strategic_advice": [_text(r) for _ in range(5)],
+        "disclaimers": [_text(r) for _ in range(3)],
+        "methodology": {"agents_dispatched": 3, "total_searches": 18, "sources_covered": ["CMS"], "scoring_system": "100-pt"},
+    }
+
+
+def idea_finder_shortlist(r, n):
+    return {
+        "type": "idea_finder_shortlist", "topic": "home services", "generated_date": DATE, "depth": "standard",
+        "total_raw_discoveries": n * 4, "after_dedup": n * 2, "shortlist_count": n,
+        "themes": {"dominant_theme": _text(r, 5), "emerging_niche": _text(r, 5), "strongest_arbitrage": _text(r, 5)},
+        "methodology": {"agents_dispatched": 5, "total_searches": 60, "sources_covered": ["Reddit", "G2"], "dedup_merges": n},
+        "coverage": {"categories_scanned": ["SaaS", "Services"], "categories_with_zero_results": [], "blind_spots": ["B2G"],
+                     "comparable_ecosystems_checked": ["Shopify"], "source_types_with_no_signal": [],
+                     "unmatched_comparable_categories": []},
+        "consolidation_groups": [{"group_name": f"Group {g}", "ideas": [f"Idea {g * 3 + k}" for k in range(3)],
+                                  "overlapping_capabilities": ["scheduling"], "ecosystem_note": _text(r, 6)}
+                                 for g in range(max(1, n // 10))],
+        "shortlist": [{
+            "rank": i + 1, "idea_name": f"Idea {i}", "one_liner": _text(r), "tier": r.choice(["A", "B", "C"]),
+            "composite_score": r.randint(50, 99), "opportunity_type": "arbitrage", "opportunity_signal": _text(r, 6),
+            "market_demand": r.randint(1, 10), "competitive_durability": r.randint(1, 10), "profile_fit": r.randint(1, 10),
+            "ecosystem_score": r.randint(1, 10), "intersection_multiplier": 1.2, "ai_advantage": _text(r, 6),
+            "arbitrage_window": "6-12 months", "moat_type": "data", "estimated_build_time": "4 weeks",
+            "build_estimate": {"mvp": "2 weeks", "beta": "4 weeks", "production": "8 weeks", "maintenance_profile": "low"},
+            "competitors": [{"name": f"Rival {k}", "strength": "brand", "key_weakness": "price", "relevance": "high"}
+                            for k in range(2)],
+            "key_evidence": [_text(r, 8) for _ in range(2)], "discovery_modes": ["pain_mining"],
+            "ecosystem_note": _text(r, 6), "analyze_prompt": f"/analyze idea-{i}",
+        } for i in range(n)],
+    }
+
+
+def plugin_idea_shortlist(r, n):
+    return {
+        "type": "plugin_idea_shortlist", "topic": "developer tools", "generated_date": DATE, "depth": "standard",
+        "plugins_scanned": 24, "ideas_generated": n * 3, "shortlist_count": n,
+        "themes": {"dominant_theme": _text(r, 5), "emerging_capability": _text(r, 5),
+                   "strongest_market_signal": _text(r, 5)},
+        "portfolio_analysis": {"total_plugins": 24, "covered_domains": ["finance"], "gap_domains": ["legal"],
+                               "extension_opportunities": [{"existing": "camper-finder", "extension": _text(r, 6)}]},
+        "methodology": {"agents_dispatched": 4, "total_searches": 30, "sources_covered": ["GitHub"],
+                        "strategies_used": {"gap_fill": 3, "extension": 2}, "dedup_merges": 3},
+        "shortlist": [{
+            "rank": i + 1, "plugin_name": f"plugin-{i}", "display_name": f"Plugin {i}", "one_liner": _text(r),
+            "tier": r.choice(["BUILD_NOW", "STRONG", "EXPLORE"]), "composite_score": r.randint(50, 99),
+            "personal_utility": r.randint(1, 10), "novelty_score": r.randint(1, 10),
+            "marketization_score": r.randint(1, 10), "generation_strategy": "gap_fill", "extends_plugin": "",
+            "target_user": "solo developers", "why_it_fits": _text(r), "ai_advantage": _text(r, 6),
+            "ai_native_advantage": _text(r, 6), "market_signal": _text(r, 6), "key_risk": _text(r, 6),
+            "product_pathway": "plugin to SaaS", "pathway_note": _text(r, 6),
+            "build_estimate": {"plugin_mvp": "1 week", "product_mvp": "6 weeks"},
+            "proposed_structure": {"agents": 3, "commands": 2, "skills": 1,
+                                   "agent_roles": [{"name": f"agent-{k}", "model": "sonnet", "purpose": _text(r, 5)}
+                                                   for k in range(3)]},
+            "architecture_sketch": {"agents": [{"name": "scout", "model": "haiku", "purpose": "search"}],
+                                    "commands": [{"name": "/run", "description": "Run it"}],
+                                    "data_flow": _text(r, 8), "interconnections": ["camper-finder"]},
+            "create_prompt": f"/create plugin-{i}",
+        } for i in range(n)],
+    }
+
+
+def business_analysis(r, n):
+    def dimension(name):
+        return {"name": name, "score": r.randint(40, 95), "weight": 0.2, "summary": _text(r),
+                "key_findings": [_text(r, 6) for _ in range(2)]}
+
+    opportunities = [{
+        "rank": i + 1, "name": f"Opportunity {i}", "composite_score": r.randint(40, 95),
+        "verdict": r.choice(["GO", "CONDITIONAL", "NO_GO"]), "solopreneur_viable": i % 2 == 0,
+        "recommended_pricing": "$49/mo", "description": _text(r), "mvp_timeline": "6 weeks",
+        "dimensions": [dimension(d) for d in ("Market", "Competition", "Execution")],
+        "tam": {"total_addressable": "$2B", "serviceable_addressable": "$300M", "obtainable_y1": "$1M", "obtainable_y3": "$6M"},
+        "kill_criteria": [{"kill_condition": _text(r, 6), "assumption": _text(r, 6), "status": "untested"}],
+        "next_steps": [_text(r, 6) for _ in range(3)],
+        "top_risks": [{"risk": _text(r, 6), "severity": r.choice(["high", "medium", "low"]), "mitigation": _text(r, 6)}
+                      for _ in range(2)],
+    } for i in range(n)]
+    return {
+        "type": "business_analysis", "idea_description": _text(r), "date": DATE, "depth": "standard",
+        "executive_summary": _text(r, 40), "operator_profile": {"skills": ["python"], "capital": "$10k"},
+        "opportunities": opportunities,
+        "market_research": {
+            "demand_signals": [{"signal": _text(r, 6), "source": "Reddit", "strength": "strong", "confidence": "HIGH"}
+                               for _ in range(max(3, n // 10))],
+            "pain_points": [{"description": _text(r, 6), "severity": r.randint(30, 95), "frequency": "weekly",
+                             "affected_segment": "SMBs", "economic_impact": "$5k/yr"} for _ in range(max(3, n // 10))],
+        },
+        "competitive_analysis": {
+            "competitors": [{"name": f"Competitor {k}", "pricing": "$99/mo", "strengths": ["brand"], "weaknesses": ["price"]}
+                            for k in range(max(3, n // 10))],
+            "feature_matrix": {"features": ["Scheduling", "Billing"], "competitors": {"Competitor 0": [True, False]}},
+            "gap_summary": _text(r),
+        },
+        "risk_register": [{"id": f"R{k}", "category": "market", "description": _text(r, 8), "severity": "MEDIUM",
+                           "mitigation": _text(r, 6)} for k in range(n)],
+        "methodology": {"agents_dispatched": 6, "web_searches_performed": 80, "confidence_threshold": 0.7},
+    }
+
+
+def _prediction(r, i):
+    return {"prediction": _text(r), "prediction_text": _text(r), "category": r.choice(["geopolitical", "financial", "labor"]),
+            "confidence": round(r.uniform(0.3, 0.95), 2), "initial_confidence": 0.6, "timeframe": "3 months",
+            "target_date": "2026-06-30", "made": DATE, "rationale": _text(r), "source": f"Source {i % 9}",
+            "source_author": "Analyst", "outcome": r.choice(["correct", "incorrect", "pending"]), "notes": _text(r, 5)}
+
+
+def _intel_accuracy(r):
+    return {"overall": {"total": 120, "evaluated": 90, "correct": 60, "accuracy": 0.67, "brier": 0.21},
+            "by_category": [{"category": c, "evaluated": 30, "correct": 20, "incorrect": 8, "partial": 2,
+                             "accuracy": 0.67, "brier": 0.2} for c in ("geopolitical", "financial", "labor")],
+            "by_source": [{"source": f"Source {k}", "trust_tier": 2, "predictions": 10, "correct": 6, "accuracy": 0.6}
+                          for k in range(9)]}
+
+
+def _intel(r, n, report_type):
+    accuracy = _intel_accuracy(r)
+    data = {
+        "type": report_type, "date": DATE, "version": "v1", "document_count": n,
+        "executive_summary": _text(r, 40), "new_since_last": n // 2,
+        "key_developments": [{"development": _text(r), "impact": _text(r, 6), "source": f"Source {i % 9}"} for i in range(n)],
+        "geopolitical_section": {"section_summary": _text(r, 20),
+                                 "risk_matrix": [{"risk": _text(r, 5), "probability": "Medium", "impact": "High",
+                                                  "timeframe": "6 months"} for _ in range(max(3, n // 10))],
+                                 "predictions": [_prediction(r, i) for i in range(max(3, n // 10))]},
+        "financial_section": {"market_outlook": {"short_term": _text(r), "medium_term": _text(r)},
+                              "sector_views": [{"sector": f"Sector {k}", "outlook": "Neutral", "confidence": 0.6,
+                                                "rationale": _text(r)} for k in range(8)],
+                              "predictions": [_prediction(r, i) for i in range(max(3, n // 10))]},
+        "labor_section": {"labor_outlook": {"short_term": _text(r), "medium_term": _text(r)},
+                          "sector_impacts": [{"sector": f"Sector {k}", "ai_exposure": "High", "impact_outlook": "Mixed",
+                                              "confidence": 0.6, "rationale": _text(r)} for k in range(8)],
+                          "ai_displacement_indicators": [{"indicator": _text(r, 5), "severity": "MEDIUM",
+                                                          "timeline": "12 months", "affected_sectors": ["Retail"]}
+                                                         for _ in range(5)],
+                          "predictions": [_prediction(r, i) for i in range(max(3, n // 10))]},
+        "cross_domain_themes": [{"theme": _text(r, 4), "geopolitical_angle": _text(r, 6), "financial_angle": _text(r, 6),
+                                 "labor_angle": _text(r, 6), "confidence": 0.6} for _ in range(5)],
+        "consensus_themes": {f"Theme {k}": {"description": _text(r, 8), "confidence": 0.8} for k in range(5)},
+        "contested_topics": {f"Topic {k}": {"view_a": {"position": _text(r, 6), "sources": ["Source 1"]},
+                                            "view_b": {"position": _text(r, 6), "sources": ["Source 2"]},
+                                            "assessment": _text(r, 6)} for k in range(3)},
+        "alert_matches": [{"alert_topic": "tariffs", "significance": "HIGH"} for _ in range(3)],
+        "watch_items": [_text(r, 8) for _ in range(5)],
+        "high_confidence_predictions": [_prediction(r, i) for i in range(max(3, n // 10))],
+        "prediction_tracking": {"accuracy_summary": accuracy["overall"], "due_for_evaluation": [_prediction(r, i) for i in range(3)],
+                                "recent_outcomes": [_prediction(r, i) for i in range(3)]},
+        "full_briefing_md": "# Briefing\n\n" + "\n\n".join(_text(r, 30) for _ in range(max(3, n // 10))),
+    }
+    if report_type == "predictions":
+        data.update(predictions=[_prediction(r, i) for i in range(n)], prediction_count=n)
+    elif report_type == "accuracy":
+        data.update(accuracy)
+    return data
+
+
+def briefing(r, n):
+    return _intel(r, n, "briefing")
+
+
+def predictions(r, n):
+    return _intel(r, n, "predictions")
+
+
+def accuracy(r, n):
+    return _intel(r, n, "accuracy")
+
+
+def code_review(r, n):
+    severities = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+    issues = [{
+        "id": f"ISS-{i:05d}", "title": _text(r, 6), "severity": r.choice(severities),
+        "dimension": r.choice(["security", "reliability", "performance"]), "confidence": round(r.uniform(0.5, 1), 2),
+        "description": _text(r, 20), "recommendation": _text(r, 12),
+        "files": [{"path": f"src/module_{i % 50}.py", "line": r.randint(1, 800)}],
+        "source_models": ["opus", "sonnet"][:r.randint(1, 2)], "model_agreement": r.choice([1, 2, 3]),
+    } for i in range(n)]
+    counts = {s.lower(): sum(1 for iss in issues if iss["severity"] == s) for s in severities}
+    return {
+        "type": "code_review", "project_name": "Synthetic Service", "date": DATE, "review_mode": "full",
+        "production_readiness_score": 72, "verdict": "CONDITIONAL", "executive_summary": _text(r, 40),
+        "tech_stack": "Python, FastAPI, Postgres", "files_reviewed_total": n * 2, "e2e_included": False,
+        "issue_summary": {**counts, "total": n},
+        "dimensions": [{"key": k, "name": k.title(), "score": r.randint(40, 95), "issue_count": n // 3,
+                        "positive_findings": [_text(r, 6)]} for k in ("security", "reliability", "performance")],
+        "model_scores": {"opus": 74, "sonnet": 70},
+        "consensus_analysis": {"high_agreement_count": n // 2, "unique_findings": n // 4,
+                               "dimension_disagreements": [{"dimension": "performance", "spread": 12}]},
+        "journey_results": [], "issues": issues, "recommendations": [_text(r, 8) for _ in range(5)],
+    }
+
+
+def repo_summary(r, n):
+    severities = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+    return {
+        "type": "repo_summary", "project_name": "Synthetic Repo", "date": DATE, "version": "1.1",
+        "maturity_level": "DEVELOPING", "maturity_score": 64, "executive_summary": _text(r, 40),
+        "dimension_scores": {k: {"score": r.randint(0, 100), "weight": 0.2}
+                             for k in ("documentation", "feature_completeness", "infrastructure", "test_presence",
+                                       "architecture_clarity")},
+        "purpose": {"statement": _text(r), "project_type": "web app", "target_users": [{"persona": "Ops", "description": _text(r, 6)}],
+                    "deployment_model": {"type": "container", "platform": "Fly.io"}},
+        "features": [{
+            "name": f"Feature {i}", "category": "core", "status": r.choice(["complete", "partial", "stub", "planned"]),
+            "completeness": r.randint(0, 100), "has_tests": i % 2 == 0, "has_ui": True, "has_api": i % 3 == 0,
+            "description": _text(r), "key_files": [f"src/f{i}.py", f"src/g{i}.py"],
+            "implementation_depth": {"avg_handler_loc": r.randint(0, 40)}, "test_coverage": {"test_case_count": i % 40},
+            "recency_signal": r.choice(["active", "stable", "stale", ""]),
+            "chain_status": r.choice(["complete", "broken", "not_traced"]),
+        } for i in range(n)],
+        "feature_summary": {"total": n, "complete": n // 4, "partial": n // 4, "stub": n // 4, "planned": n // 4},
+        "stack": {"primary_language": "Python", "framework": "Django", "runtime": "CPython 3.12", "database": "Postgres",
+                  "deployment": "Docker", "key_dependencies": ["django", "celery"]},
+        "stack_dependencies": {"runtime": [{"name": f"pkg{i}", "version": "1.0", "purpose": _text(r, 4)}
+                                           for i in range(max(3, n // 10))], "dev": ["pytest", "ruff"]},
+        "gaps": [{"id": f"G{i}", "title": _text(r, 6), "type": "ux_gap", "severity": r.choice(severities),
+                  "effort_estimate": "2h", "recommendation": _text(r)} for i in range(n)],
+        "gap_summary": {"total": n, "critical": n // 4, "high": n // 4, "medium": n // 4, "low": n // 4},
+        "architecture": {"pattern": "MVC", "style": "monolith", "data_flow": _text(r),
+                         "key_files": [{"path": f"src/k{i}.py", "role": "entry", "importance": "high"} for i in range(20)],
+                         "navigation_tips": [_text(r, 6) for _ in range(3)]},
+        "infrastructure_checklist": {"error_handling": "complete", "logging": "partial", "ci_cd": "missing"},
+        "recommendations": [_text(r, 8) for _ in range(5)], "handoff_brief": _text(r, 30),
+        "git_stats": {"commit_count": 1200, "contributors": ["alice", "bob"], "last_commit": DATE},
+        "test_results": {"runner": "pytest", "total_tests": n, "passed_tests": n - n // 10, "failed_tests": n // 20,
+                         "skipped_tests": n // 20, "pass_rate": 0.9, "test_files_count": max(1, n // 10)},
+        "integration_chains": {"total_traced": n, "complete_chains": n // 2, "broken_chains": n - n // 2,
+                               "common_missing_layer": "api",
+                               "chains": [{"feature_area": f"Area {i}", "chain_complete": i % 2 == 0,
+                                           "chain": [{"layer": "ui"}, {"layer": "api"}], "missing_layers": ["db"]}
+                                          for i in range(n)]},
+        "recency_data": {"total_recent_commits": 77, "recency_window": "30 days",
+                         "recently_active_files": [{"file": f"f{i}.py", "change_count": i} for i in range(20)]},
+    }
+
+
+def estate_snapshot(r, n):
+    return {
+        "type": "estate_snapshot", "version": "v1", "date": DATE, "snapshot_date": DATE, "completeness_score": 82,
+        "executive_summary": _text(r, 40), "estate_health": "NEEDS ATTENTION",
+        "unified_projects": [{
+            "name": f"project-{i}", "description": _text(r, 8), "status": r.choice(["active", "paused", "archived"]),
+            "tech_stack": ["Python", "React"], "repo_url": f"https://github.com/example/project-{i}",
+            "deployment_provider": r.choice(["vercel", "netlify", ""]), "deployment_url": f"https://p{i}.example.com",
+            "last_activity": DATE, "is_dirty": i % 5 == 0, "dirty_count": i % 5,
+        } for i in range(n)],
+        "plugin_portfolio": {"total_plugins": 24, "repository": "example/plugins",
+                             "categories": {"finance": [{"name": "medigap-selector", "description": _text(r, 6)}]}},
+        "deployment_map": {"vercel_projects": [{"name": f"site-{i}", "url": f"https://s{i}.vercel.app", "deploy_status": "READY",
+                                                "last_deploy": DATE, "ssl_status": "valid", "custom_domains": []}
+                                               for i in range(max(3, n // 10))],
+                           "netlify_sites": []},
+        "cost_summary": {"monthly_burn": 120, "annual_burn": 1440,
+                         "subscriptions": [{"service": f"Service {k}", "monthly_cost": 10, "renewal_date": "2026-03-01",
+                                            "payment_method": "card", "auto_renew": True} for k in range(max(3, n // 10))]},
+        "bus_factor_dashboard": {"critical": [{"item": f"Domain {k}", "type": "domain", "days_left": 12, "risk": "HIGH",
+                                               "action": "Renew"} for k in range(3)],
+                                 "attention": [], "monitor": [], "stable_count": n},
+        "access_guide": [{"service": f"Service {k}", "url": "https://example.com", "login_method": "SSO",
+                          "credential_location": "1Password"} for k in range(max(3, n // 10))],
+        "contacts": [{"name": "Pat Example", "role": "Executor", "email": "pat@example.com", "phone": "555-0100",
+                      "projects": ["all"]}],
+        "emergency_steps": [{"step": _text(r, 8)} for _ in range(5)],
+        "memory_highlights": {"key_decisions": [{"decision": _text(r, 8), "date": DATE, "context": _text(r, 6)}
+                                                for _ in range(5)],
+                              "known_gotchas": [{"gotcha": _text(r, 6), "impact": "MEDIUM", "workaround": _text(r, 6)}
+                                                for _ in range(5)]},
+        "cross_reference_notes": {"orphan_repos": [], "local_only": [], "dirty_repos": []},
+        "full_estate_md": "# Estate\n\n" + "\n\n".join(_text(r, 30) for _ in range(max(3, n // 10))),
+    }
+
+
+GENERATORS = {
+    "camper_inventory": camper_inventory,
+    "vehicle_inventory": vehicle_inventory,
+    "camper_recommendations": camper_recommendations,
+    "vehicle_recommendations": vehicle_recommendations,
+    "directory_data": directory_data,
+    "medigap_selection": medigap_selection,
+    "idea_finder_shortlist": idea_finder_shortlist,
+    "plugin_idea_shortlist": plugin_idea_shortlist,
+    "business_analysis": business_analysis,
+    "briefing": briefing,
+    "predictions": predictions,
+    "accuracy": accuracy,
+    "code_review": code_review,
+    "repo_summary": repo_summary,
+    "estate_snapshot": estate_snapshot,
+}
+
+
+def make_payload(report_type, rows, seed=1):
+    """Build a ``rows``-sized synthetic payload for ``report_type``."""
+    return GENERATORS[report_type](random.Random(seed), rows)
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in GENERATORS:
+        print(f"Usage: {sys.argv[0]} <{'|'.join(GENERATORS)}> <rows>", file=sys.stderr)
+        sys.exit(2)
+    json.dump(make_payload(sys.argv[1], int(sys.argv[2])), sys.stdout, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
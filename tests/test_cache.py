@@ -0,0 +1,54 @@
+"""rok_export.cache: outputs count as current only for the key, size and mtime they were recorded with."""
+
+import os
+
+import pytest
+
+from rok_export import cache
+
+EXPORTER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "shared", "rok_export", "cache.py")
+
+
+@pytest.fixture(autouse=True)
+def lock_dir(tmp_path_factory, monkeypatch):
+    monkeypatch.setattr(cache, "LOCK_DIR", str(tmp_path_factory.mktemp("locks")))
+
+
+def _render(path, text="report"):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_key_depends_on_data_not_key_order():
+    assert cache.cache_key({"a": 1, "b": [1, 2]}, EXPORTER) == cache.cache_key({"b": [1, 2], "a": 1}, EXPORTER)
+    assert cache.cache_key({"a": 1}, EXPORTER) != cache.cache_key({"a": 2}, EXPORTER)
+
+
+def test_recorded_output_is_current(tmp_path):
+    out = str(tmp_path / "report.md")
+    _render(out)
+    key = cache.cache_key({"a": 1}, EXPORTER)
+    assert not cache.is_current(out, key)
+    cache.record([out], key)
+    assert cache.is_current(out, key)
+    assert sorted(os.listdir(tmp_path)) == sorted(["report.md", cache.MANIFEST_NAME])  # no lock file beside it
+
+
+def test_other_data_is_a_miss(tmp_path):
+    out = str(tmp_path / "report.md")
+    _render(out)
+    cache.record([out], cache.cache_key({"a": 1}, EXPORTER))
+    assert not cache.is_current(out, cache.cache_key({"a": 2}, EXPORTER))
+
+
+def test_changed_or_missing_output_is_a_miss(tmp_path):
+    out = str(tmp_path / "report.md")
+    _render(out)
+    key = cache.cache_key({"a": 1}, EXPORTER)
+    cache.record([out], key)
+    _render(out, "edited by hand")
+    assert not cache.is_current(out, key)
+    cache.record([out], key)
+    os.remove(out)
+    assert not cache.is_current(out, key)
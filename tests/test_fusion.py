@@ -0,0 +1,90 @@
+"""rok_export.fusion: findings from several models cluster into consensus issues with renumbered ids."""
+
+from rok_export.fusion import fuse, fuse_payload
+
+
+def _finding(id, title, path=None, line=0, severity="HIGH", confidence=85, description=""):
+    finding = {"id": id, "title": title, "severity": severity, "confidence": confidence, "description": description}
+    if path:
+        finding["files"] = [{"path": path, "line": line}]
+    return finding
+
+
+MODELS = {
+    "claude": {
+        "security": {"issues": [
+            _finding("SEC-001", "SQL injection in user search", "src/api/users.py", 42, "CRITICAL", 90),
+            _finding("SEC-002", "Hardcoded secret key", "src/config.py", 3, "HIGH", 88),
+        ]},
+        "ux": {"issues": [
+            _finding("UX-001", "Login button unreadable contrast", severity="MEDIUM", confidence=82),
+        ]},
+    },
+    "gemini": {
+        "security": {"issues": [
+            # Same place as claude's SEC-001, a few lines off and worded differently
+            _finding("SEC-007", "Unsanitized query parameter allows SQL injection", "./src/api/users.py", 45,
+                     "HIGH", 86),
+        ]},
+        "ux": {"issues": [
+            _finding("UX-004", "Low contrast on login button", severity="LOW", confidence=80),
+        ]},
+    },
+    "codex": {
+        "security": [
+            _finding("SEC-100", "SQL injection via search", "src/api/users.py", 40, "CRITICAL", 95),
+            # Same file, far away: a separate issue
+            _finding("SEC-101", "Missing rate limit on user search", "src/api/users.py", 120, "MEDIUM", 84),
+        ],
+    },
+}
+
+
+def _by_title_word(issues, word):
+    return [iss for iss in issues if word in iss["title"].lower()]
+
+
+def test_nearby_findings_from_different_models_merge():
+    issues = fuse(MODELS, min_confidence=0)["issues"]
+    sql = _by_title_word(issues, "sql")
+    assert len(sql) == 1
+    assert sql[0]["source_models"] == ["claude", "gemini", "codex"]  # input model order
+    assert sql[0]["model_agreement"] == 3
+    assert sql[0]["severity"] == "CRITICAL"
+    assert sql[0]["severity_consensus"] == "CRITICAL"
+    assert sql[0]["confidence"] == 100  # 95 + 2 extra models * 5, capped
+
+    ux = _by_title_word(issues, "contrast")
+    assert len(ux) == 1 and ux[0]["source_models"] == ["claude", "gemini"]
+    assert len(_by_title_word(issues, "rate limit")) == 1
+    assert len(issues) == 4
+
+
+def test_ids_are_renumbered_per_prefix_in_ranking_order():
+    issues = fuse(MODELS, min_confidence=0)["issues"]
+    assert [iss["id"] for iss in issues] == ["SEC-001", "UX-001", "SEC-002", "SEC-003"]
+    assert issues[0]["model_agreement"] >= issues[-1]["model_agreement"]
+
+
+def test_same_model_never_merges_with_itself():
+    models = {"claude": {"security": {"issues": [
+        _finding("SEC-001", "Token leaked in logs", "src/log.py", 10),
+        _finding("SEC-002", "Password leaked in logs", "src/log.py", 12),
+    ]}}}
+    assert len(fuse(models, min_confidence=0)["issues"]) == 2
+
+
+def test_min_confidence_and_summary():
+    fused = fuse(MODELS, min_confidence=85)
+    assert all(iss["confidence"] >= 85 for iss in fused["issues"])
+    assert fused["issue_summary"]["total"] == len(fused["issues"])
+    assert fused["consensus_analysis"]["high_agreement_count"] == sum(
+        1 for iss in fused["issues"] if iss["model_agreement"] >= 2)
+
+
+def test_fusion_is_deterministic_and_payload_aware():
+    assert fuse(MODELS, min_confidence=0) == fuse(MODELS, min_confidence=0)
+    payload = {"type": "code_review", "issues": [{"id": "OLD-1"}]}
+    assert fuse_payload(payload) is payload  # nothing to fuse
+    fused = fuse_payload(dict(payload, model_findings=MODELS))
+    assert fused["issues"] == fuse(MODELS)["issues"]
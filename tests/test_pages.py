@@ -0,0 +1,36 @@
+"""rok_export.pages: sections are spliced from worker processes only on a tested fpdf2."""
+
+import pytest
+
+from rok_export import pages, pdf
+
+
+def _make_doc():
+    return pdf.StatePDF()
+
+
+def _render_rows(doc, rows, first):
+    doc.set_font("Helvetica", "", 10)
+    for row in rows:
+        doc.cell(0, 6, f"Row {row}", new_x="LMARGIN", new_y="NEXT")
+
+
+def _section(workers):
+    doc = _make_doc()
+    used = pages.render_section(doc, _make_doc, _render_rows, range(pages.MIN_CHUNK * 2), workers=workers)
+    return used, doc.page_no()
+
+
+def test_sections_splice_on_a_tested_fpdf2():
+    if not pdf.fpdf2_tested():
+        pytest.skip("installed fpdf2 is outside FPDF2_TESTED")
+    used, page_count = _section(2)
+    assert used == 2
+    assert page_count >= 2
+
+
+def test_sections_render_serially_on_an_untested_fpdf2(monkeypatch):
+    monkeypatch.setattr(pages, "fpdf2_tested", lambda: False)
+    used, page_count = _section(2)
+    assert used == 1
+    assert page_count >= 1
@@ -0,0 +1,66 @@
+"""rok_export.pdf: fonts rebuilt from an earlier parse, and the add_font fallback."""
+
+import re
+
+import pytest
+
+from rok_export import pdf
+
+
+def _draw(doc):
+    doc.add_page()
+    for style in ("", "B"):
+        doc.set_font("Helvetica", style, 10)
+        for i in range(5):
+            doc.cell(0, 5, f"Line {i}: café – naïve “quotes”", new_x="LMARGIN", new_y="NEXT")
+    return re.sub(rb"/CreationDate \(D:\d+Z\)|/ID \[.*?\]", b"", bytes(doc.output()))
+
+
+@pytest.fixture
+def fresh_metrics(monkeypatch):
+    if pdf.find_font_family() is None:
+        pytest.skip("no Liberation Sans, DejaVu Sans or Noto Sans installed")
+    monkeypatch.setattr(pdf, "_metrics", {})
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Counts ``add_font`` calls, i.e. fonts parsed from the file."""
+    calls = []
+    add_font = pdf.ReportPDF.add_font
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return add_font(self, *args, **kwargs)
+    monkeypatch.setattr(pdf.ReportPDF, "add_font", counting)
+    return calls
+
+
+def test_rebuilt_font_renders_like_add_font(fresh_metrics, parses):
+    if not pdf.fpdf2_tested():
+        pytest.skip("installed fpdf2 is outside FPDF2_TESTED")
+    parsed = _draw(pdf.ReportPDF())
+    first_parses = len(parses)
+    assert first_parses and pdf._metrics  # the first document parsed and kept the metrics
+    assert _draw(pdf.ReportPDF()) == parsed
+    assert len(parses) == first_parses  # the second one rebuilt its fonts
+
+
+def test_untested_fpdf2_always_parses(fresh_metrics, parses, monkeypatch):
+    monkeypatch.setattr(pdf, "fpdf2_tested", lambda: False)
+    first = _draw(pdf.ReportPDF())
+    first_parses = len(parses)
+    assert not pdf._metrics
+    assert _draw(pdf.ReportPDF()) == first
+    assert len(parses) == 2 * first_parses
+
+
+def test_mismatched_attributes_fall_back_to_add_font(fresh_metrics, parses):
+    if not pdf.fpdf2_tested():
+        pytest.skip("installed fpdf2 is outside FPDF2_TESTED")
+    parsed = _draw(pdf.ReportPDF())
+    first_parses = len(parses)
+    for metrics in pdf._metrics.values():
+        metrics["attrs"] = metrics["attrs"] + ["attribute_of_a_newer_fpdf2"]
+    assert _draw(pdf.ReportPDF()) == parsed
+    assert len(parses) == 2 * first_parses
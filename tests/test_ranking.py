@@ -0,0 +1,61 @@
+"""rok_export.ranking: payload order without weights, weighted order with them, top_records agreeing."""
+
+import pytest
+
+from rok_export.listings import ListingRecord
+from rok_export.ranking import parse_weights, rank_records, top_records
+
+
+def _records():
+    listings = [
+        {"rank": 1, "stock_number": "A", "composite_score": 70, "price_vs_fmv_pct": -2.0, "dealer_distance_miles": 40},
+        {"rank": 2, "stock_number": "B", "composite_score": 90, "price_vs_fmv_pct": 5.0, "dealer_distance_miles": 10},
+        {"rank": 3, "stock_number": "C", "composite_score": 80, "price_vs_fmv_pct": -8.0, "dealer_distance_miles": 25},
+        {"rank": 4, "stock_number": "D", "composite_score": 80, "price_vs_fmv_pct": None, "dealer_distance_miles": 5},
+    ]
+    return [ListingRecord(listing) for listing in listings]
+
+
+def _ids(records):
+    return [rec.rank for rec in records]
+
+
+def test_without_weights_the_payload_order_and_ranks_are_kept():
+    records = _records()
+    assert rank_records(records) == records
+    assert _ids(rank_records(records, {})) == [1, 2, 3, 4]
+    assert top_records(records, 2) == records[:2]
+
+
+def test_weighted_order_renumbers_ranks():
+    records = _records()
+    by_score = rank_records(records, {"score": 1})
+    # 90, then the two 80s: C wins the tie on price vs FMV, D's missing value sorts last
+    assert [rec.composite_score for rec in by_score] == [90, 80, 80, 70]
+    assert [rec.price_vs_fmv_pct for rec in by_score[1:3]] == [-8.0, None]
+    assert _ids(by_score) == [1, 2, 3, 4]
+
+
+def test_each_criterion_ranks_in_its_direction():
+    records = _records()
+    by_distance = rank_records(records, "distance=1")
+    assert [rec.dealer_distance_miles for rec in by_distance] == [5, 10, 25, 40]
+    by_fmv = rank_records(_records(), {"fmv": 1})
+    assert [rec.price_vs_fmv_pct for rec in by_fmv][:3] == [-8.0, -2.0, 5.0]
+
+
+def test_top_records_matches_the_full_ranking():
+    weights = {"score": 2, "distance": 1}
+    full = [(rec.composite_score, rec.dealer_distance_miles) for rec in rank_records(_records(), weights)]
+    records = _records()
+    top = top_records(records, 2, weights)
+    assert [(rec.composite_score, rec.dealer_distance_miles) for rec in top] == full[:2]
+    assert _ids(records) == [1, 2, 3, 4]  # top_records leaves ranks alone
+
+
+def test_parse_weights():
+    assert parse_weights("score=2, fmv=1,") == {"score": 2.0, "fmv": 1.0}
+    with pytest.raises(ValueError):
+        parse_weights("price=1")
+    with pytest.raises(ValueError):
+        rank_records(_records(), {"speed": 1})
@@ -0,0 +1,42 @@
+"""rok_export.text: Latin-1 transliteration for the core PDF fonts, and the slug helpers."""
+
+from rok_export.text import escape_html, latin_safe, latin_safe_drop, slugify, snake_slug
+
+
+def test_ascii_is_returned_as_is():
+    text = "Plain $1,234.56 (Mon-Fri)"
+    assert latin_safe(text) is text
+
+
+def test_punctuation_is_transliterated():
+    assert latin_safe("A — B – C") == "A -- B - C"
+    assert latin_safe("“quoted” ‘single’") == "\"quoted\" 'single'"
+    assert latin_safe("wait… → done ✓") == "wait... -> done [x]"
+    assert latin_safe("€5 ≤ €9") == "EUR5 <= EUR9"
+
+
+def test_latin1_is_kept_and_other_accents_are_folded():
+    assert latin_safe("Café Zoë") == "Café Zoë"
+    assert latin_safe("Erdős Łódź") == "Erdos ?ódz"  # no Latin-1 base letter for L-stroke
+    assert latin_safe("ﬁnal") == "final"
+
+
+def test_unmappable_characters():
+    assert latin_safe("ok \U0001f600") == "ok ?"
+    assert latin_safe_drop("ok \U0001f600") == "ok "
+    assert latin_safe(None) == latin_safe_drop(None) == ""
+    assert latin_safe(42) == "42"
+
+
+def test_output_is_latin1_encodable():
+    sample = "".join(chr(c) for c in range(0x2000, 0x2200)) + "中文"
+    latin_safe(sample).encode("latin-1")
+    latin_safe_drop(sample).encode("latin-1")
+
+
+def test_slugs_and_escaping():
+    assert slugify("My Project! v2") == "my-project-v2"
+    assert slugify("!!!") == "untitled"
+    assert snake_slug("Grand Design", "general") == "grand_design"
+    assert snake_slug("", "general") == "general"
+    assert escape_html('<a href="x">&</a>') == "&lt;a href=&quot;x&quot;&gt;&amp;&lt;/a&gt;"